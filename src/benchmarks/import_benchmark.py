@@ -0,0 +1,273 @@
+import json
+import os
+import platform
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+import typer
+
+from benchmarks.synthetic_geonames_generator import SyntheticGeonamesGenerator
+from geonames.application.services.import_metrics import peak_rss_mb
+
+# Dataset -> importer module/class, row-mapper module/class (plain and compact), repository and source file
+DATASETS: Dict[str, Dict[str, str]] = {
+    "countries": {
+        "importer": "geonames.infrastructure.file_importer.countries_file_importer:CountriesFileImporter",
+        "mapper": "geonames.infrastructure.file_importer.mappers.country_file_row_mapper:CountryFileRowMapper",
+        "repository_attr": "country_repo",
+        "file": "countryInfo.txt",
+    },
+    "geonames": {
+        "importer": "geonames.infrastructure.file_importer.geoname_file_importer:GeonameFileImporter",
+        "mapper": "geonames.infrastructure.file_importer.mappers.geoname_file_row_importer:GeonameFileRowMapper",
+        "compact_mapper": "geonames.infrastructure.file_importer.mappers.geoname_record_file_row_mapper:GeonameRecordFileRowMapper",
+        "repository_attr": "geoname_repo",
+        "file": "allCountries.txt",
+    },
+    "alternate_names": {
+        "importer": "geonames.infrastructure.file_importer.alternate_name_file_importer:AlternateNameFileImporter",
+        "mapper": "geonames.infrastructure.file_importer.mappers.alternate_name_file_row_mapper:AlternateNameFileRowMapper",
+        "compact_mapper": "geonames.infrastructure.file_importer.mappers.alternate_name_record_file_row_mapper:AlternateNameRecordFileRowMapper",
+        "repository_attr": "geoname_alternatename_repo",
+        "file": "alternateNamesV2.txt",
+    },
+}
+
+STAGES = ("count", "parse", "map", "insert")
+
+# Settings that change import throughput, recorded with every result
+TRACKED_ENV = ("IMPORT_WORKERS", "IMPORT_SHARD_SIZE_MB", "IMPORT_ORDERED", "IMPORT_BULK_LOADER", "POSTGRES_COPY_FORMAT",
+               "MYSQL_LOAD_DATA", "IMPORT_PIPELINE", "IMPORT_PIPELINE_QUEUE_SIZE", "IMPORT_COMPACT_ROWS",
+               "IMPORT_DEFER_INDEXES", "IMPORT_ADAPTIVE_BATCH_SIZE", "IMPORT_READ_CHUNK_SIZE_MB")
+
+
+class ImportBenchmark:
+    """
+    Generates synthetic GeoNames files and measures, per dataset, four stages:
+
+    - count: count_total_records() on the source file
+    - parse: reading and splitting raw rows (read_raw_data)
+    - map: load_entities() minus the parse time, i.e. row to entity mapping
+    - insert: ImportGeonamesUseCase into a freshly truncated table; rows/sec is
+      computed over the time spent in bulk_insert, the full run is reported too
+
+    Every stage runs in a fresh spawned process, so its peak RSS is its own.
+    """
+
+    def __init__(self, data_path: Path, db_url: str | None, seed: int = 42):
+        self.data_path = Path(data_path)
+        self.db_url = db_url
+        self.seed = seed
+
+    def generate(self, geonames: int, alternate_names: int, countries: int = 250) -> Dict[str, int]:
+
+        self.data_path.mkdir(parents=True, exist_ok=True)
+        generator = SyntheticGeonamesGenerator(self.seed)
+
+        generator.write_country_info(self.data_path / DATASETS["countries"]["file"], countries)
+        generator.write_all_countries(self.data_path / DATASETS["geonames"]["file"], geonames, countries)
+        generator.write_alternate_names(self.data_path / DATASETS["alternate_names"]["file"], alternate_names, geonames)
+
+        # Stale sidecars would short-circuit counting
+        for sidecar in self.data_path.glob("*.counts.json"):
+            sidecar.unlink()
+
+        return {"countries": countries, "geonames": geonames, "alternate_names": alternate_names}
+
+    def run(self, datasets: List[str], rows: Dict[str, int]) -> Dict[str, Any]:
+
+        results: Dict[str, Any] = {}
+
+        for dataset in datasets:
+            stages = {stage: self._run_stage(stage, dataset) for stage in STAGES if stage != "insert" or self.db_url}
+
+            if "map" in stages:
+                # load_entities() parses too: the map stage is what it adds on top of parsing
+                stages["map"]["seconds"] = max(stages["map"]["seconds"] - stages["parse"]["seconds"], 0.0)
+                stages["map"]["rows_per_second"] = _rate(stages["map"]["rows"], stages["map"]["seconds"])
+
+            results[dataset] = stages
+
+        return {
+            "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "seed": self.seed,
+            "rows": rows,
+            "database": self.db_url.split(":", 1)[0] if self.db_url else None,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "environment": {name: os.environ[name] for name in TRACKED_ENV if name in os.environ},
+            "results": results,
+        }
+
+    def _run_stage(self, stage: str, dataset: str) -> Dict[str, Any]:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            return pool.submit(_measure_stage, stage, dataset, str(self.data_path), self.db_url).result()
+
+
+def _measure_stage(stage: str, dataset: str, data_path: str, db_url: str | None) -> Dict[str, Any]:
+    """Entry point of a stage process."""
+
+    # Importers look for their source in TEMP_PATH
+    os.environ["TEMP_PATH"] = data_path
+    importer = _build_importer(dataset)
+
+    started = time.perf_counter()
+    extra: Dict[str, Any] = {}
+
+    if stage == "count":
+        rows = importer.count_total_records()
+    elif stage == "parse":
+        rows = sum(1 for _ in importer.read_raw_data())
+    elif stage == "map":
+        rows = sum(1 for _ in importer.load_entities())
+    else:
+        rows, extra = _insert(importer, dataset, db_url)
+
+    seconds = extra.pop("insert_seconds", None) or time.perf_counter() - started
+
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_second": _rate(rows, seconds),
+        **extra,
+        **peak_rss_mb(),
+    }
+
+
+def _insert(importer: Any, dataset: str, db_url: str) -> tuple:
+
+    from geonames.application.use_cases.import_geonames_use_case import ImportGeonamesUseCase
+    from geonames.infrastructure.persistence.database.init_schema import init_schema
+    from geonames.infrastructure.persistence.unit_of_work.orm_geonames_unit_of_work import OrmGeonamesUnitOfWorkFactory
+    from shared.infrastructure.persistence.database.database_connection_factory import DatabaseConnectionFactory
+
+    db_connector = DatabaseConnectionFactory(db_url, role="import")
+    init_schema(db_connector.engine)
+
+    with OrmGeonamesUnitOfWorkFactory(db_connector)() as uow:
+        repository = _TimedRepository(getattr(uow, DATASETS[dataset]["repository_attr"]))
+        # A table already holding the same number of rows would be skipped as up to date
+        repository.truncate()
+
+        started = time.perf_counter()
+        _, inserted = ImportGeonamesUseCase(repository, importer).execute()
+        rows = sum(inserted)
+        total_seconds = time.perf_counter() - started
+
+    db_connector.dispose()
+
+    return rows, {
+        "insert_seconds": repository.seconds,
+        "batches": repository.batches,
+        "end_to_end_seconds": round(total_seconds, 4),
+        "end_to_end_rows_per_second": _rate(rows, total_seconds),
+    }
+
+
+class _TimedRepository:
+    """Repository proxy accumulating the time spent in bulk_insert."""
+
+    def __init__(self, repository: Any):
+        self._repository = repository
+        self.seconds = 0.0
+        self.batches = 0
+
+    def bulk_insert(self, entities: list) -> None:
+        started = time.perf_counter()
+        self._repository.bulk_insert(entities)
+        self.seconds += time.perf_counter() - started
+        self.batches += 1
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+
+def _build_importer(dataset: str) -> Any:
+
+    from shared.infrastructure.adapters.local_file_downloader import LocalFileDownloader
+
+    spec = DATASETS[dataset]
+    compact_rows = os.getenv("IMPORT_COMPACT_ROWS", "false").lower() in ("1", "true", "yes")
+    mapper_cls = _load(spec["compact_mapper"] if compact_rows and "compact_mapper" in spec else spec["mapper"])
+
+    # The generated file is already in TEMP_PATH, so nothing is ever downloaded
+    importer = _load(spec["importer"])(file_downloader=LocalFileDownloader(), mapper=mapper_cls())
+    importer.cleanup = lambda: None
+
+    return importer
+
+
+def _load(path: str) -> Any:
+    module_name, class_name = path.split(":")
+    module = __import__(module_name, fromlist=[class_name])
+    return getattr(module, class_name)
+
+
+def _rate(rows: int, seconds: float) -> float:
+    return round(rows / seconds, 1) if seconds else 0.0
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """One line per dataset and stage with the rows/sec and peak RSS change against baseline."""
+
+    lines = []
+
+    for dataset, stages in current["results"].items():
+        for stage, result in stages.items():
+            before = baseline.get("results", {}).get(dataset, {}).get(stage)
+            if not before:
+                continue
+
+            speedup = result["rows_per_second"] / before["rows_per_second"] if before["rows_per_second"] else 0.0
+            rss = f"{before.get('peak_rss_mb', '?')} -> {result.get('peak_rss_mb', '?')} MB"
+            lines.append(f"{dataset:16} {stage:7} {before['rows_per_second']:>12.0f} -> {result['rows_per_second']:>12.0f} rows/s "
+                         f"({speedup:.2f}x)  peak RSS {rss}")
+
+    return lines
+
+
+app = typer.Typer()
+
+
+@app.command("run")
+def run_benchmark(
+    geonames: int = typer.Option(100_000, help="Rows of the synthetic allCountries file."),
+    alternate_names: int = typer.Option(200_000, help="Rows of the synthetic alternateNamesV2 file."),
+    countries: int = typer.Option(250, help="Rows of the synthetic countryInfo file."),
+    datasets: str = typer.Option(",".join(DATASETS), help="Comma-separated datasets to measure."),
+    seed: int = typer.Option(42, help="Generator seed; equal seeds and row counts give identical files."),
+    data_path: str = typer.Option("./tmp/benchmark", help="Where the synthetic files are written."),
+    database_url: str = typer.Option(None, help="Database for the insert stage (default: BENCHMARK_DATABASE_URL). Without one, insert is skipped."),
+    output: str = typer.Option("benchmark_results.json", help="JSON results file."),
+):
+    """Generate synthetic GeoNames files and benchmark each import stage."""
+
+    benchmark = ImportBenchmark(Path(data_path), database_url or os.getenv("BENCHMARK_DATABASE_URL"), seed)
+    rows = benchmark.generate(geonames, alternate_names, countries)
+    report = benchmark.run([dataset.strip() for dataset in datasets.split(",") if dataset.strip()], rows)
+
+    Path(output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for dataset, stages in report["results"].items():
+        for stage, result in stages.items():
+            typer.echo(f"{dataset:16} {stage:7} {result['rows']:>10} rows {result['seconds']:>9.3f}s "
+                       f"{result['rows_per_second']:>12.0f} rows/s  peak RSS {result.get('peak_rss_mb', '?')} MB")
+
+    typer.echo(f"Results written to {output}")
+
+
+@app.command("compare")
+def compare_benchmarks(baseline: str, current: str):
+    """Compare two JSON results files stage by stage."""
+
+    for line in compare_results(json.loads(Path(baseline).read_text()), json.loads(Path(current).read_text())):
+        typer.echo(line)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,139 @@
+import random
+import string
+
+from pathlib import Path
+from typing import List
+
+
+class SyntheticGeonamesGenerator:
+    """
+    Writes deterministic allCountries-, countryInfo- and alternateNamesV2-shaped
+    files: the same seed and row counts always produce byte-identical files.
+
+    Value distributions loosely follow the real dumps (mostly unpopulated
+    features, a long tail of alternate names, a few hundred countries) so that
+    parsing and insert costs are representative.
+    """
+
+    FEATURES = {
+        "P": ["PPL", "PPLA", "PPLA2", "PPLC", "PPLX"],
+        "A": ["ADM1", "ADM2", "ADM3", "ADM4", "PCLI"],
+        "H": ["STM", "LK", "SPNG", "RSV"],
+        "T": ["MT", "HLL", "PK", "PASS"],
+        "L": ["AREA", "PRK", "LCTY"],
+        "S": ["HTL", "SCH", "CH", "FRM"],
+        "V": ["FRST", "GRSLD"],
+        "R": ["RD", "TRL"],
+        "U": ["SMU", "DEPU"],
+    }
+    FEATURE_WEIGHTS = {"P": 30, "A": 5, "H": 20, "T": 18, "L": 6, "S": 15, "V": 2, "R": 2, "U": 2}
+
+    LANGUAGES = ["en", "de", "fr", "es", "ru", "zh", "ar", "ja", "pt", "it", "link", "wkdt", "post", "iata", "icao", ""]
+    TIMEZONES = ["Europe/Madrid", "Europe/Berlin", "America/New_York", "Asia/Tokyo", "Africa/Lagos", "Australia/Sydney", "America/Sao_Paulo"]
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+
+    def write_all_countries(self, path: Path, rows: int, countries: int = 250) -> None:
+
+        rng = random.Random(f"{self.seed}:allCountries")
+        codes = self.country_codes(countries)
+        classes = list(self.FEATURE_WEIGHTS)
+        weights = list(self.FEATURE_WEIGHTS.values())
+
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            for geoname_id in range(1, rows + 1):
+                name = self._name(rng)
+                feature_class = rng.choices(classes, weights)[0]
+                alternatenames = ",".join(self._name(rng) for _ in range(min(int(rng.expovariate(0.4)), 40)))
+                populated = feature_class == "P" or rng.random() < 0.02
+                country_code = rng.choice(codes)
+
+                f.write("\t".join([
+                    str(geoname_id),
+                    name,
+                    name.lower(),
+                    alternatenames,
+                    f"{rng.uniform(-90, 90):.5f}",
+                    f"{rng.uniform(-180, 180):.5f}",
+                    feature_class,
+                    rng.choice(self.FEATURES[feature_class]),
+                    country_code,
+                    "",
+                    f"{rng.randint(1, 60):02d}",
+                    str(rng.randint(1, 999)) if rng.random() < 0.6 else "",
+                    "",
+                    "",
+                    str(int(rng.paretovariate(1.2) * 100)) if populated else "0",
+                    str(rng.randint(0, 3000)) if rng.random() < 0.1 else "",
+                    str(rng.randint(-10, 4000)),
+                    rng.choice(self.TIMEZONES),
+                    f"20{rng.randint(10, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                ]) + "\n")
+
+    def write_country_info(self, path: Path, rows: int = 250) -> None:
+
+        rng = random.Random(f"{self.seed}:countryInfo")
+        codes = self.country_codes(rows)
+
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("# GeoNames countryInfo (synthetic)\n")
+            f.write("#ISO\tISO3\tISO-Numeric\tfips\tCountry\tCapital\tArea(in sq km)\tPopulation\tContinent\ttld\t"
+                    "CurrencyCode\tCurrencyName\tPhone\tPostal Code Format\tPostal Code Regex\tLanguages\t"
+                    "geonameid\tneighbours\tEquivalentFipsCode\n")
+
+            for index, code in enumerate(codes):
+                f.write("\t".join([
+                    code,
+                    code + rng.choice(string.ascii_uppercase),
+                    str(index + 1),
+                    code,
+                    self._name(rng),
+                    self._name(rng),
+                    f"{rng.uniform(1, 17_000_000):.1f}",
+                    str(rng.randint(1_000, 1_400_000_000)),
+                    rng.choice(["EU", "AS", "AF", "NA", "SA", "OC", "AN"]),
+                    "." + code.lower(),
+                    "".join(rng.choices(string.ascii_uppercase, k=3)),
+                    self._name(rng),
+                    str(rng.randint(1, 999)),
+                    "#####",
+                    "^(\\d{5})$",
+                    ",".join(rng.sample(self.LANGUAGES[:10], 2)),
+                    str(10_000_000 + index),
+                    ",".join(rng.sample(codes, min(3, len(codes)))),
+                    "",
+                ]) + "\n")
+
+    def write_alternate_names(self, path: Path, rows: int, geonames: int) -> None:
+
+        rng = random.Random(f"{self.seed}:alternateNamesV2")
+
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            for alternate_name_id in range(1, rows + 1):
+                language = rng.choice(self.LANGUAGES)
+                name = f"https://en.wikipedia.org/wiki/{self._name(rng)}" if language == "link" else self._name(rng)
+
+                f.write("\t".join([
+                    str(alternate_name_id),
+                    str(rng.randint(1, max(1, geonames))),
+                    language,
+                    name,
+                    "1" if rng.random() < 0.05 else "",
+                    "1" if rng.random() < 0.03 else "",
+                    "1" if rng.random() < 0.01 else "",
+                    "1" if rng.random() < 0.01 else "",
+                    "",
+                    "",
+                ]) + "\n")
+
+    def country_codes(self, count: int) -> List[str]:
+        """The first count two-letter codes of a seeded shuffle of AA..ZZ."""
+
+        codes = [a + b for a in string.ascii_uppercase for b in string.ascii_uppercase]
+        random.Random(f"{self.seed}:countries").shuffle(codes)
+        return codes[:min(count, len(codes))]
+
+    @staticmethod
+    def _name(rng: random.Random) -> str:
+        return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 18))).capitalize()
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from geonames.application.dtos.geoname_dto import GeonameDTO
+
+
+class GeonamePageDTO(BaseModel):
+    """One page of a geoname listing (used in API responses)."""
+
+    items: List[GeonameDTO] = Field(..., description="Geonames of this page, by population (descending) then geoname id (descending)")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor of the next page; null on the last page")
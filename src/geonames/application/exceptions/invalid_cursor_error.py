@@ -0,0 +1,3 @@
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor was not issued by KeysetPagination."""
+    pass
\ No newline at end of file
@@ -0,0 +1,6 @@
+from typing import Protocol
+
+
+class AsyncQueryRepositoryPort(Protocol):
+    async def find_all(self, filters: dict):
+        ...
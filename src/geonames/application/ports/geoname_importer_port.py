@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Generator, TypeVar, Generic
+from typing import Any, Dict, Generator, Iterator, List, NamedTuple, TypeVar, Generic
+
+from geonames.application.services.import_metrics import ImportMetrics
 
 T = TypeVar("T")
 
+
+class ImportBatch(NamedTuple):
+    """A slice of the source: raw rows, or entities once mapped, and the position just after it."""
+
+    items: List[Any]
+    position: Dict[str, Any] | None
+    mapped: bool = False
+
+
 class GeonameImporterPort(ABC, Generic[T]):
 
     @abstractmethod
@@ -13,6 +24,14 @@ class GeonameImporterPort(ABC, Generic[T]):
     def load_entities(self) -> Generator[T, None, None]:
         pass
 
+    @abstractmethod
+    def read_batches(self, batch_size: int) -> Iterator[ImportBatch]:
+        pass
+
+    @abstractmethod
+    def map_batch(self, batch: ImportBatch) -> ImportBatch:
+        pass
+
     @abstractmethod
     def count_total_records(self) -> int:
         pass
@@ -20,3 +39,24 @@ class GeonameImporterPort(ABC, Generic[T]):
     @abstractmethod
     def cleanup(self) -> None:
         pass
+
+    @abstractmethod
+    def resume_from(self, position: Dict[str, Any] | None) -> bool:
+        pass
+
+    @abstractmethod
+    def current_position(self) -> Dict[str, Any] | None:
+        pass
+
+    @abstractmethod
+    def is_up_to_date(self) -> bool:
+        pass
+
+    @abstractmethod
+    def mark_imported(self) -> None:
+        pass
+
+    @abstractmethod
+    def set_metrics(self, metrics: ImportMetrics) -> None:
+        """Report download, extraction and rejected-row measurements to metrics."""
+        pass
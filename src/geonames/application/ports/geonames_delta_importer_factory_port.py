@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from geonames.application.ports.geoname_importer_port import GeonameImporterPort
+from geonames.domain.entities.alternate_name import AlternateName
+from geonames.domain.entities.geoname import Geoname
+
+
+class GeonamesDeltaImporterFactoryPort(ABC):
+    """Builds importers for the daily GeoNames delta files of a given day."""
+
+    @abstractmethod
+    def modifications(self, day: date) -> GeonameImporterPort[Geoname]:
+        pass
+
+    @abstractmethod
+    def deletes(self, day: date) -> GeonameImporterPort[int]:
+        pass
+
+    @abstractmethod
+    def alternate_name_modifications(self, day: date) -> GeonameImporterPort[AlternateName]:
+        pass
+
+    @abstractmethod
+    def alternate_name_deletes(self, day: date) -> GeonameImporterPort[int]:
+        pass
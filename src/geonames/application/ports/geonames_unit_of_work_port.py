@@ -3,6 +3,7 @@ from abc import abstractmethod
 from geonames.domain.repositories.alternate_name_repository import AlternateNameRepository
 from geonames.domain.repositories.country_repository import CountryRepository
 from geonames.domain.repositories.geoname_repository import GeonameRepository
+from geonames.domain.repositories.import_generation_repository import ImportGenerationRepository
 from shared.application.ports.unit_of_work_port import UnitOfWorkFactoryPort, UnitOfWorkPort
 
 
@@ -13,6 +14,7 @@ class GeonamesUnitOfWorkPort(UnitOfWorkPort):
     alternate_name_repo: "AlternateNameRepository"
     admin_division_repo: "GeonameRepository"
     city_repo: "GeonameRepository"
+    import_generation_repo: "ImportGenerationRepository"
 
 class GeonamesUnitOfWorkFactoryPort(UnitOfWorkFactoryPort):
 
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+
+class SnapshotExporterPort(ABC):
+
+    @abstractmethod
+    def export(self, table_name: str) -> int:
+        """Write a snapshot of table_name and return the number of rows it holds."""
+        pass
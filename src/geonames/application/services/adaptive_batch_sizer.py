@@ -0,0 +1,112 @@
+import sys
+
+from typing import Any, Sequence
+
+from shared.application.ports.logger_port import LoggerPort
+
+
+class AdaptiveBatchSizer:
+    """
+    Tunes the bulk-insert batch size of one table from the writes it observes.
+
+    The size grows while rows per second keep improving and a batch commits within
+    target_seconds, falls back towards the best size seen once throughput drops,
+    and is halved whenever a batch is too slow or its estimated memory footprint
+    exceeds max_bytes. It always stays within [min_size, max_size]; with
+    min_size == max_size it is a fixed batch size.
+    """
+
+    GROWTH = 1.5
+    SAMPLE_SIZE = 20
+
+    def __init__(self,
+                 initial_size: int = 5000,
+                 min_size: int | None = None,
+                 max_size: int | None = None,
+                 target_seconds: float = 2.0,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 name: str = "",
+                 logger: LoggerPort | None = None):
+
+        self.min_size = min_size or initial_size
+        self.max_size = max(max_size or initial_size, self.min_size)
+        self.size = self._clamp(initial_size)
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+        self.name = name
+        self.logger = logger
+
+        self.best_rate = 0.0
+        self.best_size = self.size
+        # Sizes that already proved slower are not probed again
+        self.ceiling = self.max_size
+
+    @property
+    def adaptive(self) -> bool:
+        return self.min_size < self.max_size
+
+    def record(self, rows: int, seconds: float, batch_bytes: int = 0) -> int:
+        """Account one committed batch and return the size to use for the next one."""
+
+        # Partial batches (the tail of a file) say little about the configured size
+        if not self.adaptive or rows < self.size or seconds <= 0:
+            return self.size
+
+        rate = rows / seconds
+        previous = self.size
+
+        if seconds > self.target_seconds or (batch_bytes and batch_bytes > self.max_bytes):
+            size = self.size // 2
+            if batch_bytes > self.max_bytes:
+                size = min(size, self.size * self.max_bytes // batch_bytes)
+            self.ceiling = max(self.min_size, size)
+            self.best_rate = 0.0
+        elif rate >= self.best_rate:
+            self.best_rate = rate
+            self.best_size = self.size
+            size = min(int(self.size * self.GROWTH), self.ceiling)
+        elif rate < self.best_rate * 0.8:
+            # Larger batches stopped paying off on this host: go back to the best one
+            self.ceiling = self.best_size
+            size = self.best_size
+        else:
+            size = self.size
+
+        self.size = self._clamp(size)
+
+        if self.size != previous and self.logger:
+            self.logger.info(
+                f"Batch size{' of ' + self.name if self.name else ''}: {previous} -> {self.size} "
+                f"({rate:.0f} rows/s, {seconds:.2f}s per batch, ~{batch_bytes / 1024 / 1024:.1f} MB)"
+            )
+
+        return self.size
+
+    def estimate_bytes(self, batch: Sequence[Any]) -> int:
+        """Approximate memory held by a batch, extrapolated from a sample of its rows."""
+
+        if not self.adaptive or not batch:
+            return 0
+
+        step = max(1, len(batch) // self.SAMPLE_SIZE)
+        sample = batch[::step]
+
+        return sum(map(self._row_bytes, sample)) * len(batch) // len(sample)
+
+    @staticmethod
+    def _row_bytes(row: Any) -> int:
+
+        # Tuples first: NamedTuple records (GeonameRecord, ...) declare empty __slots__
+        if isinstance(row, (tuple, list)):
+            values = row
+        elif hasattr(row, "__dict__"):
+            values = vars(row).values()
+        elif hasattr(row, "__slots__"):
+            values = [getattr(row, slot, None) for slot in row.__slots__]
+        else:
+            values = ()
+
+        return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in values)
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, size))
@@ -1,16 +1,20 @@
-from typing import List
-
-from geonames.application.dtos.geoname_dto import GeonameDTO
-from geonames.application.mappers.geoname_output_mapper import GeonameOutputMapper
-from geonames.application.ports.query_repository_port import QueryRepositoryPort
+from geonames.application.dtos.geoname_page_dto import GeonamePageDTO
+from geonames.application.services.keyset_pagination import KeysetPagination
+from geonames.application.ports.async_query_repository_port import AsyncQueryRepositoryPort
+from geonames.application.services.query_result_cache import QueryResultCache
 
 
 class CityQueryService:
 
-    def __init__(self, city_query_repo: QueryRepositoryPort):
+    def __init__(self, city_query_repo: AsyncQueryRepositoryPort, cache: QueryResultCache | None = None):
         self.city_query_repo = city_query_repo
+        self.cache = cache
         
-    def list_cities(self, filters: dict) -> List[GeonameDTO]:
-        models = self.city_query_repo.find_all(filters)
-        dtos = GeonameOutputMapper.from_models(models)
-        return dtos
\ No newline at end of file
+    async def list_cities(self, filters: dict) -> GeonamePageDTO:
+        if self.cache:
+            return await self.cache.get_or_load("cities", filters, self._list_cities)
+        return await self._list_cities(filters)
+
+    async def _list_cities(self, filters: dict) -> GeonamePageDTO:
+        models = await self.city_query_repo.find_all(KeysetPagination.page_filters(filters))
+        return KeysetPagination.to_page(models, filters.get("limit"))
\ No newline at end of file
@@ -2,15 +2,22 @@ from typing import List
 
 from geonames.application.dtos.country_dto import CountryDTO
 from geonames.application.mappers.country_output_mapper import CountryOutputMapper
-from geonames.application.ports.query_repository_port import QueryRepositoryPort
+from geonames.application.ports.async_query_repository_port import AsyncQueryRepositoryPort
+from geonames.application.services.query_result_cache import QueryResultCache
 
 
 class CountryQueryService:
 
-    def __init__(self, country_query_repo: QueryRepositoryPort):
+    def __init__(self, country_query_repo: AsyncQueryRepositoryPort, cache: QueryResultCache | None = None):
         self.country_query_repo = country_query_repo
+        self.cache = cache
         
-    def list_countries(self, filters: dict) -> List[CountryDTO]:
-        models = self.country_query_repo.find_all(filters)
+    async def list_countries(self, filters: dict) -> List[CountryDTO]:
+        if self.cache:
+            return await self.cache.get_or_load("countries", filters, self._list_countries)
+        return await self._list_countries(filters)
+
+    async def _list_countries(self, filters: dict) -> List[CountryDTO]:
+        models = await self.country_query_repo.find_all(filters)
         dtos = CountryOutputMapper.from_models(models)
         return dtos
\ No newline at end of file
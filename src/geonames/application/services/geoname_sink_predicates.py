@@ -0,0 +1,22 @@
+from typing import Any, Callable
+
+
+class GeonameSinkPredicates:
+
+    ADMIN_DIVISION_FEATURE_CODES = frozenset({"ADM1", "ADM2", "ADM3", "ADM4"})
+    ADMIN_SEAT_FEATURE_CODES = frozenset({"PPLC", "PPLA", "PPLA2", "PPLA3", "PPLA4"})
+
+    @staticmethod
+    def is_admin_division(geoname: Any) -> bool:
+        return geoname.feature_code in GeonameSinkPredicates.ADMIN_DIVISION_FEATURE_CODES
+
+    @staticmethod
+    def is_populated_place(min_population: int, admin_seats: bool = False) -> Callable[[Any], bool]:
+        """Populated places (feature class P) with at least min_population inhabitants, or any population for admin seats."""
+
+        def predicate(geoname: Any) -> bool:
+            if geoname.feature_class != "P":
+                return False
+            return (geoname.population or 0) >= min_population or (admin_seats and geoname.feature_code in GeonameSinkPredicates.ADMIN_SEAT_FEATURE_CODES)
+
+        return predicate
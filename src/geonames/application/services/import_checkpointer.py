@@ -0,0 +1,41 @@
+from typing import Any, Dict
+
+from shared.application.ports.state_store_port import StateStorePort
+
+
+class ImportCheckpointer:
+    """
+    Records, after every committed batch, the source position reached and the
+    number of rows committed to each table, so an interrupted import can resume.
+    """
+
+    KEY_PREFIX = "import_checkpoint."
+
+    def __init__(self, state_store: StateStorePort, name: str):
+        self.state_store = state_store
+        self.key = self.KEY_PREFIX + name
+
+    def save(self, position: Dict[str, Any], rows: Dict[str, int], batch: int, processed: int = 0,
+             sinks: Dict[str, Dict[str, Any]] | None = None) -> None:
+        """sinks: per table of a fan-out import, the source rows ("processed") and "position" its last batch reached."""
+
+        checkpoint = {"position": position, "rows": rows, "batch": batch, "processed": processed}
+        if sinks is not None:
+            checkpoint["sinks"] = sinks
+
+        self.state_store.set(self.key, checkpoint)
+
+    def load(self) -> Dict[str, Any] | None:
+        return self.state_store.get(self.key)
+
+    def resumable(self, rows: Dict[str, int]) -> Dict[str, Any] | None:
+        """The checkpoint, if the tables still hold exactly the rows it recorded."""
+
+        checkpoint = self.load()
+        if not checkpoint or checkpoint.get("rows") != rows:
+            return None
+
+        return checkpoint
+
+    def clear(self) -> None:
+        self.state_store.delete(self.key)
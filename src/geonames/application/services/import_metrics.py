@@ -0,0 +1,198 @@
+import math
+import sys
+import threading
+import time
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+try:
+    import resource
+except ImportError:  # Windows: memory is not reported
+    resource = None
+
+
+def peak_rss_mb() -> Dict[str, float]:
+    """High-water RSS of this process and of its terminated worker processes, in MB."""
+
+    if resource is None:
+        return {}
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    unit = 1 if sys.platform == "darwin" else 1024
+    peak = {"peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / 1024 / 1024, 1)}
+
+    workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    if workers:
+        peak["workers_peak_rss_mb"] = round(workers * unit / 1024 / 1024, 1)
+
+    return peak
+
+
+class ImportMetrics:
+    """
+    Measurements of one import task: time and rows per stage (download, extract,
+    count, parse/map, insert), the latency of every insert batch per table, rows
+    rejected by the mappers and the memory high-water mark.
+
+    Import tasks run concurrently in one process, so peak_rss_mb is the process
+    peak when the task finished; peak_rss_growth_mb is how much it rose meanwhile.
+    """
+
+    MAX_ERROR_SAMPLES = 10
+
+    def __init__(self, name: str):
+        self.name = name
+        self.status = "pending"
+
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._latencies: Dict[str, List[float]] = {}
+        self._batch_rows: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+        self._errors: List[str] = []
+
+        self._started_at: datetime | None = None
+        self._started: float | None = None
+        self._seconds = 0.0
+        self._start_memory: Dict[str, float] = {}
+        self._end_memory: Dict[str, float] = {}
+
+    def start(self) -> None:
+        self.status = "running"
+        self._started_at = datetime.utcnow()
+        self._started = time.perf_counter()
+        self._start_memory = peak_rss_mb()
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        if self._started is not None:
+            self._seconds = time.perf_counter() - self._started
+        self._end_memory = peak_rss_mb()
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage: str, seconds: float, rows: int = 0) -> None:
+        with self._lock:
+            totals = self._stages.setdefault(stage, {"seconds": 0.0, "rows": 0})
+            totals["seconds"] += seconds
+            totals["rows"] += rows
+
+    def record_batch(self, rows: int, seconds: float, table: str | None = None) -> None:
+        """Account one committed insert batch of table (the task's own table by default)."""
+
+        table = table or self.name
+
+        with self._lock:
+            self._latencies.setdefault(table, []).append(seconds)
+            self._batch_rows[table] = self._batch_rows.get(table, 0) + rows
+
+        self.add("insert", seconds, rows)
+
+    def reject(self, reason: str, count: int = 1, errors: List[str] | None = None) -> None:
+        """Count rows dropped by the mapper; errors are kept as samples for the report."""
+
+        with self._lock:
+            self._rejected[reason] = self._rejected.get(reason, 0) + count
+            for error in errors or []:
+                if len(self._errors) >= self.MAX_ERROR_SAMPLES:
+                    break
+                self._errors.append(error)
+
+    @property
+    def rejected(self) -> int:
+        return sum(self._rejected.values())
+
+    def rows(self, stage: str) -> int:
+        with self._lock:
+            return int(self._stages.get(stage, {}).get("rows", 0))
+
+    def to_dict(self) -> Dict[str, Any]:
+
+        with self._lock:
+            stages = {
+                stage: {
+                    "seconds": round(totals["seconds"], 4),
+                    "rows": int(totals["rows"]),
+                    "rows_per_second": round(totals["rows"] / totals["seconds"], 1) if totals["seconds"] and totals["rows"] else None,
+                }
+                for stage, totals in self._stages.items()
+            }
+            batches = {table: self._latency_summary(latencies, self._batch_rows[table]) for table, latencies in self._latencies.items()}
+            rejected = dict(self._rejected)
+            errors = list(self._errors)
+
+        report: Dict[str, Any] = {
+            "status": self.status,
+            "started_at": self._started_at.isoformat(timespec="seconds") + "Z" if self._started_at else None,
+            "seconds": round(self._seconds, 3),
+            "stages": stages,
+            "insert_batches": batches,
+            "rejected_rows": rejected,
+            "error_samples": errors,
+            **self._end_memory,
+        }
+
+        if "peak_rss_mb" in self._end_memory and "peak_rss_mb" in self._start_memory:
+            report["peak_rss_growth_mb"] = round(self._end_memory["peak_rss_mb"] - self._start_memory["peak_rss_mb"], 1)
+
+        return report
+
+    @staticmethod
+    def _latency_summary(latencies: List[float], rows: int) -> Dict[str, Any]:
+
+        ordered = sorted(latencies)
+
+        def percentile(p: float) -> float:
+            # Nearest-rank percentile
+            index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+            return round(ordered[index] * 1000, 2)
+
+        return {
+            "batches": len(ordered),
+            "rows": rows,
+            "p50_ms": percentile(50),
+            "p90_ms": percentile(90),
+            "p99_ms": percentile(99),
+            "max_ms": round(ordered[-1] * 1000, 2),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        }
+
+
+class ImportRunReport:
+    """Metrics of every task of one import run, serialisable as a JSON report."""
+
+    def __init__(self, command: str):
+        self.command = command
+        self.started_at = datetime.utcnow()
+        self._started = time.perf_counter()
+        self._tasks: Dict[str, ImportMetrics] = {}
+        self._lock = threading.Lock()
+
+    def task(self, name: str) -> ImportMetrics:
+        with self._lock:
+            return self._tasks.setdefault(name, ImportMetrics(name))
+
+    @property
+    def rows_inserted(self) -> int:
+        return sum(metrics.rows("insert") for metrics in self._tasks.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+
+        tasks = {name: metrics.to_dict() for name, metrics in self._tasks.items()}
+
+        return {
+            "command": self.command,
+            "started_at": self.started_at.isoformat(timespec="seconds") + "Z",
+            "seconds": round(time.perf_counter() - self._started, 3),
+            "succeeded": all(task["status"] == "succeeded" for task in tasks.values()),
+            "tasks": tasks,
+            **peak_rss_mb(),
+        }
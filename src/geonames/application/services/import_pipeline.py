@@ -0,0 +1,174 @@
+import queue
+import threading
+import time
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from shared.application.ports.logger_port import LoggerPort
+
+
+@dataclass
+class StageStats:
+    name: str
+    batches: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_DONE = object()
+
+
+class ImportPipeline:
+    """
+    Runs a batch source and a chain of transform stages on their own threads,
+    connected by bounded queues; whoever iterates run() is the final stage. A full
+    queue blocks the stage feeding it, so at most queue_size batches wait between
+    two stages and a slow writer throttles parsing instead of buffering the file.
+
+    Each stage's busy time and row count are recorded for throughput reporting.
+    """
+
+    def __init__(self,
+                 source: Tuple[str, Iterable[Any]],
+                 stages: List[Tuple[str, Callable[[Any], Any]]],
+                 queue_size: int = 4,
+                 size_of: Callable[[Any], int] = len):
+
+        self.source = source
+        self.stages = stages
+        self.queue_size = queue_size
+        self.size_of = size_of
+
+        self.stats: Dict[str, StageStats] = {name: StageStats(name) for name, _ in [source, *stages]}
+        self._stop = threading.Event()
+
+    def run(self) -> Iterator[Any]:
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._run_source, args=(queues[0],), daemon=True)]
+
+        for index, (name, fn) in enumerate(self.stages):
+            threads.append(threading.Thread(target=self._run_stage, args=(name, fn, queues[index], queues[index + 1]), daemon=True))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            # Also reached when the consumer fails or stops early: unblock and retire the stages
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+    @contextmanager
+    def measure(self, name: str, rows: int) -> Iterator[None]:
+        """Account work done outside the pipeline threads, typically the consumer's writes."""
+
+        stats = self.stats.setdefault(name, StageStats(name))
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.seconds += time.perf_counter() - started
+            stats.batches += 1
+            stats.rows += rows
+
+    def log_throughput(self, logger: LoggerPort) -> None:
+        for stats in self.stats.values():
+            logger.info(
+                f"Stage {stats.name}: {stats.rows} rows in {stats.batches} batches, "
+                f"{stats.seconds:.1f}s busy ({stats.rows_per_second:.0f} rows/s)"
+            )
+
+    def _run_source(self, out_queue: queue.Queue) -> None:
+
+        name, iterable = self.source
+        stats = self.stats[name]
+        iterator = iter(iterable)
+
+        try:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                item = next(iterator, _DONE)
+                stats.seconds += time.perf_counter() - started
+
+                if item is _DONE:
+                    break
+
+                stats.batches += 1
+                stats.rows += self.size_of(item)
+                if not self._put(out_queue, item):
+                    break
+        except BaseException as e:
+            self._put(out_queue, _Failure(e))
+            return
+        finally:
+            # Close the source on this thread, so files and worker pools it holds are released here
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+
+        self._put(out_queue, _DONE)
+
+    def _run_stage(self, name: str, fn: Callable[[Any], Any], in_queue: queue.Queue, out_queue: queue.Queue) -> None:
+
+        stats = self.stats[name]
+
+        while True:
+            item = self._get(in_queue)
+            if item is _DONE or isinstance(item, _Failure):
+                self._put(out_queue, item)
+                return
+
+            started = time.perf_counter()
+            try:
+                result = fn(item)
+            except BaseException as e:
+                self._put(out_queue, _Failure(e))
+                return
+            stats.seconds += time.perf_counter() - started
+
+            stats.batches += 1
+            stats.rows += self.size_of(result)
+            if not self._put(out_queue, result):
+                return
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        """Blocking put that gives up once the pipeline is stopped."""
+
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _get(self, q: queue.Queue) -> Any:
+
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+        return _DONE
@@ -0,0 +1,89 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Set
+
+from shared.application.ports.logger_port import LoggerPort
+
+
+class ImportTaskScheduler:
+    """
+    Runs import tasks as a dependency graph: a task starts as soon as every task
+    named in its "depends_on" list has succeeded, with at most max_concurrency
+    tasks running at once. Tasks depending on a failed task are skipped.
+
+    run_task receives the task and returns False (or raises) when it failed.
+    """
+
+    def __init__(self, max_concurrency: int = 1, logger: LoggerPort | None = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.logger = logger
+
+    def run(self, tasks: List[Dict[str, Any]], run_task: Callable[[Dict[str, Any]], bool | None]) -> Dict[str, bool]:
+        """Run every task; returns whether each one succeeded (skipped tasks count as failed)."""
+
+        by_name = {task["name"]: task for task in tasks}
+        self._validate(by_name)
+
+        pending = list(tasks)
+        results: Dict[str, bool] = {}
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="import") as pool:
+            while pending or running:
+                for task in list(pending):
+                    dependencies = task.get("depends_on", [])
+
+                    failed = [name for name in dependencies if results.get(name) is False]
+                    if failed:
+                        pending.remove(task)
+                        results[task["name"]] = False
+                        if self.logger:
+                            self.logger.error(f"Skipping {task['name']}: {', '.join(failed)} failed")
+                        continue
+
+                    if len(running) < self.max_concurrency and all(results.get(name) for name in dependencies):
+                        pending.remove(task)
+                        running[pool.submit(self._run, run_task, task)] = task["name"]
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        return results
+
+    def _run(self, run_task: Callable[[Dict[str, Any]], bool | None], task: Dict[str, Any]) -> bool:
+        try:
+            return run_task(task) is not False
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Task {task['name']} failed: {e}")
+            return False
+
+    @staticmethod
+    def _validate(by_name: Dict[str, Dict[str, Any]]) -> None:
+
+        for name, task in by_name.items():
+            unknown = [dependency for dependency in task.get("depends_on", []) if dependency not in by_name]
+            if unknown:
+                raise ValueError(f"Task {name} depends on unknown tasks: {', '.join(unknown)}")
+
+        # Depth-first search for cycles, which would leave tasks pending forever
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Import tasks have a dependency cycle through {name}")
+
+            visiting.add(name)
+            for dependency in by_name[name].get("depends_on", []):
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in by_name:
+            visit(name)
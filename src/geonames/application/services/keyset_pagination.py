@@ -0,0 +1,67 @@
+import base64
+import json
+
+from typing import Dict, List, Tuple
+
+from geonames.application.dtos.geoname_page_dto import GeonamePageDTO
+from geonames.application.exceptions.invalid_cursor_error import InvalidCursorError
+from geonames.application.mappers.geoname_output_mapper import GeonameOutputMapper
+
+
+class KeysetPagination:
+    """
+    Cursor pagination over geoname listings ordered by (population DESC, geoname_id DESC).
+
+    A cursor is the url-safe base64 of the sort key of the last row of a page;
+    repositories receive it decoded as filters["after"] and only return rows
+    sorting after it, so every page is an index range scan however deep it is.
+    """
+
+    @staticmethod
+    def encode(population: int, geoname_id: int) -> str:
+        raw = json.dumps([population, geoname_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> Tuple[int, int]:
+        """The sort key of cursor; InvalidCursorError when it is not a cursor issued by encode()."""
+
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            population, geoname_id = json.loads(raw)
+        except (ValueError, TypeError) as exc:
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+        if not isinstance(population, int) or not isinstance(geoname_id, int):
+            raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+
+        return population, geoname_id
+
+    @staticmethod
+    def page_filters(filters: Dict) -> Dict:
+        """Repository filters for one page: the cursor position, and one row more than the page to tell if another follows."""
+
+        page_filters = dict(filters)
+        cursor = page_filters.pop("cursor", None)
+
+        if cursor:
+            page_filters["after"] = KeysetPagination.decode(cursor)
+            # The cursor already positions the page
+            page_filters.pop("offset", None)
+
+        if page_filters.get("limit"):
+            page_filters["limit"] += 1
+
+        return page_filters
+
+    @staticmethod
+    def to_page(models: List, limit: int | None) -> GeonamePageDTO:
+
+        next_cursor = None
+
+        if limit and len(models) > limit:
+            models = models[:limit]
+            last = models[-1]
+            next_cursor = KeysetPagination.encode(last.population, last.geoname_id)
+
+        return GeonamePageDTO(items=GeonameOutputMapper.from_models(models), next_cursor=next_cursor)
@@ -0,0 +1,168 @@
+import json
+import time
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from pydantic_core import to_json
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float
+
+
+class QueryResultCache:
+    """
+    In-process LRU cache of query service results, keyed on the service and its
+    normalised filters (expand, limit, offset and cursor included).
+
+    Entries expire after ttl_seconds and the least recently used ones are evicted
+    beyond max_entries or max_bytes. Entries are sized by their JSON encoding, so
+    max_bytes bounds the approximate payload the cache holds, not its memory:
+    the DTO objects themselves take several times more. The data
+    only changes on imports, so the whole cache is dropped when generation_source
+    reports a new import generation; it is polled at most every
+    generation_check_seconds, which bounds how long a finished import goes unseen.
+
+    Cached DTOs are shared between requests and must not be modified.
+    """
+
+    def __init__(self,
+                 max_entries: int = 10_000,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 ttl_seconds: float = 300.0,
+                 generation_source: Optional[Callable[[], Awaitable[Optional[int]]]] = None,
+                 generation_check_seconds: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.generation_check_seconds = generation_check_seconds
+
+        self._generation_source = generation_source
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._size = 0
+        self._next_generation_check = 0.0
+
+        self.generation: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, namespace: str, filters: Dict, load: Callable[[Dict], Awaitable[Any]]) -> Any:
+
+        await self._refresh_generation()
+
+        key = self.key(namespace, filters)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+
+            self._remove(key)
+            self.expirations += 1
+
+        self.misses += 1
+        generation = self.generation
+        value = await load(filters)
+
+        # A result read while an import generation was replacing the data may already be stale
+        if generation == self.generation:
+            self._put(key, value)
+
+        return value
+
+    def invalidate(self, generation: Optional[int] = None) -> None:
+        """Drop every entry, e.g. because generation replaced the data."""
+
+        self._entries.clear()
+        self._size = 0
+        self.invalidations += 1
+        if generation is not None:
+            self.generation = generation
+
+    def stats(self) -> Dict[str, Any]:
+
+        lookups = self.hits + self.misses
+
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "payload_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    @staticmethod
+    def key(namespace: str, filters: Dict) -> Tuple[str, str]:
+        """Equal for filters that select the same rows: unset filters are dropped and expand order is ignored."""
+
+        normalized = {}
+
+        for name, value in filters.items():
+            if value is None or value == "" or value == []:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = sorted(value, key=str)
+            normalized[name] = value
+
+        return namespace, json.dumps(normalized, sort_keys=True, default=str)
+
+    async def _refresh_generation(self) -> None:
+
+        if self._generation_source is None:
+            return
+
+        now = self._clock()
+        if now < self._next_generation_check:
+            return
+
+        # Set before awaiting so concurrent requests do not all poll
+        self._next_generation_check = now + self.generation_check_seconds
+        generation = await self._generation_source()
+
+        # None means unknown (e.g. nothing imported yet): keep what is cached, the TTL still applies
+        if generation is None or generation == self.generation:
+            return
+
+        if self.generation is None and not self._entries:
+            self.generation = generation
+        else:
+            self.invalidate(generation)
+
+    def _put(self, key: Tuple[str, str], value: Any) -> None:
+
+        # The serialized size: cheap to compute and proportional to, though smaller than, the objects' footprint
+        size = len(to_json(value))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _Entry(value, size, self._clock() + self.ttl_seconds)
+        self._size += size
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
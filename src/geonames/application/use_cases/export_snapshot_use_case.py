@@ -0,0 +1,24 @@
+from typing import Dict, List
+
+from shared.application.ports.logger_port import LoggerPort
+from geonames.application.ports.snapshot_exporter_port import SnapshotExporterPort
+
+
+class ExportSnapshotUseCase:
+    """Exports each table to a snapshot that the import command can later load without the GeoNames dumps."""
+
+    def __init__(self, exporter: SnapshotExporterPort, table_names: List[str], logger: LoggerPort | None = None):
+        self.exporter = exporter
+        self.table_names = table_names
+        self.logger = logger
+
+    def execute(self) -> Dict[str, int]:
+
+        exported = {}
+
+        for table_name in self.table_names:
+            exported[table_name] = self.exporter.export(table_name)
+            if self.logger:
+                self.logger.info(f"Exported {exported[table_name]} rows of {table_name}")
+
+        return exported
@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
+
+from shared.application.ports.logger_port import LoggerPort
+from shared.application.ports.state_store_port import StateStorePort
+from geonames.application.ports.geoname_importer_port import GeonameImporterPort
+from geonames.application.ports.geonames_delta_importer_factory_port import GeonamesDeltaImporterFactoryPort
+from geonames.application.use_cases.import_sink import ImportSink
+from geonames.domain.repositories.alternate_name_repository import AlternateNameRepository
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class ImportGeonamesDeltaUseCase:
+    """
+    Applies the daily GeoNames modification and deletion files as batched upserts
+    and deletes, and records the last applied day so the next run resumes from it.
+    """
+
+    STATE_KEY = "geonames_delta_last_applied_date"
+
+    def __init__(self,
+                 sinks: List[ImportSink],
+                 alternate_name_repository: AlternateNameRepository,
+                 importer_factory: GeonamesDeltaImporterFactoryPort,
+                 state_store: StateStorePort,
+                 logger: LoggerPort | None = None,
+                 batch_size: int = 5000):
+
+        self.sinks = sinks
+        self.alternate_name_repository = alternate_name_repository
+        self.importer_factory = importer_factory
+        self.state_store = state_store
+        self.logger = logger
+        self.batch_size = batch_size
+
+    def execute(self, until: date, since: date | None = None) -> List[date]:
+
+        days = self.pending_days(until, since)
+
+        for day in days:
+            self._apply_day(day)
+            self.state_store.set(self.STATE_KEY, day.isoformat())
+
+        return days
+
+    def pending_days(self, until: date, since: date | None = None) -> List[date]:
+
+        last_applied = self.state_store.get(self.STATE_KEY)
+
+        if since:
+            start = since
+        elif last_applied:
+            start = date.fromisoformat(last_applied) + timedelta(days=1)
+        else:
+            start = until
+
+        return [start + timedelta(days=offset) for offset in range((until - start).days + 1)]
+
+    def _apply_day(self, day: date) -> None:
+
+        modified = self._apply_modifications(self.importer_factory.modifications(day))
+        deleted = self._apply_deletes(self.importer_factory.deletes(day), [sink.repository for sink in self.sinks])
+
+        alternate_names_modified = 0
+        for batch in _batched(self._load(self.importer_factory.alternate_name_modifications(day)), self.batch_size):
+            self.alternate_name_repository.bulk_upsert(batch)
+            alternate_names_modified += len(batch)
+
+        alternate_names_deleted = self._apply_deletes(
+            self.importer_factory.alternate_name_deletes(day), [self.alternate_name_repository]
+        )
+
+        if self.logger:
+            self.logger.info(
+                f"Applied GeoNames delta {day.isoformat()}: {modified} geonames modified, {deleted} deleted, "
+                f"{alternate_names_modified} alternate names modified, {alternate_names_deleted} deleted"
+            )
+
+    def _apply_modifications(self, importer: GeonameImporterPort) -> int:
+
+        modified = 0
+
+        for batch in _batched(self._load(importer), self.batch_size):
+            for sink in self.sinks:
+                accepted = [entity for entity in batch if sink.accepts(entity)]
+                if accepted:
+                    sink.repository.bulk_upsert(accepted)
+
+                # A row that no longer matches a filtered sink (e.g. an ADM demoted to PPL) leaves it
+                if sink.predicate is not None and len(accepted) < len(batch):
+                    sink.repository.delete_by_ids([entity.geoname_id for entity in batch if not sink.accepts(entity)])
+
+            modified += len(batch)
+
+        return modified
+
+    def _apply_deletes(self, importer: GeonameImporterPort[int], repositories: List[Any]) -> int:
+
+        deleted = 0
+
+        for ids in _batched(self._load(importer), self.batch_size):
+            for repository in repositories:
+                repository.delete_by_ids(ids)
+            deleted += len(ids)
+
+        return deleted
+
+    @staticmethod
+    def _load(importer: GeonameImporterPort) -> Iterator[Any]:
+
+        importer.ensure_data_is_available()
+        if importer.count_total_records() == 0:
+            importer.cleanup()
+            return iter([])
+
+        return importer.load_entities()
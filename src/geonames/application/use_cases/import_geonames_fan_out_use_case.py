@@ -0,0 +1,313 @@
+import time
+
+from typing import Generator, Iterator, List, Tuple
+
+from shared.application.ports.logger_port import LoggerPort
+from geonames.application.ports.geoname_importer_port import GeonameImporterPort
+from geonames.application.services.import_checkpointer import ImportCheckpointer
+from geonames.application.services.import_metrics import ImportMetrics
+from geonames.application.services.import_pipeline import ImportPipeline
+from geonames.application.use_cases.import_sink import ImportSink
+from geonames.domain.entities.geoname import Geoname
+
+
+class ImportGeonamesFanOutUseCase:
+    """
+    Reads a source file once and routes every entity to each sink whose predicate
+    accepts it. Sinks batch and flush independently, each at its own batch size.
+    With a pipeline queue size, parsing and mapping run on their own threads and
+    mapped batches are routed whole, so sinks flush on batch boundaries.
+
+    When checkpointing, every commit records, per sink, the source rows and position
+    its last batch reached. A resume restarts at the earliest of them and skips, for
+    each sink, the rows its table already holds.
+    """
+
+    def __init__(self,
+                 importer: GeonameImporterPort[Geoname],
+                 sinks: List[ImportSink],
+                 logger: LoggerPort | None = None,
+                 defer_indexes: bool = False,
+                 shadow_load: bool = False,
+                 checkpointer: ImportCheckpointer | None = None,
+                 metrics: ImportMetrics | None = None,
+                 pipeline_queue_size: int = 0):
+
+        self.importer = importer
+        self.sinks = sinks
+        self.logger = logger
+        self.defer_indexes = defer_indexes
+        self.shadow_load = shadow_load
+        self.checkpointer = checkpointer
+        # > 0 parses and maps on pipeline threads, routing mapped batches on the consuming thread
+        self.pipeline_queue_size = pipeline_queue_size
+
+        # Sinks record their own insert latencies; the importer reports downloads and rejected rows
+        self.metrics = metrics
+        if metrics:
+            self.importer.set_metrics(metrics)
+
+    def execute(self) -> Tuple[int, Iterator[int]]:
+
+        if self.importer.is_up_to_date() and all(sink.repository.count_all() > 0 for sink in self.sinks):
+            return 0, iter([])
+
+        self.importer.ensure_data_is_available()
+
+        started = time.perf_counter()
+        total_records = self.importer.count_total_records()
+        if self.metrics:
+            self.metrics.add("count", time.perf_counter() - started, total_records)
+
+        if total_records == 0:
+            raise Exception(f"File have no records to import.")
+
+        if self._is_up_to_date(total_records):
+            self.importer.mark_imported()
+            if self.checkpointer:
+                self.checkpointer.clear()
+            if self.defer_indexes:
+                for sink in self.sinks:
+                    sink.repository.build_secondary_indexes()
+            return 0, iter([])
+
+        checkpoint = self._find_checkpoint()
+        if checkpoint:
+            if self.logger:
+                self.logger.info(f"Resuming import at offset {checkpoint['position']['offset']} ({checkpoint['rows']} rows already imported)")
+
+            return total_records, self._generator(checkpoint)
+
+        if self.checkpointer:
+            self.checkpointer.clear()
+
+        for sink in self.sinks:
+            if self.shadow_load:
+                sink.repository.begin_shadow_load()
+                continue
+            sink.repository.truncate()
+            if self.defer_indexes:
+                sink.repository.drop_secondary_indexes()
+
+        return total_records, self._generator()
+
+    def _generator(self, checkpoint: dict | None = None) -> Iterator[int]:
+
+        if self.pipeline_queue_size > 0:
+            return self._pipelined_fan_out_generator(checkpoint)
+
+        return self._fan_out_generator(self.importer.load_entities(), checkpoint)
+
+    def _is_up_to_date(self, total_records: int) -> bool:
+
+        # Only a catch-all sink can be compared with the file; filtered sinks just need to be populated
+        catch_all = [sink for sink in self.sinks if sink.predicate is None]
+        if not catch_all:
+            return False
+
+        for sink in self.sinks:
+            count = sink.repository.count_all()
+            if sink.predicate is None and count != total_records:
+                return False
+            if count == 0:
+                return False
+
+        return True
+
+    def _find_checkpoint(self) -> dict | None:
+
+        if not self.checkpointer or self.shadow_load:
+            return None
+
+        rows = {sink.name: sink.repository.count_all() for sink in self.sinks}
+        if not any(rows.values()):
+            return None
+
+        checkpoint = self.checkpointer.resumable(rows)
+        if not checkpoint or not self.importer.resume_from(checkpoint["position"]):
+            return None
+
+        return checkpoint
+
+    def _fan_out_generator(self, entities: Generator[Geoname, None, None], checkpoint: dict | None = None) -> Iterator[int]:
+
+        buffers: List[list] = [[] for _ in self.sinks]
+        inserted, committed, batches, processed_total = self._resume_state(checkpoint)
+        processed = 0
+
+        if processed_total:
+            yield processed_total
+
+        # Reading, parsing, mapping and routing time is the loop's time outside writes and yields
+        started = time.perf_counter()
+        excluded = 0.0
+        resumed_from = processed_total
+
+        for entity in entities:
+            processed += 1
+            row = processed_total + processed
+            flushed = False
+
+            for index, sink in enumerate(self.sinks):
+                # After a resume, the rows up to a sink's own checkpoint are already in its table
+                if row <= committed[index]["processed"] or not sink.accepts(entity):
+                    continue
+
+                buffer = buffers[index]
+                buffer.append(entity)
+
+                if len(buffer) >= sink.current_batch_size():
+                    excluded += sink.write(buffer)
+                    inserted[index] += len(buffer)
+                    buffer.clear()
+                    flushed = True
+                    committed[index] = {"processed": row, "position": self.importer.current_position()}
+
+            # Progress is reported in source rows, whenever any sink commits
+            if flushed:
+                processed_total += processed
+
+                if self._is_checkpointing():
+                    batches += 1
+                    self._save_checkpoint(inserted, committed, batches, self.importer.current_position())
+
+                suspended = time.perf_counter()
+                yield processed
+                excluded += time.perf_counter() - suspended
+                processed = 0
+
+        if self.metrics:
+            self.metrics.add("parse_map", time.perf_counter() - started - excluded, processed_total + processed - resumed_from)
+
+        self._flush_all(buffers, inserted)
+
+        if processed:
+            yield processed
+
+        self._finish(inserted)
+
+    def _pipelined_fan_out_generator(self, checkpoint: dict | None = None) -> Iterator[int]:
+
+        # Batches are routed whole, so sinks commit (and checkpoint) on batch boundaries, where positions are exact
+        pipeline = ImportPipeline(
+            source=("parse", self.importer.read_batches(min(sink.current_batch_size() for sink in self.sinks))),
+            stages=[("map", self.importer.map_batch)],
+            queue_size=self.pipeline_queue_size,
+            size_of=lambda batch: len(batch.items),
+        )
+
+        buffers: List[list] = [[] for _ in self.sinks]
+        inserted, committed, batches, row = self._resume_state(checkpoint)
+
+        if row:
+            yield row
+
+        for batch in pipeline.run():
+            for entity in batch.items:
+                row += 1
+                for index, sink in enumerate(self.sinks):
+                    if row > committed[index]["processed"] and sink.accepts(entity):
+                        buffers[index].append(entity)
+
+            flushed = False
+
+            for index, sink in enumerate(self.sinks):
+                if len(buffers[index]) < sink.current_batch_size():
+                    continue
+
+                with pipeline.measure("write", len(buffers[index])):
+                    sink.write(buffers[index])
+                inserted[index] += len(buffers[index])
+                buffers[index].clear()
+                flushed = True
+                # Every batch carries its own position: the parser has usually moved on by now
+                committed[index] = {"processed": row, "position": batch.position}
+
+            if flushed and self._is_checkpointing():
+                batches += 1
+                self._save_checkpoint(inserted, committed, batches, batch.position)
+
+            yield len(batch.items)
+
+        self._flush_all(buffers, inserted)
+
+        if self.logger:
+            pipeline.log_throughput(self.logger)
+
+        if self.metrics:
+            for name in ("parse", "map"):
+                self.metrics.add(name, pipeline.stats[name].seconds, pipeline.stats[name].rows)
+
+        self._finish(inserted)
+
+    def _resume_state(self, checkpoint: dict | None) -> Tuple[List[int], List[dict], int, int]:
+        """Rows inserted per sink, what each sink has committed, batches and source rows done; zero unless resuming."""
+
+        # Per sink: source rows up to its last committed batch, and the position right after them
+        committed = [{"processed": 0, "position": None} for _ in self.sinks]
+
+        if not checkpoint:
+            return [0] * len(self.sinks), committed, 0, 0
+
+        processed = checkpoint.get("processed", 0)
+        # Checkpoints without per-sink state were taken with every sink flushed at one position
+        shared = {"processed": processed, "position": checkpoint["position"]}
+        committed = [dict(checkpoint.get("sinks", {}).get(sink.name, shared)) for sink in self.sinks]
+
+        return [checkpoint["rows"][sink.name] for sink in self.sinks], committed, checkpoint["batch"], processed
+
+    def _finish(self, inserted: List[int]) -> None:
+
+        if self.logger:
+            for index, sink in enumerate(self.sinks):
+                self.logger.info(f"Inserted {inserted[index]} records into {sink.name}")
+
+        if self.defer_indexes or self.shadow_load:
+            for sink in self.sinks:
+                if self.logger:
+                    self.logger.info(f"Rebuilding secondary indexes of {sink.name}")
+                sink.repository.build_secondary_indexes()
+                sink.repository.analyze()
+
+        # Swap only once every sink is fully loaded and indexed
+        if self.shadow_load:
+            for sink in self.sinks:
+                sink.repository.swap_shadow()
+
+        if self.checkpointer:
+            self.checkpointer.clear()
+
+        self.importer.mark_imported()
+        self.importer.cleanup()
+
+    def _flush_all(self, buffers: List[list], inserted: List[int]) -> float:
+
+        seconds = 0.0
+
+        for index, sink in enumerate(self.sinks):
+            if buffers[index]:
+                seconds += sink.write(buffers[index])
+                inserted[index] += len(buffers[index])
+                buffers[index].clear()
+
+        return seconds
+
+    def _is_checkpointing(self) -> bool:
+        return self.checkpointer is not None and not self.shadow_load
+
+    def _save_checkpoint(self, inserted: List[int], committed: List[dict], batches: int, current: dict | None) -> None:
+
+        # Entities not yielded in file order have no position to resume from
+        if current is None:
+            return
+
+        earliest = min(committed, key=lambda sink: sink["processed"])
+        position = earliest["position"]
+
+        if position is None:
+            # A sink with nothing committed yet resumes from the start of the source
+            position = {**current, "offset": 0, "skip": 0}
+
+        rows = {sink.name: inserted[index] for index, sink in enumerate(self.sinks)}
+        sinks = {sink.name: committed[index] for index, sink in enumerate(self.sinks)}
+        self.checkpointer.save(position, rows, batches, earliest["processed"], sinks)
@@ -1,55 +1,241 @@
-from typing import Generator, Tuple, Iterator
+import time
+
+from typing import Generator, List, Tuple, Iterator
 from shared.application.ports.logger_port import LoggerPort
 from geonames.application.ports.geoname_importer_port import GeonameImporterPort
+from geonames.application.services.adaptive_batch_sizer import AdaptiveBatchSizer
+from geonames.application.services.import_checkpointer import ImportCheckpointer
+from geonames.application.services.import_metrics import ImportMetrics
+from geonames.application.services.import_pipeline import ImportPipeline
 from geonames.domain.entities.geoname import Geoname
 from geonames.domain.repositories.geoname_repository import GeonameRepository
 
 
 class ImportGeonamesUseCase:
 
+    BATCH_SIZE = 5000
+
     def __init__(self, 
                  repository: GeonameRepository, 
                  importer: GeonameImporterPort[Geoname],
-                 logger: LoggerPort | None = None):
+                 logger: LoggerPort | None = None,
+                 defer_indexes: bool = False,
+                 shadow_load: bool = False,
+                 checkpointer: ImportCheckpointer | None = None,
+                 pipeline_queue_size: int = 0,
+                 batch_sizer: AdaptiveBatchSizer | None = None,
+                 metrics: ImportMetrics | None = None):
         
         self.repository = repository
         self.importer = importer
         self.logger = logger
+
+        # Drop secondary indexes before the load and rebuild them (then ANALYZE) once it is done
+        self.defer_indexes = defer_indexes
+
+        # Load into a shadow table and swap it into place, so readers never see a partial table
+        self.shadow_load = shadow_load
+
+        # Resume an interrupted load from the last committed batch instead of truncating
+        self.checkpointer = checkpointer
+
+        # With a queue size, parsing, mapping and writing run as concurrent stages with that many batches in between
+        self.pipeline_queue_size = pipeline_queue_size
+
+        # Fixed BATCH_SIZE rows per insert unless an adaptive sizer is given
+        self.batch_sizer = batch_sizer or AdaptiveBatchSizer(self.BATCH_SIZE)
+
+        # Stage timings, insert latencies and rejected rows of this run, for the import report
+        self.metrics = metrics
+        if metrics:
+            self.importer.set_metrics(metrics)
         
     def execute(self) -> Tuple[int, Iterator[int]]: 
 
+        # One conditional request: an unchanged, already imported source needs neither download nor import
+        if self.importer.is_up_to_date() and self.repository.count_all() > 0:
+            return 0, iter([])
+
         self.importer.ensure_data_is_available()
 
+        started = time.perf_counter()
         total_records = self.importer.count_total_records()
+        if self.metrics:
+            self.metrics.add("count", time.perf_counter() - started, total_records)
+
         if total_records == 0:
             raise Exception(f"File have no records to import.")
         
         count = self.repository.count_all()
         if count == total_records:
+            self.importer.mark_imported()
+            if self.checkpointer:
+                self.checkpointer.clear()
+            if self.defer_indexes:
+                # A previous run may have loaded the rows but failed before its rebuild finished
+                self.repository.build_secondary_indexes()
             return 0, iter([])
+
+        checkpoint = self._find_checkpoint(count)
+        if checkpoint:
+            if self.logger:
+                self.logger.info(f"Resuming import at offset {checkpoint['position']['offset']} ({count} rows already imported)")
+
+            return total_records, self._insert_generator(count, checkpoint["batch"])
+
+        if self.checkpointer:
+            self.checkpointer.clear()
             
-        self.repository.truncate()
+        if self.shadow_load:
+            self.repository.begin_shadow_load()
+        else:
+            self.repository.truncate()
 
-        entities = self.importer.load_entities()
+            if self.defer_indexes:
+                self.repository.drop_secondary_indexes()
 
-        return total_records, self._batch_insert_generator(entities)
+        return total_records, self._insert_generator()
     
-    def _batch_insert_generator(self, entities: Generator[Geoname, None, None]) -> Iterator[int]:
-            
-        batch_size = 5000
+    def _find_checkpoint(self, count: int) -> dict | None:
+
+        # A shadow load always starts from an empty shadow table
+        if not self.checkpointer or self.shadow_load or count == 0:
+            return None
+
+        checkpoint = self.checkpointer.resumable({"rows": count})
+        if not checkpoint or not self.importer.resume_from(checkpoint["position"]):
+            return None
+
+        return checkpoint
+
+    def _insert_generator(self, inserted: int = 0, batches: int = 0) -> Iterator[int]:
+
+        if self.pipeline_queue_size > 0:
+            return self._pipelined_insert_generator(inserted, batches)
+
+        return self._batch_insert_generator(self.importer.load_entities(), inserted, batches)
+
+    def _batch_insert_generator(self, 
+                                entities: Generator[Geoname, None, None],
+                                inserted: int = 0,
+                                batches: int = 0) -> Iterator[int]:
+
         batch = []
 
+        if inserted:
+            yield inserted
+
+        # Time spent pulling entities out of the importer, i.e. reading, parsing and mapping
+        read_started = time.perf_counter()
+
         for entity in entities:
             batch.append(entity)
             
-            if len(batch) >= batch_size:
-                self.repository.bulk_insert(batch)
+            if len(batch) >= self.batch_sizer.size:
+                self._record_read(read_started, len(batch))
+                self._write(batch)
+                inserted += len(batch)
+                batches += 1
+                # The position is read right after the batch's last entity, so it marks exactly what was committed
+                self._save_checkpoint(inserted, batches, self.importer.current_position())
                 
-                yield batch_size 
+                yield len(batch)
                 batch.clear()
+                read_started = time.perf_counter()
         
         if batch:
-            self.repository.bulk_insert(batch)
+            self._record_read(read_started, len(batch))
+            self._write(batch)
             yield len(batch)
 
-        self.importer.cleanup()
\ No newline at end of file
+        self._finish()
+
+    def _pipelined_insert_generator(self, inserted: int = 0, batches: int = 0) -> Iterator[int]:
+
+        # The parser cuts batches of the smallest size; the writer joins them up to the current size
+        pipeline = ImportPipeline(
+            source=("parse", self.importer.read_batches(self.batch_sizer.min_size)),
+            stages=[("map", self.importer.map_batch)],
+            queue_size=self.pipeline_queue_size,
+            size_of=lambda batch: len(batch.items),
+        )
+
+        if inserted:
+            yield inserted
+
+        pending: List[Geoname] = []
+
+        for batch in pipeline.run():
+            pending.extend(batch.items)
+            if len(pending) < self.batch_sizer.size:
+                continue
+
+            with pipeline.measure("write", len(pending)):
+                self._write(pending)
+
+            inserted += len(pending)
+            batches += 1
+            # Every batch carries its own position: the parser has usually moved on by now
+            self._save_checkpoint(inserted, batches, batch.position)
+
+            yield len(pending)
+            pending = []
+
+        if pending:
+            with pipeline.measure("write", len(pending)):
+                self._write(pending)
+            yield len(pending)
+
+        if self.logger:
+            pipeline.log_throughput(self.logger)
+
+        if self.metrics:
+            for name in ("parse", "map"):
+                self.metrics.add(name, pipeline.stats[name].seconds, pipeline.stats[name].rows)
+
+        self._finish()
+
+    def _write(self, batch: List[Geoname]) -> None:
+
+        started = time.perf_counter()
+        self.repository.bulk_insert(batch)
+        seconds = time.perf_counter() - started
+
+        self.batch_sizer.record(len(batch), seconds, self.batch_sizer.estimate_bytes(batch))
+        if self.metrics:
+            self.metrics.record_batch(len(batch), seconds)
+
+    def _record_read(self, started: float, rows: int) -> None:
+        if self.metrics:
+            self.metrics.add("parse_map", time.perf_counter() - started, rows)
+
+    def _finish(self) -> None:
+
+        if self.shadow_load:
+            # The shadow table is created without secondary indexes
+            self._rebuild_indexes()
+            self.repository.swap_shadow()
+        elif self.defer_indexes:
+            self._rebuild_indexes()
+
+        if self.checkpointer:
+            self.checkpointer.clear()
+
+        self.importer.mark_imported()
+        self.importer.cleanup()
+
+    def _save_checkpoint(self, inserted: int, batches: int, position: dict | None) -> None:
+
+        if not self.checkpointer or self.shadow_load:
+            return
+
+        if position is not None:
+            self.checkpointer.save(position, {"rows": inserted}, batches)
+
+    def _rebuild_indexes(self) -> None:
+
+        if self.logger:
+            self.logger.info("Rebuilding secondary indexes")
+
+        self.repository.build_secondary_indexes()
+        self.repository.analyze()
@@ -0,0 +1,40 @@
+import time
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from geonames.application.services.adaptive_batch_sizer import AdaptiveBatchSizer
+from geonames.application.services.import_metrics import ImportMetrics
+from geonames.domain.repositories.geoname_repository import GeonameRepository
+
+
+@dataclass(frozen=True)
+class ImportSink:
+    """A target table for a fan-out import: rows matching predicate (or all rows when None) go to repository."""
+
+    name: str
+    repository: GeonameRepository
+    predicate: Optional[Callable[[Any], bool]] = None
+    batch_size: int = 5000
+    batch_sizer: Optional[AdaptiveBatchSizer] = None
+    metrics: Optional[ImportMetrics] = None
+
+    def accepts(self, entity: Any) -> bool:
+        return self.predicate is None or self.predicate(entity)
+
+    def current_batch_size(self) -> int:
+        return self.batch_sizer.size if self.batch_sizer else self.batch_size
+
+    def write(self, batch: list) -> float:
+        """Bulk insert batch, feeding the insert latency to the batch sizer and metrics; returns that latency."""
+
+        started = time.perf_counter()
+        self.repository.bulk_insert(batch)
+        seconds = time.perf_counter() - started
+
+        if self.batch_sizer:
+            self.batch_sizer.record(len(batch), seconds, self.batch_sizer.estimate_bytes(batch))
+        if self.metrics:
+            self.metrics.record_batch(len(batch), seconds, table=self.name)
+
+        return seconds
@@ -28,3 +28,31 @@ class AlternateNameRepository(ABC):
     @abstractmethod
     def truncate(self) -> None: 
         pass
+
+    @abstractmethod
+    def bulk_upsert(self, entities: List[AlternateName]) -> None:
+        pass
+
+    @abstractmethod
+    def delete_by_ids(self, alternate_name_ids: List[int]) -> None:
+        pass
+
+    @abstractmethod
+    def drop_secondary_indexes(self) -> None:
+        pass
+
+    @abstractmethod
+    def build_secondary_indexes(self) -> None:
+        pass
+
+    @abstractmethod
+    def analyze(self) -> None:
+        pass
+
+    @abstractmethod
+    def begin_shadow_load(self) -> None:
+        pass
+
+    @abstractmethod
+    def swap_shadow(self) -> None:
+        pass
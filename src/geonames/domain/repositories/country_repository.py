@@ -28,3 +28,23 @@ class CountryRepository(ABC):
     @abstractmethod
     def truncate(self) -> None:
         pass
+
+    @abstractmethod
+    def drop_secondary_indexes(self) -> None:
+        pass
+
+    @abstractmethod
+    def build_secondary_indexes(self) -> None:
+        pass
+
+    @abstractmethod
+    def analyze(self) -> None:
+        pass
+
+    @abstractmethod
+    def begin_shadow_load(self) -> None:
+        pass
+
+    @abstractmethod
+    def swap_shadow(self) -> None:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Iterator, Optional, List, Dict
 from geonames.domain.entities.geoname import Geoname
 
 
@@ -16,3 +16,35 @@ class GeonameRepository(ABC):
     @abstractmethod
     def truncate(self) -> None:
         pass
+
+    @abstractmethod
+    def iter_ids(self) -> Iterator[int]:
+        pass
+
+    @abstractmethod
+    def bulk_upsert(self, entities: List[Geoname]) -> None:
+        pass
+
+    @abstractmethod
+    def delete_by_ids(self, geoname_ids: List[int]) -> None:
+        pass
+
+    @abstractmethod
+    def drop_secondary_indexes(self) -> None:
+        pass
+
+    @abstractmethod
+    def build_secondary_indexes(self) -> None:
+        pass
+
+    @abstractmethod
+    def analyze(self) -> None:
+        pass
+
+    @abstractmethod
+    def begin_shadow_load(self) -> None:
+        pass
+
+    @abstractmethod
+    def swap_shadow(self) -> None:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ImportGenerationRepository(ABC):
+
+    @abstractmethod
+    def record(self, command: str) -> int:
+        pass
+
+    @abstractmethod
+    def current(self) -> Optional[int]:
+        pass
@@ -1,5 +1,6 @@
 from shared.application.ports.logger_port import LoggerPort
 from shared.application.ports.file_downloader_port import FileDownloaderPort
+from geonames.infrastructure.file_importer.filters.alternate_name_row_filter import AlternateNameRowFilter
 from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
 from geonames.application.ports.geoname_importer_port import GeonameImporterPort
 from geonames.infrastructure.file_importer.base_geoname_file_importer import BaseGeonameFileImporter
@@ -10,5 +11,37 @@ class AlternateNameFileImporter(BaseGeonameFileImporter, GeonameImporterPort[Alt
 
     FILE_URL = "https://download.geonames.org/export/dump/alternateNamesV2.zip"
 
-    def __init__(self, file_downloader: FileDownloaderPort, mapper: BaseFileRowMapper[AlternateName], logger: LoggerPort | None = None):
-        super().__init__(download_url=self.FILE_URL, file_downloader=file_downloader, mapper=mapper, logger=logger)
\ No newline at end of file
+    def __init__(self,
+                 file_downloader: FileDownloaderPort,
+                 mapper: BaseFileRowMapper[AlternateName],
+                 logger: LoggerPort | None = None,
+                 row_filter: AlternateNameRowFilter | None = None):
+
+        super().__init__(download_url=self.FILE_URL,
+                         file_downloader=file_downloader,
+                         mapper=mapper,
+                         logger=logger,
+                         row_filter=row_filter)
+
+    def count_total_records(self) -> int:
+
+        if self.row_filter is None:
+            return self.count_records("rows")
+
+        # Only rows the filter keeps are imported, so only those count (cached per filter configuration)
+        return self.count_records(f"rows:{self.row_filter.fingerprint()}", row_filter=self.row_filter)
+
+    def is_up_to_date(self) -> bool:
+
+        # A version imported with other filters (or other geonames) has to be loaded again
+        if self.imported_marker.get("filter") != self._filter_fingerprint():
+            return False
+
+        return super().is_up_to_date()
+
+    def mark_imported(self) -> None:
+        super().mark_imported()
+        self.imported_marker.set("filter", self._filter_fingerprint())
+
+    def _filter_fingerprint(self) -> str | None:
+        return self.row_filter.fingerprint() if self.row_filter else None
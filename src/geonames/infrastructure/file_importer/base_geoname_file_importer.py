@@ -1,36 +1,75 @@
 import os
+import io
+import re
 import zipfile
 import csv
-import mmap
 
+from contextlib import contextmanager
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Generator, TypeVar
+from typing import Any, BinaryIO, Dict, Generator, Iterable, Iterator, List, Tuple, TypeVar
 
-from geonames.application.ports.geoname_importer_port import GeonameImporterPort
+from geonames.application.ports.geoname_importer_port import GeonameImporterPort, ImportBatch
+from geonames.application.services.import_metrics import ImportMetrics
+from geonames.infrastructure.file_importer.filters.base_row_filter import BaseRowFilter
 from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
+from geonames.infrastructure.file_importer.parallel_file_reader import ParallelFileReader
+from geonames.infrastructure.file_importer.record_count_cache import RecordCountCache
+from geonames.infrastructure.file_importer.record_counter import RecordCounter
 from shared.application.ports.logger_port import LoggerPort
 from shared.application.ports.file_downloader_port import FileDownloaderPort
 from shared.infrastructure.adapters.exceptions.zip_unpack_error import ZipUnpackError
+from shared.infrastructure.adapters.json_file_state_store import JsonFileStateStore
 
 T = TypeVar("T")
 
+_UNKNOWN = object()
+
 
 class BaseGeonameFileImporter(GeonameImporterPort[T]):
 
+    # Mapping errors beyond this many are only counted, not logged
+    MAX_LOGGED_ERRORS = 10
+
     def __init__(self, 
                  download_url: str, 
                  file_downloader: FileDownloaderPort,
                  mapper: BaseFileRowMapper, 
-                 logger: LoggerPort | None = None):
+                 logger: LoggerPort | None = None,
+                 row_filter: BaseRowFilter | None = None):
 
         self.DOWNLOAD_URL = download_url
         self.file_downloader = file_downloader
         self.mapper = mapper
         self.logger = logger
+        self.row_filter = row_filter
+        self.metrics: ImportMetrics | None = None
+        self._logged_errors = 0
 
         load_dotenv()
 
+        # Parallel read mode: IMPORT_WORKERS > 1 parses newline-aligned shards in a process pool
+        self.workers = int(os.getenv("IMPORT_WORKERS", "1"))
+        self.shard_size = int(os.getenv("IMPORT_SHARD_SIZE_MB", "32")) * 1024 * 1024
+        self.ordered = os.getenv("IMPORT_ORDERED", "true").lower() in ("1", "true", "yes")
+
+        # Streaming mode: read zipped sources straight from the archive member, never extracting them
+        self.stream_from_zip = os.getenv("IMPORT_STREAM_FROM_ZIP", "false").lower() in ("1", "true", "yes")
+        self.read_chunk_size = int(os.getenv("IMPORT_READ_CHUNK_SIZE_MB", "8")) * 1024 * 1024
+
+        # Record counts are cached in a <source>.counts.json sidecar keyed by size and mtime
+        self.cache_counts = os.getenv("IMPORT_COUNT_CACHE", "true").lower() in ("1", "true", "yes")
+
+        # Checkpoint position: byte offset of a line start plus the number of entities already taken after it
+        self.resume_offset = 0
+        self.resume_skip = 0
+        self._position: Tuple[int, int] | None = (0, 0)
+        self._read_offset = 0
+        self._source_signature: Dict[str, Any] | None = None
+
+        # Result of the conditional request against the remote file, made at most once per run
+        self._remote_modified: Any = _UNKNOWN
+
         self.FILENAME = Path(self.DOWNLOAD_URL.split('/')[-1])
         self.IS_ZIPPED = self.FILENAME.suffix.lower() == ".zip"
 
@@ -44,18 +83,57 @@ class BaseGeonameFileImporter(GeonameImporterPort[T]):
         else:
             self.read_target_path = self.download_target_path
 
+        # Version of the remote file whose import last completed
+        self.imported_marker = JsonFileStateStore(self.temp_path / f"{self.FILENAME}.imported.json")
+
     def ensure_data_is_available(self) -> None:
 
         if self.read_target_path.exists() or self.download_target_path.exists():
-            return
+            # Local copies are kept unless the server reports a newer version
+            if self.is_remote_modified() is not True:
+                return
+
+            if self.logger:
+                self.logger.info(f"{self.DOWNLOAD_URL} changed since it was downloaded, refreshing local copy")
+            self._remove_local_copies()
 
         self.download_file()
 
-        if self.IS_ZIPPED:
+        if self.IS_ZIPPED and not self.stream_from_zip:
             self.extract_file()
 
+    def set_metrics(self, metrics: ImportMetrics) -> None:
+        self.metrics = metrics
+
     def download_file(self) -> None:
-        self.file_downloader.download(self.DOWNLOAD_URL, str(self.download_target_path))
+        with self._timed("download"):
+            self.file_downloader.download(self.DOWNLOAD_URL, str(self.download_target_path))
+        self._remote_modified = False
+
+    def is_remote_modified(self) -> bool | None:
+        """Whether the remote file changed since the last download (None when unknown)."""
+
+        if self._remote_modified is _UNKNOWN:
+            self._remote_modified = self.file_downloader.is_modified(self.DOWNLOAD_URL)
+
+        return self._remote_modified
+
+    def is_up_to_date(self) -> bool:
+        """True when the remote file is unchanged and that exact version was already imported."""
+
+        version = self.file_downloader.cached_version(self.DOWNLOAD_URL)
+        if version is None or self.imported_marker.get("version") != version:
+            return False
+
+        return self.is_remote_modified() is False
+
+    def mark_imported(self) -> None:
+        self.imported_marker.set("version", self.file_downloader.cached_version(self.DOWNLOAD_URL))
+
+    def _remove_local_copies(self) -> None:
+        for path in (self.read_target_path, self.download_target_path):
+            if path.exists():
+                path.unlink()
     
     def extract_file(self) -> None:
 
@@ -66,7 +144,7 @@ class BaseGeonameFileImporter(GeonameImporterPort[T]):
         txt_filename_in_zip = self.read_target_path.name 
 
         try:
-            with zipfile.ZipFile(zip_path, "r") as z:
+            with self._timed("extract"), zipfile.ZipFile(zip_path, "r") as z:
                 z.extract(txt_filename_in_zip, self.temp_path)
 
         except Exception as e:
@@ -75,54 +153,289 @@ class BaseGeonameFileImporter(GeonameImporterPort[T]):
 
             raise ZipUnpackError(f"Failed to unpack {zip_path}: {e}") from e
 
+    def is_streaming_from_zip(self) -> bool:
+        return self.stream_from_zip and self.IS_ZIPPED and self.download_target_path.exists()
+
+    def source_exists(self) -> bool:
+        return self.is_streaming_from_zip() or self.read_target_path.exists()
+
+    def source_path(self) -> Path:
+        return self.download_target_path if self.is_streaming_from_zip() else self.read_target_path
+
+    def source_signature(self) -> Dict[str, Any]:
+        stat = os.stat(self.source_path())
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def resume_from(self, position: Dict[str, Any] | None) -> bool:
+        """Make the next load_entities() start at a checkpointed position; False when it does not match the source."""
+
+        self.resume_offset = 0
+        self.resume_skip = 0
+
+        if not position or not self.source_exists():
+            return False
+
+        # Offsets are only meaningful for the exact file they were recorded against
+        if position.get("source") != self.source_signature():
+            return False
+
+        self.resume_offset = int(position["offset"])
+        self.resume_skip = int(position.get("skip", 0))
+        return True
+
+    def current_position(self) -> Dict[str, Any] | None:
+        """Position just after the last yielded entity, or None when entities are not yielded in file order."""
+
+        if self._position is None or self._source_signature is None:
+            return None
+
+        offset, skip = self._position
+        return self._position_at(offset, skip)
+
+    def _position_at(self, offset: int, skip: int) -> Dict[str, Any]:
+        return {"offset": offset, "skip": skip, "source": self._source_signature}
+
+    @contextmanager
+    def open_binary_stream(self) -> Iterator[BinaryIO]:
+        """Open the source as a buffered binary stream: the zip member in streaming mode, else the text file."""
+
+        if not self.is_streaming_from_zip():
+            with open(self.read_target_path, "rb", buffering=self.read_chunk_size) as f:
+                yield f
+            return
+
+        zip_path = self.download_target_path
+
+        try:
+            archive = zipfile.ZipFile(zip_path, "r")
+            member = archive.open(self.read_target_path.name)
+        except Exception as e:
+            if os.path.exists(zip_path):
+                os.remove(zip_path)
+
+            raise ZipUnpackError(f"Failed to open {self.read_target_path.name} in {zip_path}: {e}") from e
+
+        with archive, member:
+            yield io.BufferedReader(member, buffer_size=self.read_chunk_size)
+
     def count_total_records(self) -> int:
-        file_path = self.read_target_path
+        return self.count_records("rows")
+
+    def count_records(self, cache_key: str, pattern: re.Pattern | None = None, row_filter: BaseRowFilter | None = None) -> int:
+        """Count data rows (rows matching pattern, or accepted by row_filter), using the sidecar cache when valid."""
 
-        if not file_path.exists() or os.path.getsize(file_path) == 0:
+        if not self.source_exists():
             return 0
 
+        streaming = self.is_streaming_from_zip()
+        source_path = self.source_path()
+
+        if os.path.getsize(source_path) == 0:
+            return 0
+
+        cache = RecordCountCache(source_path, member=self.read_target_path.name if streaming else None)
+        if self.cache_counts:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        counter = RecordCounter(chunk_size=self.read_chunk_size, workers=self.workers, pattern=pattern, row_filter=row_filter)
+
         try:
-            with open(file_path, "rb") as f:
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                    count = 0
-                    for raw_line in iter(mm.readline, b""):
-                        line = raw_line.decode("utf-8", errors="ignore").strip()
-                        if not line or line.startswith("#"):
-                            continue
-                        count += 1
-                    return count
+            if streaming:
+                with self.open_binary_stream() as stream:
+                    count = counter.count_stream(stream)
+            else:
+                count = counter.count_file(self.read_target_path)
+
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error reading file with mmap: {e}. Returning 0 records.")
+                self.logger.error(f"Error counting records in {source_path}: {e}. Returning 0 records.")
             return 0
+
+        if self.cache_counts:
+            cache.set(cache_key, count)
+
+        return count
         
     def load_entities(self) -> Generator[T, None, None]:
 
+        self._position = (self.resume_offset, self.resume_skip)
+        self._source_signature = self.source_signature() if self.source_exists() else None
+
+        if self.workers > 1:
+            yield from self._load_entities_in_parallel()
+            self.cleanup()
+            return
+
+        skip = self.resume_skip
+
         for raw_row in self.read_raw_data():
-            try:
-                entity = self.mapper.to_entity(raw_row)
-                yield entity
-            except ValueError:
+            if self.row_filter and not self.row_filter.accepts(raw_row):
+                continue
+
+            entity = self._map_row(raw_row)
+            if entity is None:
                 continue
-            except Exception as e:
-                print(f"Error processing row {raw_row}: {e}")
+
+            if skip:
+                skip -= 1
+                continue
+
+            self._position = (self._read_offset, 0)
+            yield entity
 
         self.cleanup()
+
+    def _map_row(self, raw_row: list[str]) -> T | None:
+        try:
+            return self.mapper.to_entity(raw_row)
+        except ValueError:
+            self._reject("invalid")
+            return None
+        except Exception as e:
+            self._reject("error", errors=[f"Error processing row {raw_row}: {e}"])
+            return None
+
+    def _reject(self, reason: str, count: int = 1, errors: List[str] | None = None) -> None:
+        """Account rows the mapper could not turn into entities: invalid values, or unexpected errors."""
+
+        if self.metrics:
+            self.metrics.reject(reason, count, errors)
+
+        if not self.logger:
+            return
+
+        for error in errors or []:
+            self._logged_errors += 1
+            if self._logged_errors <= self.MAX_LOGGED_ERRORS:
+                self.logger.warning(error)
+            if self._logged_errors == self.MAX_LOGGED_ERRORS:
+                self.logger.warning(f"Further row errors in {self.FILENAME} are only counted")
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        if not self.metrics:
+            yield
+            return
+
+        with self.metrics.timed(stage):
+            yield
+
+    def read_batches(self, batch_size: int) -> Iterator[ImportBatch]:
+        """
+        Split the source into batches of raw rows, each with the position just after
+        it, leaving the mapping to map_batch() so it can run on another thread.
+
+        Parallel reads map inside the worker processes, and a resume that skips into
+        a shard counts mapped entities, so those batches come out already mapped.
+        """
+
+        if self.workers > 1 or self.resume_skip:
+            yield from self._read_mapped_batches(batch_size)
+            return
+
+        self._source_signature = self.source_signature() if self.source_exists() else None
+        rows = []
+
+        for raw_row in self.read_raw_data():
+            if self.row_filter and not self.row_filter.accepts(raw_row):
+                continue
+
+            rows.append(raw_row)
+            if len(rows) >= batch_size:
+                yield ImportBatch(rows, self._position_at(self._read_offset, 0))
+                rows = []
+
+        if rows:
+            yield ImportBatch(rows, self._position_at(self._read_offset, 0))
+
+    def _read_mapped_batches(self, batch_size: int) -> Iterator[ImportBatch]:
+
+        entities = []
+
+        for entity in self.load_entities():
+            entities.append(entity)
+            if len(entities) >= batch_size:
+                yield ImportBatch(entities, self.current_position(), mapped=True)
+                entities = []
+
+        if entities:
+            yield ImportBatch(entities, self.current_position(), mapped=True)
+
+    def map_batch(self, batch: ImportBatch) -> ImportBatch:
+
+        if batch.mapped:
+            return batch
+
+        entities = [entity for entity in map(self._map_row, batch.items) if entity is not None]
+        return ImportBatch(entities, batch.position, mapped=True)
+
+    def _load_entities_in_parallel(self) -> Generator[T, None, None]:
+
+        if not self.source_exists():
+            raise FileNotFoundError(f"File not found: {self.read_target_path}")
+
+        reader = ParallelFileReader(
+            mapper=self.mapper,
+            row_filter=self.row_filter,
+            workers=self.workers,
+            shard_size=self.shard_size,
+            ordered=self.ordered,
+            on_rejected=self._reject,
+        )
+
+        if self.is_streaming_from_zip():
+            with self.open_binary_stream() as stream:
+                stream.seek(self.resume_offset)
+                yield from self._yield_batches(reader.read_stream_batches(stream, self.resume_offset))
+            return
+
+        yield from self._yield_batches(reader.read_batches(self.read_target_path, self.resume_offset))
+
+    def _yield_batches(self, batches: Iterable[Tuple[Tuple[int, int], List[T]]]) -> Generator[T, None, None]:
+
+        for (start, _), batch in batches:
+            skipped = self.resume_skip if start == self.resume_offset else 0
+
+            for index in range(skipped, len(batch)):
+                # Out-of-order shards cannot be described by a single offset
+                self._position = (start, index + 1) if self.ordered else None
+                yield batch[index]
             
     def read_raw_data(self) -> Generator[list[str], None, None]:
 
-        file_path = self.read_target_path
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if not self.source_exists():
+            raise FileNotFoundError(f"File not found: {self.read_target_path}")
 
-        with file_path.open("r", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter="\t")
+        with self.open_binary_stream() as stream:
+            if self.resume_offset:
+                stream.seek(self.resume_offset)
+            self._read_offset = self.resume_offset
+
+            reader = csv.reader(self._decode_lines(stream), delimiter="\t")
             for row in reader:
                 if not row or row[0].startswith("#"):
                     continue
                 yield row
 
+    def _decode_lines(self, stream: BinaryIO) -> Iterator[str]:
+
+        # Track the byte offset of the end of the last line handed to the csv reader
+        for line in stream:
+            self._read_offset += len(line)
+            yield line.decode("utf-8")
+
     def cleanup(self) -> None:
 
+        # In streaming mode the archive is the only copy of the data, so it is kept
+        if self.stream_from_zip and self.IS_ZIPPED:
+            return
+
         if self.download_target_path.exists():
-            self.download_target_path.unlink()
\ No newline at end of file
+            self.download_target_path.unlink()
+
+        # A sidecar outliving its source would pile up in TEMP_PATH (delta imports add files every day)
+        for path in {self.download_target_path, self.read_target_path}:
+            if not path.exists():
+                RecordCountCache(path).discard()
\ No newline at end of file
@@ -9,6 +9,8 @@ from geonames.domain.entities.geoname import Geoname
 class CityFileImporter(BaseGeonameFileImporter, GeonameImporterPort[Geoname]):
 
     FILE_URL = "https://download.geonames.org/export/dump/cities500.zip"
+    # GeoNames' selection for the file: populated places of 500+ inhabitants, and seats of admin divisions down to PPLA4
+    MIN_POPULATION = 500
 
     def __init__(self, file_downloader: FileDownloaderPort, mapper: BaseFileRowMapper[Geoname], logger: LoggerPort | None = None):
         super().__init__(download_url=self.FILE_URL, file_downloader=file_downloader, mapper=mapper, logger=logger)
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os
+
+from datetime import date
+from typing import TypeVar
+
+from shared.application.ports.logger_port import LoggerPort
+from shared.application.ports.file_downloader_port import FileDownloaderPort
+from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
+from geonames.infrastructure.file_importer.filters.base_row_filter import BaseRowFilter
+from geonames.application.ports.geoname_importer_port import GeonameImporterPort
+from geonames.infrastructure.file_importer.base_geoname_file_importer import BaseGeonameFileImporter
+
+T = TypeVar("T")
+
+
+class DeltaFileImporter(BaseGeonameFileImporter, GeonameImporterPort[T]):
+    """Importer for one of the daily GeoNames delta files (modifications or deletes)."""
+
+    DEFAULT_BASE_URL = "https://download.geonames.org/export/dump"
+
+    FILE_PATTERNS = {
+        "modifications": "modifications-{day}.txt",
+        "deletes": "deletes-{day}.txt",
+        "alternate_name_modifications": "alternateNamesModifications-{day}.txt",
+        "alternate_name_deletes": "alternateNamesDeletes-{day}.txt",
+    }
+
+    def __init__(self, 
+                 kind: str, 
+                 day: date, 
+                 file_downloader: FileDownloaderPort, 
+                 mapper: BaseFileRowMapper[T], 
+                 logger: LoggerPort | None = None,
+                 base_url: str | None = None,
+                 row_filter: BaseRowFilter | None = None):
+
+        if kind not in self.FILE_PATTERNS:
+            raise ValueError(f"Unsupported delta file kind: {kind}. Expected one of {tuple(self.FILE_PATTERNS)}")
+
+        base_url = (base_url or os.getenv("GEONAMES_DELTA_URL") or self.DEFAULT_BASE_URL).rstrip("/")
+        file_name = self.FILE_PATTERNS[kind].format(day=day.isoformat())
+
+        super().__init__(download_url=f"{base_url}/{file_name}", 
+                         file_downloader=file_downloader, 
+                         mapper=mapper, 
+                         logger=logger,
+                         row_filter=row_filter)
@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Callable
+
+from shared.application.ports.logger_port import LoggerPort
+from shared.application.ports.file_downloader_port import FileDownloaderPort
+from geonames.application.ports.geonames_delta_importer_factory_port import GeonamesDeltaImporterFactoryPort
+from geonames.infrastructure.file_importer.delta_file_importer import DeltaFileImporter
+from geonames.infrastructure.file_importer.filters.alternate_name_row_filter import AlternateNameRowFilter
+from geonames.infrastructure.file_importer.filters.base_row_filter import BaseRowFilter
+from geonames.infrastructure.file_importer.mappers.alternate_name_file_row_mapper import AlternateNameFileRowMapper
+from geonames.infrastructure.file_importer.mappers.deleted_row_mapper import DeletedRowMapper
+from geonames.infrastructure.file_importer.mappers.geoname_file_row_importer import GeonameFileRowMapper
+
+
+class DeltaFileImporterFactory(GeonamesDeltaImporterFactoryPort):
+    """
+    Builds the importers of a day's delta files. Alternate-name modifications go
+    through alternate_name_filter, as the full import does; prepare_alternate_name_filter,
+    when given, runs first (e.g. to restrict the filter to the geonames loaded by then).
+    """
+
+    def __init__(self,
+                 file_downloader: FileDownloaderPort,
+                 logger: LoggerPort | None = None,
+                 base_url: str | None = None,
+                 alternate_name_filter: AlternateNameRowFilter | None = None,
+                 prepare_alternate_name_filter: Callable[[], None] | None = None):
+
+        self.file_downloader = file_downloader
+        self.logger = logger
+        self.base_url = base_url
+        self.alternate_name_filter = alternate_name_filter
+        self.prepare_alternate_name_filter = prepare_alternate_name_filter
+
+    def modifications(self, day: date) -> DeltaFileImporter:
+        return self._build("modifications", day, GeonameFileRowMapper())
+
+    def deletes(self, day: date) -> DeltaFileImporter:
+        return self._build("deletes", day, DeletedRowMapper())
+
+    def alternate_name_modifications(self, day: date) -> DeltaFileImporter:
+
+        if self.prepare_alternate_name_filter:
+            self.prepare_alternate_name_filter()
+
+        return self._build("alternate_name_modifications", day, AlternateNameFileRowMapper(), self.alternate_name_filter)
+
+    def alternate_name_deletes(self, day: date) -> DeltaFileImporter:
+        return self._build("alternate_name_deletes", day, DeletedRowMapper())
+
+    def _build(self, kind: str, day: date, mapper, row_filter: BaseRowFilter | None = None) -> DeltaFileImporter:
+        return DeltaFileImporter(
+            kind=kind,
+            day=day,
+            file_downloader=self.file_downloader,
+            mapper=mapper,
+            logger=self.logger,
+            base_url=self.base_url,
+            row_filter=row_filter,
+        )
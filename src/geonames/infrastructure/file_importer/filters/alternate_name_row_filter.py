@@ -0,0 +1,75 @@
+import hashlib
+import json
+
+from typing import Any, Iterable, List
+
+from geonames.infrastructure.file_importer.filters.base_row_filter import BaseRowFilter
+from geonames.infrastructure.file_importer.filters.geoname_id_bitmap import GeonameIdBitmap
+
+
+class AlternateNameRowFilter(BaseRowFilter):
+    """
+    Keeps the alternateNamesV2 rows worth loading: names in one of languages
+    (None keeps every language, "" stands for names without one), optionally
+    without links, colloquial or historic names, and, once restrict_to() is
+    given the ids of the loaded geonames, only names of those geonames.
+    """
+
+    GEONAME_ID_INDEX = 1
+    LANGUAGE_INDEX = 2
+    COLLOQUIAL_INDEX = 6
+    HISTORIC_INDEX = 7
+
+    LINK_LANGUAGE = "link"
+
+    def __init__(self,
+                 languages: Iterable[str] | None = None,
+                 exclude_links: bool = False,
+                 exclude_colloquial: bool = False,
+                 exclude_historic: bool = False):
+
+        self.languages = frozenset(languages) if languages is not None else None
+        self.exclude_links = exclude_links
+        self.exclude_colloquial = exclude_colloquial
+        self.exclude_historic = exclude_historic
+        self.geoname_ids: GeonameIdBitmap | None = None
+
+    def restrict_to(self, geoname_ids: GeonameIdBitmap) -> None:
+        self.geoname_ids = geoname_ids
+
+    def accepts(self, row: List[Any]) -> bool:
+
+        # Rows too short to carry a language are left to the mapper to reject
+        if len(row) <= self.LANGUAGE_INDEX:
+            return True
+
+        language = row[self.LANGUAGE_INDEX]
+        if self.languages is not None and language not in self.languages:
+            return False
+        if self.exclude_links and language == self.LINK_LANGUAGE:
+            return False
+
+        # Truncated rows lack the trailing flags: a missing flag is unset
+        if self.exclude_colloquial and len(row) > self.COLLOQUIAL_INDEX and row[self.COLLOQUIAL_INDEX] == "1":
+            return False
+        if self.exclude_historic and len(row) > self.HISTORIC_INDEX and row[self.HISTORIC_INDEX] == "1":
+            return False
+
+        if self.geoname_ids is not None:
+            geoname_id = row[self.GEONAME_ID_INDEX]
+            return not geoname_id.isdigit() or int(geoname_id) in self.geoname_ids
+
+        return True
+
+    def fingerprint(self) -> str:
+        """Identifies the filter configuration, so counts and imported markers follow configuration changes."""
+
+        settings = {
+            "languages": sorted(self.languages) if self.languages is not None else None,
+            "exclude_links": self.exclude_links,
+            "exclude_colloquial": self.exclude_colloquial,
+            "exclude_historic": self.exclude_historic,
+            "geoname_ids": self.geoname_ids.fingerprint() if self.geoname_ids is not None else None,
+        }
+
+        return hashlib.blake2b(json.dumps(settings, sort_keys=True).encode(), digest_size=8).hexdigest()
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List, Any
+
+
+class BaseRowFilter(ABC):
+    """
+    Decides whether a raw file row should be mapped at all.
+
+    Filters run before mapping (and inside parallel parse workers),
+    so implementations must be cheap and picklable.
+    """
+
+    @abstractmethod
+    def accepts(self, row: List[Any]) -> bool:
+        pass
@@ -0,0 +1,41 @@
+import hashlib
+
+from typing import Iterable
+
+
+class GeonameIdBitmap:
+    """
+    Set of geoname ids stored as one bit per possible id. GeoNames ids are dense
+    and stay below ~15 million, so the whole table fits in about 2 MB, where a
+    Python set of the same ids would take several hundred.
+    """
+
+    def __init__(self, geoname_ids: Iterable[int] = ()):
+        self._bits = bytearray()
+        self._count = 0
+
+        for geoname_id in geoname_ids:
+            self.add(geoname_id)
+
+    def add(self, geoname_id: int) -> None:
+
+        index = geoname_id >> 3
+        if index >= len(self._bits):
+            # Grow geometrically so ids arriving in ascending order do not reallocate every byte
+            self._bits.extend(bytes(max(index + 1 - len(self._bits), len(self._bits) // 2)))
+
+        mask = 1 << (geoname_id & 7)
+        if not self._bits[index] & mask:
+            self._bits[index] |= mask
+            self._count += 1
+
+    def __contains__(self, geoname_id: int) -> bool:
+        index = geoname_id >> 3
+        return 0 <= index < len(self._bits) and bool(self._bits[index] >> (geoname_id & 7) & 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def fingerprint(self) -> str:
+        """Digest of the members, independent of how much spare capacity the bitmap holds."""
+        return hashlib.blake2b(bytes(self._bits).rstrip(b"\0"), digest_size=8).hexdigest()
@@ -0,0 +1,24 @@
+from sys import intern
+from typing import List, Any
+
+from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
+from geonames.infrastructure.file_importer.records.alternate_name_record import AlternateNameRecord
+
+
+class AlternateNameRecordFileRowMapper(BaseFileRowMapper[AlternateNameRecord]):
+    """Maps alternateNamesV2 rows to AlternateNameRecord tuples, interning the language codes."""
+
+    def to_entity(self, row: List[Any]) -> AlternateNameRecord:
+
+        length = len(row)
+
+        return AlternateNameRecord(
+            int(row[0]),
+            int(row[1]),
+            row[3],
+            intern(row[2]),
+            length > 4 and row[4] == "1",
+            length > 5 and row[5] == "1",
+            length > 6 and row[6] == "1",
+            length > 7 and row[7] == "1",
+        )
@@ -0,0 +1,10 @@
+from typing import List, Any
+
+from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
+
+
+class DeletedRowMapper(BaseFileRowMapper[int]):
+    """Maps a row of a GeoNames deletes file (geonames or alternate names) to the deleted id."""
+
+    def to_entity(self, row: List[Any]) -> int:
+        return int(row[0])
@@ -0,0 +1,44 @@
+from datetime import datetime
+from sys import intern
+from typing import List, Any
+
+from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
+from geonames.infrastructure.file_importer.records.geoname_record import GeonameRecord
+
+
+class GeonameRecordFileRowMapper(BaseFileRowMapper[GeonameRecord]):
+    """
+    Maps allCountries-format rows to GeonameRecord tuples for bulk imports.
+
+    Low-cardinality codes are interned so millions of rows share a few thousand
+    strings, and created_at is taken once per run rather than once per row.
+    """
+
+    def __init__(self, created_at: datetime | None = None):
+        self.created_at = created_at or datetime.utcnow()
+
+    def to_entity(self, row: List[Any]) -> GeonameRecord:
+
+        return GeonameRecord(
+            int(row[0]),
+            row[1],
+            row[2],
+            row[3],
+            float(row[4]),
+            float(row[5]),
+            intern(row[6]),
+            intern(row[7]),
+            intern(row[8]),
+            row[9],
+            intern(row[10]),
+            row[11],
+            row[12],
+            row[13],
+            int(row[14]) if row[14] else 0,
+            int(row[15]) if row[15] else None,
+            int(row[16]) if row[16] else None,
+            intern(row[17]),
+            row[18],
+            self.created_at,
+            None,
+        )
@@ -0,0 +1,217 @@
+import csv
+import io
+import os
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import BinaryIO, Callable, Generator, Generic, Iterator, List, Tuple, TypeVar
+
+from geonames.infrastructure.file_importer.filters.base_row_filter import BaseRowFilter
+from geonames.infrastructure.file_importer.mappers.base_file_row_mapper import BaseFileRowMapper
+
+T = TypeVar("T")
+
+# Messages of failed rows sent back per shard; the rest are only counted
+MAX_ERROR_SAMPLES = 10
+
+
+def split_newline_aligned(file_path: Path, shard_size: int, start: int = 0) -> List[Tuple[int, int]]:
+    """Split a file (from a line-aligned start offset) into (start, end) byte ranges of roughly shard_size that begin and end on line boundaries."""
+
+    size = os.path.getsize(file_path)
+    boundaries = [start]
+
+    with open(file_path, "rb") as f:
+        offset = start + shard_size
+        while offset < size:
+            # Step back one byte so a boundary already on a line start is kept
+            f.seek(offset - 1)
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            boundaries.append(position)
+            offset = position + shard_size
+
+    boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _parse_shard(file_path: str, start: int, end: int, mapper: BaseFileRowMapper, row_filter: BaseRowFilter | None) -> Tuple[list, int, int, List[str]]:
+    """Parse and map the rows of one newline-aligned byte range (runs in a worker process)."""
+
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    return _parse_block(data, mapper, row_filter)
+
+
+def _parse_block(data: bytes, mapper: BaseFileRowMapper, row_filter: BaseRowFilter | None) -> Tuple[list, int, int, List[str]]:
+    """
+    Parse and map a block of complete lines (runs in a worker process). Returns the
+    entities, the number of invalid and of failed rows, and the first failures' messages.
+    """
+
+    entities = []
+    invalid = 0
+    failed = 0
+    errors = []
+    reader = csv.reader(io.StringIO(data.decode("utf-8"), newline="\n"), delimiter="\t")
+
+    for row in reader:
+        if not row or row[0].startswith("#"):
+            continue
+        if row_filter and not row_filter.accepts(row):
+            continue
+        try:
+            entities.append(mapper.to_entity(row))
+        except ValueError:
+            invalid += 1
+        except Exception as e:
+            failed += 1
+            if len(errors) < MAX_ERROR_SAMPLES:
+                errors.append(f"Error processing row {row}: {e}")
+
+    return entities, invalid, failed, errors
+
+
+class ParallelFileReader(Generic[T]):
+    """
+    Splits a tab-separated file into newline-aligned byte ranges and parses/maps
+    each range in a process pool, yielding one ((start, end), entities) batch per range.
+
+    Non-seekable sources (e.g. a zip member) are read sequentially in shard-sized
+    blocks by the calling process and only the parsing/mapping is fanned out.
+
+    Rows the mapper rejects are reported to on_rejected(reason, count, errors).
+    """
+
+    DEFAULT_SHARD_SIZE = 32 * 1024 * 1024
+
+    def __init__(self,
+                 mapper: BaseFileRowMapper[T],
+                 row_filter: BaseRowFilter | None = None,
+                 workers: int | None = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE,
+                 ordered: bool = True,
+                 on_rejected: Callable[[str, int, List[str]], None] | None = None):
+
+        self.mapper = mapper
+        self.row_filter = row_filter
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = max(shard_size, 1)
+        self.ordered = ordered
+        self.on_rejected = on_rejected
+
+        # Bounded number of in-flight shards so a slow consumer applies backpressure
+        self.max_pending = self.workers * 2
+
+    def split(self, file_path: Path, start: int = 0) -> List[Tuple[int, int]]:
+        return split_newline_aligned(file_path, self.shard_size, start)
+
+    def read_batches(self, file_path: Path, start: int = 0) -> Generator[Tuple[Tuple[int, int], List[T]], None, None]:
+
+        calls = (
+            ((shard_start, shard_end), _parse_shard, (str(file_path), shard_start, shard_end, self.mapper, self.row_filter))
+            for shard_start, shard_end in self.split(file_path, start)
+        )
+        yield from self._dispatch(calls)
+
+    def read_stream_batches(self, stream: BinaryIO, start: int = 0) -> Generator[Tuple[Tuple[int, int], List[T]], None, None]:
+        """Read a stream already positioned at the line-aligned offset start."""
+
+        calls = (
+            (block_range, _parse_block, (block, self.mapper, self.row_filter))
+            for block_range, block in self._read_blocks(stream, start)
+        )
+        yield from self._dispatch(calls)
+
+    def _read_blocks(self, stream: BinaryIO, start: int = 0) -> Iterator[Tuple[Tuple[int, int], bytes]]:
+
+        offset = start
+        carry = b""
+
+        while True:
+            chunk = stream.read(self.shard_size)
+            if not chunk:
+                break
+
+            data = carry + chunk
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                carry = data
+                continue
+
+            yield (offset, offset + cut), data[:cut]
+            offset += cut
+            carry = data[cut:]
+
+        if carry:
+            yield (offset, offset + len(carry)), carry
+
+    def _dispatch(self, calls: Iterator[Tuple[Tuple[int, int], Callable, tuple]]) -> Generator[Tuple[Tuple[int, int], List[T]], None, None]:
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+
+            def submit_next() -> Tuple[Tuple[int, int], Future] | None:
+                call = next(calls, None)
+                if call is None:
+                    return None
+                byte_range, function, args = call
+                return byte_range, pool.submit(function, *args)
+
+            if self.ordered:
+                yield from self._ordered(submit_next)
+            else:
+                yield from self._unordered(submit_next)
+
+    def _ordered(self, submit_next) -> Generator[Tuple[Tuple[int, int], List[T]], None, None]:
+
+        pending: deque[Tuple[Tuple[int, int], Future]] = deque()
+
+        while True:
+            while len(pending) < self.max_pending:
+                submitted = submit_next()
+                if submitted is None:
+                    break
+                pending.append(submitted)
+
+            if not pending:
+                return
+
+            byte_range, future = pending.popleft()
+            yield byte_range, self._entities(future)
+
+    def _unordered(self, submit_next) -> Generator[Tuple[Tuple[int, int], List[T]], None, None]:
+
+        pending: dict[Future, Tuple[int, int]] = {}
+
+        while True:
+            while len(pending) < self.max_pending:
+                submitted = submit_next()
+                if submitted is None:
+                    break
+                byte_range, future = submitted
+                pending[future] = byte_range
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), self._entities(future)
+
+    def _entities(self, future: Future) -> List[T]:
+
+        entities, invalid, failed, errors = future.result()
+
+        if self.on_rejected:
+            if invalid:
+                self.on_rejected("invalid", invalid, [])
+            if failed:
+                self.on_rejected("error", failed, errors)
+
+        return entities
@@ -0,0 +1,45 @@
+import os
+
+from pathlib import Path
+
+from shared.infrastructure.adapters.json_file_state_store import JsonFileStateStore
+
+
+class RecordCountCache:
+    """
+    Sidecar metadata file (<source>.counts.json) holding record counts of a source file.
+    Counts are only trusted while the source keeps the size and mtime they were computed for.
+    """
+
+    SUFFIX = ".counts.json"
+
+    def __init__(self, source_path: Path, member: str | None = None):
+        self.source_path = Path(source_path)
+        self.member = member
+        self.store = JsonFileStateStore(self.source_path.with_name(self.source_path.name + self.SUFFIX))
+
+    def get(self, key: str) -> int | None:
+
+        if self.store.get("signature") != self._signature():
+            return None
+
+        return self.store.get("counts", {}).get(key)
+
+    def set(self, key: str, count: int) -> None:
+
+        signature = self._signature()
+        counts = self.store.get("counts", {}) if self.store.get("signature") == signature else {}
+        counts[key] = count
+
+        self.store.set("counts", counts)
+        self.store.set("signature", signature)
+
+    def discard(self) -> None:
+        """Delete the sidecar, once its source file is gone."""
+
+        if self.store.path.exists():
+            self.store.path.unlink()
+
+    def _signature(self) -> dict:
+        stat = os.stat(self.source_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "member": self.member}
@@ -0,0 +1,98 @@
+import os
+import re
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+from geonames.infrastructure.file_importer.filters.base_row_filter import BaseRowFilter
+from geonames.infrastructure.file_importer.parallel_file_reader import split_newline_aligned
+
+EMPTY_LINE_RUN_PATTERN = re.compile(rb"\n\n+")
+
+
+def _count_block(block: bytes, pattern: re.Pattern | None, row_filter: BaseRowFilter | None = None) -> int:
+    """Count records in a block of complete lines, without decoding it unless a row filter has to see the rows."""
+
+    if row_filter is not None:
+        return sum(
+            1 for line in block.decode("utf-8").split("\n")
+            if line and not line.startswith("#") and row_filter.accepts(line.split("\t"))
+        )
+
+    if pattern is not None:
+        return sum(1 for _ in pattern.finditer(block))
+
+    lines = block.count(b"\n")
+    comments = block.count(b"\n#") + block.startswith(b"#")
+    # Each run of k+1 newlines holds k empty lines; a block starting with a newline opens with one more
+    empty = sum(match.end() - match.start() - 1 for match in EMPTY_LINE_RUN_PATTERN.finditer(block))
+    empty += block.startswith(b"\n")
+
+    return lines - comments - empty
+
+
+def _count_chunks(stream: BinaryIO, chunk_size: int, pattern: re.Pattern | None, limit: int | None = None, row_filter: BaseRowFilter | None = None) -> int:
+
+    count = 0
+    carry = b""
+    remaining = limit
+
+    while remaining is None or remaining > 0:
+        chunk = stream.read(chunk_size if remaining is None else min(chunk_size, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+
+        data = carry + chunk
+        cut = data.rfind(b"\n") + 1
+        block, carry = data[:cut], data[cut:]
+        if block:
+            count += _count_block(block, pattern, row_filter)
+
+    # Last line without a trailing newline
+    if carry:
+        count += _count_block(carry + b"\n", pattern, row_filter)
+
+    return count
+
+
+def _count_range(file_path: str, start: int, end: int, chunk_size: int, pattern: re.Pattern | None, row_filter: BaseRowFilter | None = None) -> int:
+
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        return _count_chunks(f, chunk_size, pattern, limit=end - start, row_filter=row_filter)
+
+
+class RecordCounter:
+    """
+    Counts data rows of a tab-separated file at byte level: newlines minus empty
+    and comment lines, or the lines matching pattern when one is given. With a
+    row filter, rows are split and counted when the filter accepts them.
+    Plain files are counted in parallel over newline-aligned ranges.
+    """
+
+    def __init__(self, chunk_size: int, workers: int = 1, pattern: re.Pattern | None = None, row_filter: BaseRowFilter | None = None):
+        self.chunk_size = chunk_size
+        self.workers = max(workers, 1)
+        self.pattern = pattern
+        self.row_filter = row_filter
+
+    def count_stream(self, stream: BinaryIO) -> int:
+        return _count_chunks(stream, self.chunk_size, self.pattern, row_filter=self.row_filter)
+
+    def count_file(self, file_path: Path) -> int:
+
+        if self.workers == 1 or os.path.getsize(file_path) <= self.chunk_size:
+            with open(file_path, "rb") as f:
+                return self.count_stream(f)
+
+        ranges = split_newline_aligned(file_path, self.chunk_size)
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_count_range, str(file_path), start, end, self.chunk_size, self.pattern, self.row_filter)
+                for start, end in ranges
+            ]
+            return sum(future.result() for future in futures)
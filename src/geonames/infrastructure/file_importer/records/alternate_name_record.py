@@ -0,0 +1,14 @@
+from typing import NamedTuple, Optional
+
+
+class AlternateNameRecord(NamedTuple):
+    """Import-only row of alternate_names, a plain tuple in column order."""
+
+    alternate_name_id: int
+    geoname_id: int
+    alternate_name: str
+    iso_language: Optional[str]
+    is_preferred_name: bool
+    is_short_name: bool
+    is_colloquial: bool
+    is_historic: bool
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class GeonameRecord(NamedTuple):
+    """
+    Import-only row of the geonames-shaped tables: a plain tuple in column order,
+    so bulk loaders write it as is and no entity or ORM model is built per row.
+    """
+
+    geoname_id: int
+    name: Optional[str]
+    asciiname: Optional[str]
+    alternatenames: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    feature_class: Optional[str]
+    feature_code: Optional[str]
+    country_code: Optional[str]
+    cc2: Optional[str]
+    admin1_code: Optional[str]
+    admin2_code: Optional[str]
+    admin3_code: Optional[str]
+    admin4_code: Optional[str]
+    population: Optional[int]
+    elevation: Optional[int]
+    dem: Optional[int]
+    timezone: Optional[str]
+    modification_date: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
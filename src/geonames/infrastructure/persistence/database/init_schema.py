@@ -12,5 +12,11 @@ def init_schema(engine: Engine):
     import geonames.infrastructure.persistence.models.country_model
     import geonames.infrastructure.persistence.models.admin_division_model
     import geonames.infrastructure.persistence.models.city_model
+    import geonames.infrastructure.persistence.models.import_generation_model
 
     GeonamesBase.metadata.create_all(bind=engine)
+
+    # create_all skips existing tables, so indexes added to a model later are created here
+    for table in GeonamesBase.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
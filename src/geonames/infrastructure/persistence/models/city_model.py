@@ -12,6 +12,9 @@ class CityModel(GeonameBaseModel):
         Index("idx_city_geonames_feature_class_code", "feature_class", "feature_code"),
         Index("idx_city_geonames_admin1", "country_code", "admin1_code"),
         Index("idx_city_geonames_admin2", "country_code", "admin2_code"),
+        # Keyset pagination by (population, geoname_id) within a country / admin1 division
+        Index("idx_city_geonames_country_population", "country_code", "population", "geoname_id"),
+        Index("idx_city_geonames_admin1_population", "country_code", "admin1_code", "population", "geoname_id"),
         Index("idx_city_geonames_population", "population"),
         Index("idx_city_geonames_name", "name"),
         Index("idx_city_geonames_asciiname", "asciiname"),
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+
+from geonames.infrastructure.persistence.database.base import GeonamesBase as Base
+
+
+class ImportGenerationModel(Base):
+    """One row per import run that changed the data; readers cache results per generation."""
+
+    __tablename__ = "import_generations"
+
+    generation_id = Column(Integer, primary_key=True, autoincrement=True)
+    command = Column(String(40))
+    completed_at = Column(TIMESTAMP)
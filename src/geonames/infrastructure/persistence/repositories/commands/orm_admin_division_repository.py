@@ -1,6 +1,7 @@
 from typing import Type
 from sqlalchemy.orm import Session
 from geonames.infrastructure.persistence.models.admin_division_model import AdminDivisionModel
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
 from .orm_geoname_repository import OrmGeonameRepository
 
 
@@ -8,7 +9,7 @@ class OrmAdminDivisionRepository(OrmGeonameRepository):
 
     def __init__(self, 
                  session: Session, 
-                 model_class: Type[AdminDivisionModel] = AdminDivisionModel):
-        
-        self.session = session
-        self.model_class = model_class
+                 model_class: Type[AdminDivisionModel] = AdminDivisionModel,
+                 bulk_loader: BaseBulkLoader | None = None):
+
+        super().__init__(session, model_class, bulk_loader)
@@ -1,30 +1,105 @@
-from typing import List, Optional
-from sqlalchemy import text
+from typing import Dict, List, Optional
+from sqlalchemy import delete, text, Table, insert
 from sqlalchemy.orm import Session
 from geonames.domain.entities.alternate_name import AlternateName
 from geonames.domain.repositories.alternate_name_repository import AlternateNameRepository
 from geonames.infrastructure.persistence.models.alternate_name_model import AlternateNameModel
 from geonames.infrastructure.persistence.mappers.alternatename_persistence_mapper import AlternateNamePersistenceMapper
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+from shared.infrastructure.persistence.database.sql_upsert_builder import SqlUpsertBuilder
+from shared.infrastructure.persistence.database.shadow_table_manager import ShadowTableManager
+from shared.infrastructure.persistence.database.table_index_manager import TableIndexManager
 
 
 class OrmAlternateNameRepository(AlternateNameRepository):
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, bulk_loader: BaseBulkLoader | None = None):
         self.session = session
+        self.bulk_loader = bulk_loader
+        self.shadow_table: Table | None = None
     
+    def find_by_id(self, alternate_name_id: int) -> Optional[AlternateName]:
+        record = self.session.get(AlternateNameModel, alternate_name_id)
+        return AlternateNamePersistenceMapper.to_entity(record)
+
+    def find_all(self, filters: Optional[Dict] = None) -> List[AlternateName]:
+        filters = filters or {}
+
+        query = self.session.query(AlternateNameModel)
+
+        if filters.get("geoname_id"):
+            query = query.filter(AlternateNameModel.geoname_id == filters["geoname_id"])
+        if filters.get("iso_language"):
+            query = query.filter(AlternateNameModel.iso_language == filters["iso_language"])
+
+        return [AlternateNamePersistenceMapper.to_entity(m) for m in query.all()]
+
+    def count_all(self) -> int:
+        return self.session.query(AlternateNameModel).count()
+
     def save(self, entity: AlternateName) -> None:
         model = AlternateNamePersistenceMapper.to_model(entity)
         self.session.merge(model)
         self.session.commit()
     
     def bulk_insert(self, entities: List[AlternateName]) -> None:
-        models = [
-            AlternateNamePersistenceMapper.to_model(entity) for entity in entities
-        ]
-        self.session.bulk_save_objects(models)
+        if self.bulk_loader:
+            self.bulk_loader.load(self.session, self._write_table(), entities)
+        elif entities and hasattr(entities[0], "_asdict"):
+            # Import records already hold one value per column: no ORM models needed
+            self.session.execute(insert(self._write_table()), [record._asdict() for record in entities])
+        elif self.shadow_table is not None:
+            models = [AlternateNamePersistenceMapper.to_model(entity) for entity in entities]
+            columns = self.shadow_table.columns
+            rows = [{column.name: getattr(model, column.name) for column in columns} for model in models]
+            self.session.execute(insert(self.shadow_table), rows)
+        else:
+            models = [
+                AlternateNamePersistenceMapper.to_model(entity) for entity in entities
+            ]
+            self.session.bulk_save_objects(models)
+        self.session.commit()
+
+    def bulk_upsert(self, entities: List[AlternateName]) -> None:
+        table = AlternateNameModel.__table__
+        statement = SqlUpsertBuilder.build(self.session.get_bind().dialect.name, table)
+
+        if statement is None:
+            for entity in entities:
+                self.session.merge(AlternateNamePersistenceMapper.to_model(entity))
+        else:
+            rows = [{column.name: getattr(entity, column.name) for column in table.columns} for entity in entities]
+            self.session.execute(statement, rows)
+
+        self.session.commit()
+
+    def delete_by_ids(self, alternate_name_ids: List[int]) -> None:
+        if not alternate_name_ids:
+            return
+        self.session.execute(delete(AlternateNameModel).where(AlternateNameModel.alternate_name_id.in_(alternate_name_ids)))
         self.session.commit()
 
     def truncate(self):
         table_name = AlternateNameModel.__tablename__
         self.session.execute(text(f"TRUNCATE TABLE {table_name}"))
         self.session.commit()
+
+    def drop_secondary_indexes(self) -> None:
+        TableIndexManager(self.session).drop(self._write_table())
+
+    def build_secondary_indexes(self) -> None:
+        TableIndexManager(self.session).build(self._write_table())
+
+    def analyze(self) -> None:
+        TableIndexManager(self.session).analyze(self._write_table())
+
+    def begin_shadow_load(self) -> None:
+        self.shadow_table = ShadowTableManager(self.session).create(AlternateNameModel.__table__)
+
+    def swap_shadow(self) -> None:
+        ShadowTableManager(self.session).swap(AlternateNameModel.__table__)
+        self.shadow_table = None
+
+    def _write_table(self) -> Table:
+        # Bulk inserts and index maintenance target the shadow table while a shadow load is in progress
+        return self.shadow_table if self.shadow_table is not None else AlternateNameModel.__table__
@@ -1,6 +1,7 @@
 from typing import Type
 from sqlalchemy.orm import Session
 from geonames.infrastructure.persistence.models.city_model import CityModel
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
 from .orm_geoname_repository import OrmGeonameRepository
 
 
@@ -8,7 +9,7 @@ class OrmCityRepository(OrmGeonameRepository):
 
     def __init__(self, 
                  session: Session, 
-                 model_class: Type[CityModel] = CityModel):
-        
-        self.session = session
-        self.model_class = model_class
\ No newline at end of file
+                 model_class: Type[CityModel] = CityModel,
+                 bulk_loader: BaseBulkLoader | None = None):
+
+        super().__init__(session, model_class, bulk_loader)
\ No newline at end of file
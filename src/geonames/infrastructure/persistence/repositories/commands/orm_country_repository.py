@@ -1,16 +1,40 @@
 from typing import List, Optional, Dict
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
+from sqlalchemy import func, text, Table, insert
 from geonames.domain.repositories.country_repository import CountryRepository
 from geonames.domain.entities.country import Country
 from geonames.infrastructure.persistence.models.country_model import CountryModel
 from geonames.infrastructure.persistence.mappers.country_persistence_mapper import CountryPersistenceMapper
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+from shared.infrastructure.persistence.database.shadow_table_manager import ShadowTableManager
+from shared.infrastructure.persistence.database.table_index_manager import TableIndexManager
 
 
 class OrmCountryRepository(CountryRepository):
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, bulk_loader: BaseBulkLoader | None = None):
         self.session = session
+        self.bulk_loader = bulk_loader
+        self.shadow_table: Table | None = None
+
+    def find_by_id(self, geoname_id: int) -> Optional[Country]:
+        record = self.session.get(CountryModel, geoname_id)
+        return CountryPersistenceMapper.to_entity(record)
+
+    def find_all(self, filters: Optional[Dict] = None) -> List[Country]:
+        filters = filters or {}
+
+        query = self.session.query(CountryModel)
+
+        if filters.get("iso_alpha2"):
+            query = query.filter(CountryModel.iso_alpha2 == filters["iso_alpha2"])
+        if filters.get("continent"):
+            query = query.filter(CountryModel.continent == filters["continent"])
+
+        return [CountryPersistenceMapper.to_entity(m) for m in query.all()]
+
+    def count_all(self) -> int:
+        return self.session.query(CountryModel).count()
 
     def save(self, entity: Country) -> None:
         model = CountryPersistenceMapper.to_model(entity)
@@ -26,13 +50,44 @@ class OrmCountryRepository(CountryRepository):
         self.session.commit()
     
     def bulk_insert(self, entities: List[Country]) -> None:
-        models = [
-            CountryPersistenceMapper.to_model(entity) for entity in entities
-        ]
-        self.session.bulk_save_objects(models)
+        if self.bulk_loader:
+            self.bulk_loader.load(self.session, self._write_table(), entities)
+        elif entities and hasattr(entities[0], "_asdict"):
+            # Import records already hold one value per column: no ORM models needed
+            self.session.execute(insert(self._write_table()), [record._asdict() for record in entities])
+        elif self.shadow_table is not None:
+            models = [CountryPersistenceMapper.to_model(entity) for entity in entities]
+            columns = self.shadow_table.columns
+            rows = [{column.name: getattr(model, column.name) for column in columns} for model in models]
+            self.session.execute(insert(self.shadow_table), rows)
+        else:
+            models = [
+                CountryPersistenceMapper.to_model(entity) for entity in entities
+            ]
+            self.session.bulk_save_objects(models)
         self.session.commit()
 
     def truncate(self):
         table_name = CountryModel.__tablename__
         self.session.execute(text(f"TRUNCATE TABLE {table_name}"))
         self.session.commit()
+
+    def drop_secondary_indexes(self) -> None:
+        TableIndexManager(self.session).drop(self._write_table())
+
+    def build_secondary_indexes(self) -> None:
+        TableIndexManager(self.session).build(self._write_table())
+
+    def analyze(self) -> None:
+        TableIndexManager(self.session).analyze(self._write_table())
+
+    def begin_shadow_load(self) -> None:
+        self.shadow_table = ShadowTableManager(self.session).create(CountryModel.__table__)
+
+    def swap_shadow(self) -> None:
+        ShadowTableManager(self.session).swap(CountryModel.__table__)
+        self.shadow_table = None
+
+    def _write_table(self) -> Table:
+        # Bulk inserts and index maintenance target the shadow table while a shadow load is in progress
+        return self.shadow_table if self.shadow_table is not None else CountryModel.__table__
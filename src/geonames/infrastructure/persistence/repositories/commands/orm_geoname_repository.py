@@ -1,5 +1,6 @@
-from typing import List, Optional, Dict, Type, TypeVar
-from sqlalchemy import text
+from datetime import datetime
+from typing import Iterator, List, Optional, Dict, Type, TypeVar
+from sqlalchemy import delete, select, text, Table, insert
 from sqlalchemy.orm import Session
 from geonames.domain.repositories.geoname_repository import GeonameRepository
 from geonames.domain.entities.geoname import Geoname
@@ -8,16 +9,23 @@ from geonames.infrastructure.persistence.models.alternate_name_model import Alte
 from geonames.infrastructure.persistence.models.country_model import CountryModel
 from geonames.infrastructure.persistence.models.geoname_model import GeonameModel
 from geonames.infrastructure.persistence.mappers.geoname_persistence_mapper import GeonamePersistenceMapper
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+from shared.infrastructure.persistence.database.sql_upsert_builder import SqlUpsertBuilder
+from shared.infrastructure.persistence.database.shadow_table_manager import ShadowTableManager
+from shared.infrastructure.persistence.database.table_index_manager import TableIndexManager
 
 
 class OrmGeonameRepository(GeonameRepository):
 
     def __init__(self, 
                  session: Session, 
-                 model_class: Type[GeonameModel] = GeonameModel):
+                 model_class: Type[GeonameModel] = GeonameModel,
+                 bulk_loader: BaseBulkLoader | None = None):
         
         self.session = session
         self.model_class = model_class
+        self.bulk_loader = bulk_loader
+        self.shadow_table: Table | None = None
 
     def find_by_id(self, geoname_id: int) -> Optional[Geoname]:
         record = self.session.get(self.model_class, geoname_id)
@@ -145,13 +153,73 @@ class OrmGeonameRepository(GeonameRepository):
     def count_all(self) -> int:
         count = self.session.query(self.model_class).count()
         return count
+
+    def iter_ids(self) -> Iterator[int]:
+        # Streamed with a server-side cursor: the geonames table holds millions of ids
+        statement = select(self.model_class.geoname_id).execution_options(stream_results=True, yield_per=100_000)
+        yield from self.session.scalars(statement)
     
     def bulk_insert(self, entities: List[Geoname]) -> None:
-        models = [GeonamePersistenceMapper.to_model(entity, model_class=self.model_class) for entity in entities]
-        self.session.bulk_save_objects(models)
+        if self.bulk_loader:
+            self.bulk_loader.load(self.session, self._write_table(), entities)
+        elif entities and hasattr(entities[0], "_asdict"):
+            # Import records already hold one value per column: no ORM models needed
+            self.session.execute(insert(self._write_table()), [record._asdict() for record in entities])
+        elif self.shadow_table is not None:
+            models = [GeonamePersistenceMapper.to_model(entity, model_class=self.model_class) for entity in entities]
+            columns = self.shadow_table.columns
+            rows = [{column.name: getattr(model, column.name) for column in columns} for model in models]
+            self.session.execute(insert(self.shadow_table), rows)
+        else:
+            models = [GeonamePersistenceMapper.to_model(entity, model_class=self.model_class) for entity in entities]
+            self.session.bulk_save_objects(models)
+        self.session.commit()
+
+    def bulk_upsert(self, entities: List[Geoname]) -> None:
+        table = self.model_class.__table__
+        statement = SqlUpsertBuilder.build(self.session.get_bind().dialect.name, table, preserve_columns=("created_at",))
+
+        if statement is None:
+            for entity in entities:
+                self.session.merge(GeonamePersistenceMapper.to_model(entity, model_class=self.model_class))
+        else:
+            now = datetime.utcnow()
+            rows = []
+            for entity in entities:
+                row = {column.name: getattr(entity, column.name) for column in table.columns}
+                row["updated_at"] = now
+                rows.append(row)
+            self.session.execute(statement, rows)
+
+        self.session.commit()
+
+    def delete_by_ids(self, geoname_ids: List[int]) -> None:
+        if not geoname_ids:
+            return
+        self.session.execute(delete(self.model_class).where(self.model_class.geoname_id.in_(geoname_ids)))
         self.session.commit()
 
     def truncate(self):
         table_name = self.model_class.__tablename__
         self.session.execute(text(f"TRUNCATE TABLE {table_name}"))
         self.session.commit()
+
+    def drop_secondary_indexes(self) -> None:
+        TableIndexManager(self.session).drop(self._write_table())
+
+    def build_secondary_indexes(self) -> None:
+        TableIndexManager(self.session).build(self._write_table())
+
+    def analyze(self) -> None:
+        TableIndexManager(self.session).analyze(self._write_table())
+
+    def begin_shadow_load(self) -> None:
+        self.shadow_table = ShadowTableManager(self.session).create(self.model_class.__table__)
+
+    def swap_shadow(self) -> None:
+        ShadowTableManager(self.session).swap(self.model_class.__table__)
+        self.shadow_table = None
+
+    def _write_table(self) -> Table:
+        # Bulk inserts and index maintenance target the shadow table while a shadow load is in progress
+        return self.shadow_table if self.shadow_table is not None else self.model_class.__table__
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from geonames.domain.repositories.import_generation_repository import ImportGenerationRepository
+from geonames.infrastructure.persistence.models.import_generation_model import ImportGenerationModel
+
+
+class OrmImportGenerationRepository(ImportGenerationRepository):
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def record(self, command: str) -> int:
+        model = ImportGenerationModel(command=command, completed_at=datetime.utcnow())
+        self.session.add(model)
+        self.session.flush()
+        return model.generation_id
+
+    def current(self) -> Optional[int]:
+        return self.session.scalar(select(func.max(ImportGenerationModel.generation_id)))
@@ -0,0 +1,16 @@
+from typing import Type
+from sqlalchemy.ext.asyncio import AsyncSession
+from geonames.infrastructure.persistence.models.admin_division_model import AdminDivisionModel
+from .async_orm_geoname_query_repository import AsyncOrmGeonameQueryRepository
+from .orm_admin_division_query_repository import OrmAdminDivisionQueryRepository
+
+
+class AsyncOrmAdminDivisionQueryRepository(AsyncOrmGeonameQueryRepository, OrmAdminDivisionQueryRepository):
+    """Async find_all with the admin-division expansions of OrmAdminDivisionQueryRepository."""
+
+    def __init__(self, 
+                 session: AsyncSession, 
+                 model_class: Type[AdminDivisionModel] = AdminDivisionModel):
+        
+        self.session = session
+        self.model_class = model_class
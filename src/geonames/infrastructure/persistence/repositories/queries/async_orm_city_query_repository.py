@@ -0,0 +1,14 @@
+from typing import Type
+from sqlalchemy.ext.asyncio import AsyncSession
+from geonames.infrastructure.persistence.models.city_model import CityModel
+from .async_orm_geoname_query_repository import AsyncOrmGeonameQueryRepository
+
+
+class AsyncOrmCityQueryRepository(AsyncOrmGeonameQueryRepository):
+
+    def __init__(self, 
+                 session: AsyncSession, 
+                 model_class: Type[CityModel] = CityModel):
+        
+        self.session = session
+        self.model_class = model_class
@@ -0,0 +1,15 @@
+from typing import List, Optional, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from geonames.infrastructure.persistence.models.country_model import CountryModel
+from .orm_country_query_repository import OrmCountryQueryRepository
+
+
+class AsyncOrmCountryQueryRepository(OrmCountryQueryRepository):
+    """Runs the statements built by OrmCountryQueryRepository on an AsyncSession."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_all(self, filters: Optional[Dict] = None) -> List[CountryModel]:
+        result = await self.session.scalars(self.build_statement(filters))
+        return result.all()
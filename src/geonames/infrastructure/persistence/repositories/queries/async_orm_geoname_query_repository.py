@@ -0,0 +1,20 @@
+from typing import List, Optional, Dict, Type
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from geonames.infrastructure.persistence.models.geoname_model import GeonameModel
+from .orm_geoname_query_repository import OrmGeonameQueryRepository
+
+
+class AsyncOrmGeonameQueryRepository(OrmGeonameQueryRepository):
+    """Runs the statements built by OrmGeonameQueryRepository on an AsyncSession."""
+
+    def __init__(self, 
+                 session: AsyncSession, 
+                 model_class: Type[GeonameModel] = GeonameModel):
+        
+        self.session = session
+        self.model_class = model_class
+
+    async def find_all(self, filters: Optional[Dict] = None) -> List[Row]:
+        result = await self.session.execute(self.build_statement(filters))
+        return result.all()
@@ -0,0 +1,13 @@
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from geonames.infrastructure.persistence.models.import_generation_model import ImportGenerationModel
+
+
+class AsyncOrmImportGenerationQueryRepository:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def current(self) -> Optional[int]:
+        return await self.session.scalar(select(func.max(ImportGenerationModel.generation_id)))
@@ -1,5 +1,6 @@
 from typing import Type, Dict
-from sqlalchemy.orm import Session, Query
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
 from geonames.application.services.geoname_query_expansion_helper import GeonameQueryExpansionHelper
 from geonames.infrastructure.persistence.models.admin_division_model import AdminDivisionModel
 from .orm_geoname_query_repository import OrmGeonameQueryRepository
@@ -17,7 +18,7 @@ class OrmAdminDivisionQueryRepository(OrmGeonameQueryRepository):
     def _find_all(self, filters: dict):
         return super().find_all(filters)
     
-    def _apply_expansions(self, filters: Dict, query: Query) -> Query:
+    def _apply_expansions(self, filters: Dict, query: Select) -> Select:
 
         expand = filters.get("expand")
         if not expand:
@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
+from sqlalchemy import Select, select
 from geonames.application.ports.query_repository_port import QueryRepositoryPort
 from geonames.domain.entities.country import Country
 from geonames.infrastructure.persistence.models.country_model import CountryModel
@@ -13,9 +13,14 @@ class OrmCountryQueryRepository(QueryRepositoryPort):
         self.session = session
 
     def find_all(self, filters: Optional[Dict] = None) -> List[Country]:
+        models = self.session.scalars(self.build_statement(filters)).all()
+        return models
+
+    def build_statement(self, filters: Optional[Dict] = None) -> Select:
+        """The SELECT for filters, shared by the sync and async repositories."""
         filters = filters or {}
 
-        query = self.session.query(CountryModel)
+        query = select(CountryModel)
 
         if "iso_alpha2" in filters and filters["iso_alpha2"]:
             query = query.filter(CountryModel.iso_alpha2 == filters["iso_alpha2"])
@@ -32,5 +37,4 @@ class OrmCountryQueryRepository(QueryRepositoryPort):
         if "currency_code" in filters and filters["currency_code"]:
             query = query.filter(CountryModel.currency_code == filters["currency_code"])
 
-        models = query.all()
-        return models
\ No newline at end of file
+        return query
\ No newline at end of file
@@ -1,5 +1,6 @@
-from typing import List, Optional, Dict, Set, Type, cast
-from sqlalchemy.orm import Session, Query
+from typing import List, Optional, Dict, Set, Type
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import Session
 from geonames.application.ports.query_repository_port import QueryRepositoryPort
 from geonames.infrastructure.persistence.models.admin_division_model import AdminDivisionModel
 from geonames.infrastructure.persistence.models.geoname_model import GeonameModel
@@ -17,9 +18,14 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
         self.model_class = model_class
 
     def find_all(self, filters: Optional[Dict] = None) -> List[GeonameModel]:
+        models = self.session.execute(self.build_statement(filters)).all()
+        return models
+
+    def build_statement(self, filters: Optional[Dict] = None) -> Select:
+        """The SELECT for filters, shared by the sync and async repositories."""
         filters = filters or {}
 
-        query = self.session.query(*self._get_basic_fields())
+        query = select(*self._get_basic_fields())
                 
         query = self._apply_expansions(filters, query)
 
@@ -27,8 +33,7 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
 
         query = self._apply_pagination(filters, query)
 
-        models = cast(Query, query).all()
-        return models
+        return query
 
     def _get_basic_fields(self):
         return (
@@ -47,7 +52,7 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
             self.model_class.timezone
         )
     
-    def _apply_basic_filters(self, filters: Dict, query: Query) -> Query:
+    def _apply_basic_filters(self, filters: Dict, query: Select) -> Select:
 
         if filters.get("country_code"):
             query = query.filter(self.model_class.country_code == filters["country_code"])
@@ -78,7 +83,18 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
 
         return query
 
-    def _apply_pagination(self, filters: Dict, query: Query) -> Query:
+    def _apply_pagination(self, filters: Dict, query: Select) -> Select:
+
+        if not (filters.get("limit") or filters.get("offset") or filters.get("after")):
+            return query
+
+        # A total order, so pages neither overlap nor skip rows; the (..., population, geoname_id) indexes serve it backwards
+        query = query.order_by(self.model_class.population.desc(), self.model_class.geoname_id.desc())
+
+        if filters.get("after"):
+            # Keyset: continue right after the last row of the previous page instead of skipping offset rows
+            population, geoname_id = filters["after"]
+            query = query.filter(tuple_(self.model_class.population, self.model_class.geoname_id) < tuple_(population, geoname_id))
 
         if filters.get("limit"):
             query = query.limit(filters["limit"])
@@ -88,7 +104,7 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
 
         return query
     
-    def _apply_expansions(self, filters: Dict, query: Query) -> Query:
+    def _apply_expansions(self, filters: Dict, query: Select) -> Select:
 
         expand = filters.get("expand")
         if not expand:
@@ -108,7 +124,7 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
         return query
 
 
-    def _expand_country(self, query: Query, fields: Set[str]) -> Query:
+    def _expand_country(self, query: Select, fields: Set[str]) -> Select:
 
         query = query.outerjoin(
             CountryModel,
@@ -123,7 +139,7 @@ class OrmGeonameQueryRepository(QueryRepositoryPort):
 
         return query
     
-    def _expand_admin1(self, query: Query, fields: Set[str]) -> Query:
+    def _expand_admin1(self, query: Select, fields: Set[str]) -> Select:
 
         query = query.outerjoin(
             AdminDivisionModel,
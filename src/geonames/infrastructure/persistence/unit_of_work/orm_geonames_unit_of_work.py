@@ -11,7 +11,9 @@ class OrmGeonamesUnitOfWork(GeonamesUnitOfWorkPort):
                  country_repo_cls, 
                  geoname_alternatename_repo_cls, 
                  admin_division_repo_cls, 
-                 city_repo_cls):
+                 city_repo_cls,
+                 import_generation_repo_cls=None,
+                 bulk_loader=None):
         
         self._session_factory = session_factory
         self._geoname_repo_cls = geoname_repo_cls
@@ -19,6 +21,8 @@ class OrmGeonamesUnitOfWork(GeonamesUnitOfWorkPort):
         self._geoname_alternatename_repo_cls = geoname_alternatename_repo_cls
         self._admin_division_repo_cls = admin_division_repo_cls
         self._city_repo_cls = city_repo_cls
+        self._import_generation_repo_cls = import_generation_repo_cls
+        self._bulk_loader = bulk_loader
 
         self.session = None
         self.geoname_repo = None
@@ -26,14 +30,17 @@ class OrmGeonamesUnitOfWork(GeonamesUnitOfWorkPort):
         self.geoname_alternatename_repo = None
         self.admin_division_repo = None
         self.city_repo = None
+        self.import_generation_repo = None
 
     def __enter__(self):
         self.session = self._session_factory()
-        self.geoname_repo = self._geoname_repo_cls(self.session)
-        self.country_repo = self._country_repo_cls(self.session)
-        self.geoname_alternatename_repo = self._geoname_alternatename_repo_cls(self.session)
-        self.admin_division_repo = self._admin_division_repo_cls(self.session)
-        self.city_repo = self._city_repo_cls(self.session)
+        self.geoname_repo = self._geoname_repo_cls(self.session, bulk_loader=self._bulk_loader)
+        self.country_repo = self._country_repo_cls(self.session, bulk_loader=self._bulk_loader)
+        self.geoname_alternatename_repo = self._geoname_alternatename_repo_cls(self.session, bulk_loader=self._bulk_loader)
+        self.admin_division_repo = self._admin_division_repo_cls(self.session, bulk_loader=self._bulk_loader)
+        self.city_repo = self._city_repo_cls(self.session, bulk_loader=self._bulk_loader)
+        if self._import_generation_repo_cls:
+            self.import_generation_repo = self._import_generation_repo_cls(self.session)
 
         return self
 
@@ -65,6 +72,7 @@ class OrmGeonamesUnitOfWorkFactory(UnitOfWorkFactoryPort):
         from geonames.infrastructure.persistence.repositories.commands.orm_country_repository import OrmCountryRepository
         from geonames.infrastructure.persistence.repositories.commands.orm_admin_division_repository import OrmAdminDivisionRepository
         from geonames.infrastructure.persistence.repositories.commands.orm_city_repository import OrmCityRepository
+        from geonames.infrastructure.persistence.repositories.commands.orm_import_generation_repository import OrmImportGenerationRepository
 
         return OrmGeonamesUnitOfWork(
             session_factory=self.connector.get_session,
@@ -73,4 +81,6 @@ class OrmGeonamesUnitOfWorkFactory(UnitOfWorkFactoryPort):
             geoname_alternatename_repo_cls=OrmAlternateNameRepository,
             admin_division_repo_cls=OrmAdminDivisionRepository,
             city_repo_cls=OrmCityRepository,
+            import_generation_repo_cls=OrmImportGenerationRepository,
+            bulk_loader=self.connector.get_bulk_loader(),
         )
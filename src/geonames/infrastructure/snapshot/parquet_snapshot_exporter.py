@@ -0,0 +1,52 @@
+import os
+
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from geonames.application.ports.snapshot_exporter_port import SnapshotExporterPort
+from geonames.infrastructure.persistence.database.base import GeonamesBase
+from geonames.infrastructure.snapshot.parquet_support import arrow_schema, require_pyarrow
+
+
+class ParquetSnapshotExporter(SnapshotExporterPort):
+    """
+    Streams tables into <directory>/<table>.parquet, one row group per
+    row_group_size rows read from a server-side cursor, so a table never has to
+    fit in memory. Files are written next to their target and renamed into place.
+    """
+
+    def __init__(self, engine: Engine, directory: str | Path, row_group_size: int | None = None):
+        self.engine = engine
+        self.directory = Path(directory)
+        self.row_group_size = row_group_size or int(os.getenv("SNAPSHOT_ROW_GROUP_SIZE", "100000"))
+        self.compression = os.getenv("SNAPSHOT_COMPRESSION", "zstd")
+
+    def export(self, table_name: str) -> int:
+
+        pa = require_pyarrow()
+        table = GeonamesBase.metadata.tables[table_name]
+        schema = arrow_schema(table)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{table_name}.parquet"
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        statement = select(table).order_by(*table.primary_key.columns)
+        rows = 0
+
+        with self.engine.connect() as connection, \
+                pa.parquet.ParquetWriter(tmp_path, schema, compression=self.compression) as writer:
+
+            result = connection.execution_options(stream_results=True, yield_per=self.row_group_size).execute(statement)
+
+            for partition in result.partitions():
+                columns = list(zip(*partition))
+                arrays = [pa.array(values, type=field.type) for values, field in zip(columns, schema)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=self.row_group_size)
+                rows += len(partition)
+
+        os.replace(tmp_path, path)
+
+        return rows
@@ -0,0 +1,119 @@
+import os
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterator
+
+from geonames.application.ports.geoname_importer_port import GeonameImporterPort, ImportBatch
+from geonames.application.services.import_metrics import ImportMetrics
+from geonames.infrastructure.snapshot.parquet_support import require_pyarrow
+from shared.application.ports.logger_port import LoggerPort
+from shared.infrastructure.adapters.json_file_state_store import JsonFileStateStore
+
+
+class ParquetSnapshotImporter(GeonameImporterPort[Any]):
+    """
+    Loads a table from a Parquet snapshot written by ParquetSnapshotExporter.
+
+    Values come back typed, so there is no text parsing or mapping: each row is
+    a named tuple in the file's column order, which the bulk loaders write as is.
+    Positions are row offsets into the file.
+    """
+
+    def __init__(self, path: str | Path, logger: LoggerPort | None = None, batch_size: int | None = None):
+        self.path = Path(path)
+        self.logger = logger
+        self.metrics: ImportMetrics | None = None
+        self.batch_size = batch_size or int(os.getenv("SNAPSHOT_ROW_GROUP_SIZE", "100000"))
+
+        self.resume_offset = 0
+        self._rows_read = 0
+        self._source_signature: Dict[str, Any] | None = None
+
+        # Signature of the snapshot whose import last completed; kept in TEMP_PATH as snapshots may be read-only
+        temp_path = Path(os.getenv("TEMP_PATH", "./tmp"))
+        self.imported_marker = JsonFileStateStore(temp_path / f"{self.path.name}.imported.json")
+
+    def ensure_data_is_available(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Snapshot not found: {self.path}")
+
+    def count_total_records(self) -> int:
+
+        if not self.path.exists():
+            return 0
+
+        pa = require_pyarrow()
+        return pa.parquet.ParquetFile(self.path).metadata.num_rows
+
+    def load_entities(self) -> Generator[Any, None, None]:
+
+        for batch in self.read_batches(self.batch_size):
+            for record in batch.items:
+                self._rows_read += 1
+                yield record
+
+    def read_batches(self, batch_size: int) -> Iterator[ImportBatch]:
+
+        pa = require_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(self.path)
+        record_type = namedtuple("SnapshotRecord", parquet_file.schema_arrow.names)
+
+        self._source_signature = self.source_signature()
+        self._rows_read = self.resume_offset
+        start = 0
+
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size):
+            end = start + record_batch.num_rows
+
+            if end <= self.resume_offset:
+                start = end
+                continue
+            if start < self.resume_offset:
+                record_batch = record_batch.slice(self.resume_offset - start)
+            start = end
+
+            columns = [column.to_pylist() for column in record_batch.columns]
+            records = list(map(record_type._make, zip(*columns)))
+
+            yield ImportBatch(records, self._position_at(end), mapped=True)
+
+    def map_batch(self, batch: ImportBatch) -> ImportBatch:
+        return batch
+
+    def set_metrics(self, metrics: ImportMetrics) -> None:
+        # Typed rows are never rejected and nothing is downloaded: the use case measures the rest
+        self.metrics = metrics
+
+    def cleanup(self) -> None:
+        pass
+
+    def source_signature(self) -> Dict[str, Any]:
+        stat = os.stat(self.path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def resume_from(self, position: Dict[str, Any] | None) -> bool:
+
+        self.resume_offset = 0
+
+        if not position or not self.path.exists() or position.get("source") != self.source_signature():
+            return False
+
+        self.resume_offset = int(position["offset"])
+        return True
+
+    def current_position(self) -> Dict[str, Any] | None:
+
+        if self._source_signature is None:
+            return None
+
+        return self._position_at(self._rows_read)
+
+    def _position_at(self, offset: int) -> Dict[str, Any]:
+        return {"offset": offset, "skip": 0, "source": self._source_signature}
+
+    def is_up_to_date(self) -> bool:
+        return self.path.exists() and self.imported_marker.get("source") == self.source_signature()
+
+    def mark_imported(self) -> None:
+        self.imported_marker.set("source", self.source_signature())
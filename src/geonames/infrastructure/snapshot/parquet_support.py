@@ -0,0 +1,43 @@
+from typing import Any
+
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Float, Integer, Numeric, Table
+
+
+def require_pyarrow() -> Any:
+    """Import pyarrow on first use, so it is only needed by the snapshot commands."""
+
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Parquet snapshots require pyarrow: pip install pyarrow") from e
+
+    return pyarrow
+
+
+def arrow_schema(table: Table) -> Any:
+    """Typed Arrow schema for table, with the columns in table order."""
+
+    pa = require_pyarrow()
+    return pa.schema([pa.field(column.name, _arrow_type(pa, column.type), nullable=column.nullable) for column in table.columns])
+
+
+def _arrow_type(pa: Any, column_type: Any) -> Any:
+
+    # Subclasses first: BigInteger is an Integer, Float is a Numeric
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, BigInteger):
+        return pa.int64()
+    if isinstance(column_type, Integer):
+        return pa.int32()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision or 38, column_type.scale or 0)
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+
+    return pa.string()
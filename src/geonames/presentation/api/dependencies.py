@@ -1,23 +1,98 @@
 import os
 
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import Depends
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from geonames.application.services.country_query_service import CountryQueryService
 from geonames.application.services.admin_division_query_service import AdminDivisionQueryService
 from geonames.application.services.city_query_service import CityQueryService
-from geonames.infrastructure.persistence.repositories.queries.orm_city_query_repository import OrmCityQueryRepository
-from geonames.infrastructure.persistence.repositories.queries.orm_country_query_repository import OrmCountryQueryRepository
-from geonames.infrastructure.persistence.repositories.queries.orm_admin_division_query_repository import OrmAdminDivisionQueryRepository
-from shared.infrastructure.persistence.database.database_connection_factory import DatabaseConnectionFactory
+from geonames.application.services.query_result_cache import QueryResultCache
+from geonames.infrastructure.persistence.repositories.queries.async_orm_city_query_repository import AsyncOrmCityQueryRepository
+from geonames.infrastructure.persistence.repositories.queries.async_orm_country_query_repository import AsyncOrmCountryQueryRepository
+from geonames.infrastructure.persistence.repositories.queries.async_orm_admin_division_query_repository import AsyncOrmAdminDivisionQueryRepository
+from geonames.infrastructure.persistence.repositories.queries.async_orm_import_generation_query_repository import AsyncOrmImportGenerationQueryRepository
+from shared.infrastructure.adapters.shared_memory_response_cache import SharedMemoryResponseCache
+from shared.infrastructure.persistence.database.async_database_connection_factory import AsyncDatabaseConnectionFactory
 
 
 db_url = os.getenv("DATABASE_URL")
-db_connector = DatabaseConnectionFactory(db_url)
+# API workers size their pool from API_DB_POOL_* (falling back to DB_POOL_*)
+db_connector = AsyncDatabaseConnectionFactory(db_url, role="api")
+
+
+async def current_import_generation() -> Optional[int]:
+    try:
+        async with db_connector.get_session() as session:
+            return await AsyncOrmImportGenerationQueryRepository(session).current()
+    except (SQLAlchemyError, OSError):
+        # e.g. a schema not yet created by an import, or a database the driver cannot reach (asyncpg
+        # raises a bare OSError): the caches then only expire by TTL, and cached responses are still served
+        return None
+
+def build_query_cache() -> QueryResultCache | None:
+
+    # QUERY_CACHE_MAX_MB caps the JSON size of the cached results, not the worker's memory; 0 disables result caching
+    max_mb = float(os.getenv("QUERY_CACHE_MAX_MB", "64"))
+    if max_mb <= 0:
+        return None
+
+    return QueryResultCache(
+        max_entries=int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "10000")),
+        max_bytes=int(max_mb * 1024 * 1024),
+        ttl_seconds=float(os.getenv("QUERY_CACHE_TTL_SECONDS", "300")),
+        generation_source=current_import_generation,
+        generation_check_seconds=float(os.getenv("QUERY_CACHE_GENERATION_CHECK_SECONDS", "5")),
+    )
+
+# One cache per worker process, shared by every request
+query_cache = build_query_cache()
+
+def build_response_cache() -> SharedMemoryResponseCache | None:
+
+    # RESPONSE_CACHE_MB > 0 shares serialized responses between all API workers of the host. Every
+    # RESPONSE_CACHE_SLOT_KB class needs an equal share holding 8 slots: classes that do not fit are
+    # dropped, largest first, so with the defaults 512 KB payloads are cached from about 13 MB
+    size_mb = float(os.getenv("RESPONSE_CACHE_MB", "0"))
+    if size_mb <= 0:
+        return None
+
+    default_dir = Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(os.getenv("TEMP_PATH", "./tmp"))
+    # The cache appends its layout to this name: workers configured differently never share a file
+    path = Path(os.getenv("RESPONSE_CACHE_PATH") or default_dir / "geonames_response_cache")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return SharedMemoryResponseCache(
+        path=path,
+        size_bytes=int(size_mb * 1024 * 1024),
+        slot_sizes=tuple(int(kb) * 1024 for kb in os.getenv("RESPONSE_CACHE_SLOT_KB", "8,64,512").split(",")),
+    )
+
+response_cache = build_response_cache()
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """One session per request, shared by every service the request uses; its connection is returned when the request ends."""
+    async with db_connector.get_session() as session:
+        yield session
+
+def get_country_query_service(session: AsyncSession = Depends(get_session)) -> CountryQueryService:
+    return CountryQueryService(country_query_repo=AsyncOrmCountryQueryRepository(session), cache=query_cache)
+
+def get_admin_division_query_service(session: AsyncSession = Depends(get_session)) -> AdminDivisionQueryService:
+    return AdminDivisionQueryService(admin_division_query_repo=AsyncOrmAdminDivisionQueryRepository(session), cache=query_cache)
 
+def get_city_query_service(session: AsyncSession = Depends(get_session)) -> CityQueryService:
+    return CityQueryService(city_query_repo=AsyncOrmCityQueryRepository(session), cache=query_cache)
 
-def get_country_query_service() -> CountryQueryService:
-    return CountryQueryService(country_query_repo=OrmCountryQueryRepository(db_connector.get_session()))
+def get_pool_stats() -> dict:
+    return db_connector.pool_stats()
 
-def get_admin_division_query_service() -> AdminDivisionQueryService:
-    return AdminDivisionQueryService(admin_division_query_repo=OrmAdminDivisionQueryRepository(db_connector.get_session()))
+def get_query_cache_stats() -> dict:
+    return query_cache.stats() if query_cache else {"enabled": False}
 
-def get_city_query_service() -> CityQueryService:
-    return CityQueryService(city_query_repo=OrmCityQueryRepository(db_connector.get_session()))
\ No newline at end of file
+def get_response_cache_stats() -> dict:
+    return response_cache.stats() if response_cache else {"enabled": False}
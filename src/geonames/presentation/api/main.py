@@ -1,7 +1,22 @@
+import os
+
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 
+from geonames.presentation.api.dependencies import current_import_generation, db_connector, response_cache
 from geonames.presentation.api.rest import routes
+from geonames.presentation.api.shared_response_cache_middleware import SharedResponseCacheMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the async engine's pooled connections on shutdown
+    await db_connector.dispose()
+    if response_cache:
+        response_cache.close()
 
 
 def create_app() -> FastAPI:
@@ -10,11 +25,23 @@ def create_app() -> FastAPI:
         title="GeoNames API",
         version="1.0",
         debug=True,
+        lifespan=lifespan,
     )
 
     # REST routes
     app.include_router(routes.router)
 
+    # Listings are served from the host-wide response cache when it is enabled
+    if response_cache:
+        app.add_middleware(
+            SharedResponseCacheMiddleware,
+            cache=response_cache,
+            path_prefixes=("/countries",),
+            ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300")),
+            generation_source=current_import_generation,
+            generation_check_seconds=float(os.getenv("QUERY_CACHE_GENERATION_CHECK_SECONDS", "5")),
+        )
+
     # Root endpoint
     @app.get("/", include_in_schema=False)
     def root():
@@ -1,6 +1,7 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
+from geonames.application.exceptions.invalid_cursor_error import InvalidCursorError
 from geonames.application.services.city_query_service import CityQueryService
 from geonames.application.services.admin_division_query_service import AdminDivisionQueryService
 from geonames.application.services.country_query_service import CountryQueryService
@@ -9,13 +10,16 @@ from ..dependencies import (
     get_country_query_service,
     get_admin_division_query_service,
     get_city_query_service,
+    get_pool_stats,
+    get_query_cache_stats,
+    get_response_cache_stats,
 )
 
 
 router = APIRouter()
 
 @router.get("/countries", tags=["countries"])
-def get_countries(
+async def get_countries(
     country_query_service: CountryQueryService = Depends(get_country_query_service),
     iso_alpha2: Optional[str] = Query(None, min_length=2, max_length=2, regex="^(?i)[A-Z]{2}$"),
     continent: Optional[str] = Query(None, min_length=2, max_length=2, regex="^(?i)[A-Z]{2}$"),
@@ -32,16 +36,17 @@ def get_countries(
         "currency_code": currency_code.upper() if currency_code else None,
     }
 
-    dtos = country_query_service.list_countries(filters)
+    dtos = await country_query_service.list_countries(filters)
     return dtos
     
 @router.get("/countries/{country_code}/admin-divisions", tags=["admin-divisions"])
-def get_admin_divisions_by_country(
+async def get_admin_divisions_by_country(
     admin_division_query_service: AdminDivisionQueryService = Depends(get_admin_division_query_service),
     country_code: str = Path(..., min_length=2, max_length=2, regex="^(?i)[A-Z]{2}$"),
     feature_code: Optional[str] = Query(None, min_length=4, max_length=4, regex="^(?i)ADM[1-4]$"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=100, description="next_cursor of the previous page; replaces offset"),
     expand: Optional[str] = Query(None),
 ):
 
@@ -50,14 +55,19 @@ def get_admin_divisions_by_country(
         "feature_code": feature_code, 
         "limit": limit, 
         "offset": offset,
+        "cursor": cursor,
         "expand": expand.split(",") if expand else None,
     }
 
-    dtos = admin_division_query_service.list_admin_divisions(filters)
-    return dtos
+    try:
+        page = await admin_division_query_service.list_admin_divisions(filters)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return page
 
 @router.get("/countries/{country_code}/cities", tags=["cities"])
-def get_cities_by_country(
+async def get_cities_by_country(
     city_query_service: CityQueryService = Depends(get_city_query_service),
     country_code: str = Path(..., min_length=2, max_length=2, regex="^(?i)[A-Z]{2}$"),
     admin1_code: Optional[str] = Query(None, min_length=1, max_length=10),
@@ -66,6 +76,7 @@ def get_cities_by_country(
     language: Optional[str] = Query(None, min_length=2, max_length=7, regex="^(?i)[a-z]{2}(-[A-Z]{2})?$"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=100, description="next_cursor of the previous page; replaces offset"),
     expand: Optional[str] = Query(None),
 ):
 
@@ -77,8 +88,28 @@ def get_cities_by_country(
         "language": language.lower() if language else None,
         "limit": limit, 
         "offset": offset,
+        "cursor": cursor,
         "expand": expand.split(",") if expand else None,
     }
 
-    dtos = city_query_service.list_cities(filters)
-    return dtos
+    try:
+        page = await city_query_service.list_cities(filters)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return page
+
+@router.get("/stats/db-pool", tags=["monitoring"])
+async def get_db_pool_stats(stats: dict = Depends(get_pool_stats)):
+    """Connection pool occupancy and checkout waits of this worker, to size pools against the DB connection limit."""
+    return stats
+
+@router.get("/stats/query-cache", tags=["monitoring"])
+async def get_query_cache(stats: dict = Depends(get_query_cache_stats)):
+    """Hits, misses, evictions and size of this worker's query result cache."""
+    return stats
+
+@router.get("/stats/response-cache", tags=["monitoring"])
+async def get_response_cache(stats: dict = Depends(get_response_cache_stats)):
+    """Entries of the host-wide response cache and this worker's hits and misses."""
+    return stats
@@ -0,0 +1,102 @@
+import time
+
+from typing import Awaitable, Callable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from shared.application.ports.response_cache_port import ResponseCachePort
+
+
+class SharedResponseCacheMiddleware:
+    """
+    ASGI middleware serving GET responses of the listing routes from a cache
+    shared by every worker of the host, so a hot query is computed once per host
+    rather than once per worker.
+
+    Only 200 JSON responses are stored, keyed on the path and the sorted query
+    string. The import generation is polled at most every
+    generation_check_seconds (by any worker) and written to the shared cache,
+    which invalidates every worker's view at once.
+    """
+
+    def __init__(self,
+                 app,
+                 cache: ResponseCachePort,
+                 path_prefixes: Tuple[str, ...],
+                 ttl_seconds: float = 300.0,
+                 generation_source: Optional[Callable[[], Awaitable[Optional[int]]]] = None,
+                 generation_check_seconds: float = 5.0):
+
+        self.app = app
+        self.cache = cache
+        self.path_prefixes = path_prefixes
+        self.ttl_seconds = ttl_seconds
+        self.generation_source = generation_source
+        self.generation_check_seconds = generation_check_seconds
+        self._next_generation_check = 0.0
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or scope["method"] != "GET" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        await self._refresh_generation()
+
+        key = self._key(scope)
+        body = self.cache.get(key)
+
+        if body is not None:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-cache", b"HIT"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        generation = self.cache.get_generation()
+        cacheable = False
+        chunks = []
+
+        async def capture(message):
+            nonlocal cacheable
+
+            if message["type"] == "http.response.start":
+                headers = dict(message.get("headers", []))
+                cacheable = message["status"] == 200 and headers.get(b"content-type", b"").startswith(b"application/json")
+                message = {**message, "headers": [*message.get("headers", []), (b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body" and cacheable:
+                chunks.append(message.get("body", b""))
+
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+        # Not stored when an import generation began meanwhile: the body may predate it
+        if cacheable and generation == self.cache.get_generation():
+            self.cache.set(key, b"".join(chunks), self.ttl_seconds)
+
+    async def _refresh_generation(self) -> None:
+
+        if self.generation_source is None:
+            return
+
+        now = time.monotonic()
+        if now < self._next_generation_check:
+            return
+
+        # Set before awaiting so concurrent requests do not all poll
+        self._next_generation_check = now + self.generation_check_seconds
+        generation = await self.generation_source()
+
+        if generation is not None:
+            self.cache.set_generation(generation)
+
+    @staticmethod
+    def _key(scope) -> str:
+        query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        return f"{scope['path']}?{urlencode(sorted(query))}"
@@ -1,19 +1,160 @@
+import os
+
+from pathlib import Path
+
 from shared.infrastructure.adapters.tqdm_progress_bar import TqdmProgressBar
 from shared.infrastructure.adapters.file_downloader import FileDownloader
+from geonames.application.services.geoname_sink_predicates import GeonameSinkPredicates
 from geonames.infrastructure.file_importer.mappers.country_file_row_mapper import CountryFileRowMapper
 from geonames.infrastructure.file_importer.mappers.geoname_file_row_importer import GeonameFileRowMapper
 from geonames.infrastructure.file_importer.mappers.alternate_name_file_row_mapper import AlternateNameFileRowMapper
+from geonames.infrastructure.file_importer.mappers.geoname_record_file_row_mapper import GeonameRecordFileRowMapper
+from geonames.infrastructure.file_importer.mappers.alternate_name_record_file_row_mapper import AlternateNameRecordFileRowMapper
 from geonames.infrastructure.file_importer.geoname_file_importer import GeonameFileImporter
 from geonames.infrastructure.file_importer.countries_file_importer import CountriesFileImporter
-from geonames.infrastructure.file_importer.admin_file_importer import AdminDivisionFileImporter
 from geonames.infrastructure.file_importer.city_file_importer import CityFileImporter
 from geonames.infrastructure.file_importer.alternate_name_file_importer import AlternateNameFileImporter
+from geonames.infrastructure.file_importer.delta_file_importer_factory import DeltaFileImporterFactory
+from geonames.infrastructure.file_importer.filters.alternate_name_row_filter import AlternateNameRowFilter
+from geonames.infrastructure.file_importer.filters.geoname_id_bitmap import GeonameIdBitmap
+from geonames.infrastructure.snapshot.parquet_snapshot_importer import ParquetSnapshotImporter
+
+# Tables carried by a snapshot, in load order, with the unit-of-work repository that writes each one
+SNAPSHOT_TABLES = {
+    "countries": "country_repo",
+    "admin_divisions": "admin_division_repo",
+    "cities": "city_repo",
+    "geonames": "geoname_repo",
+    "alternate_names": "geoname_alternatename_repo",
+}
+
+
+def build_all_countries_sinks():
+    """Sink configuration for rows of allCountries."""
+
+    # When set, cities are routed from allCountries instead of being imported from cities500
+    cities_min_population = os.getenv("FAN_OUT_CITIES_MIN_POPULATION")
+
+    sinks = [
+        {
+            "name": "admin_divisions",
+            "repository_attr": "admin_division_repo",
+            "predicate": GeonameSinkPredicates.is_admin_division,
+        },
+        {
+            "name": "geonames",
+            "repository_attr": "geoname_repo",
+            "predicate": None,
+        },
+    ]
+
+    if cities_min_population:
+        sinks.append({
+            "name": "cities",
+            "repository_attr": "city_repo",
+            "predicate": GeonameSinkPredicates.is_populated_place(int(cities_min_population)),
+        })
+
+    return sinks
+
+
+def build_delta_sinks():
+    """
+    Sink configuration for the daily modification files: the allCountries sinks,
+    plus cities when they are imported from cities500, selected as that file is.
+    """
+
+    sinks = build_all_countries_sinks()
+
+    if not any(sink["name"] == "cities" for sink in sinks):
+        sinks.append({
+            "name": "cities",
+            "repository_attr": "city_repo",
+            "predicate": GeonameSinkPredicates.is_populated_place(CityFileImporter.MIN_POPULATION, admin_seats=True),
+        })
+
+    return sinks
+
+
+def build_alternate_name_row_filter() -> AlternateNameRowFilter | None:
+    """Alternate-name filters configured in the environment, or None when every row is imported."""
+
+    # ALTERNATE_NAMES_LANGUAGES=en,de,fr keeps those languages; an empty entry ("en,de,") keeps names without a language
+    languages = os.getenv("ALTERNATE_NAMES_LANGUAGES")
+    exclude_links = os.getenv("ALTERNATE_NAMES_EXCLUDE_LINKS", "false").lower() in ("1", "true", "yes")
+    exclude_colloquial = os.getenv("ALTERNATE_NAMES_EXCLUDE_COLLOQUIAL", "false").lower() in ("1", "true", "yes")
+    exclude_historic = os.getenv("ALTERNATE_NAMES_EXCLUDE_HISTORIC", "false").lower() in ("1", "true", "yes")
+
+    if languages is None and not (exclude_links or exclude_colloquial or exclude_historic or _known_geonames_only()):
+        return None
+
+    return AlternateNameRowFilter(
+        languages=[language.strip() for language in languages.split(",")] if languages is not None else None,
+        exclude_links=exclude_links,
+        exclude_colloquial=exclude_colloquial,
+        exclude_historic=exclude_historic,
+    )
+
+
+def build_delta_importer_factory(file_downloader, uow, logger=None, base_url: str | None = None) -> DeltaFileImporterFactory:
+    """Importers of the daily delta files, with alternate names filtered as the full import filters them."""
+
+    alternate_name_filter = build_alternate_name_row_filter()
+    prepare = None
+
+    # Rebuilt every day, after that day's geoname modifications and deletes are applied
+    if _known_geonames_only():
+        restrict = _restrict_to_loaded_geonames(alternate_name_filter, logger)
+        prepare = lambda: restrict(uow)
+
+    return DeltaFileImporterFactory(
+        file_downloader,
+        logger=logger,
+        base_url=base_url,
+        alternate_name_filter=alternate_name_filter,
+        prepare_alternate_name_filter=prepare,
+    )
+
+
+def _known_geonames_only() -> bool:
+    # ALTERNATE_NAMES_KNOWN_GEONAMES_ONLY skips names of geonames missing from the geonames table
+    return os.getenv("ALTERNATE_NAMES_KNOWN_GEONAMES_ONLY", "false").lower() in ("1", "true", "yes")
+
+
+def _restrict_to_loaded_geonames(row_filter: AlternateNameRowFilter, logger):
+    """Task preparation that hands the ids of the loaded geonames to row_filter."""
+
+    def prepare(uow) -> None:
+        geoname_ids = GeonameIdBitmap(uow.geoname_repo.iter_ids())
+        row_filter.restrict_to(geoname_ids)
+        if logger:
+            logger.info(f"Importing alternate names of {len(geoname_ids)} loaded geonames")
+
+    return prepare
 
 
 def build_geonames_import_tasks(logger):
-    """Factory that builds the import configuration with injected dependencies."""
-    return [
+    """
+    Factory that builds the import configuration with injected dependencies.
+
+    Every task lists the tasks that must succeed before it starts in "depends_on";
+    the tables are loaded independently of each other, except alternate names
+    filtered down to known geonames, which wait for the geonames table. A task's
+    optional "prepare" callable runs with its unit of work before the import.
+    """
+
+    # allCountries is read once and fanned out to geonames and admin_divisions (and optionally cities)
+    all_countries_sinks = build_all_countries_sinks()
+    cities_routed_from_all_countries = any(sink["name"] == "cities" for sink in all_countries_sinks)
+
+    # IMPORT_COMPACT_ROWS maps the large files to interned, column-ordered tuples written straight by the bulk loader
+    compact_rows = os.getenv("IMPORT_COMPACT_ROWS", "false").lower() in ("1", "true", "yes")
+    geoname_mapper_cls = GeonameRecordFileRowMapper if compact_rows else GeonameFileRowMapper
+    alternate_name_mapper_cls = AlternateNameRecordFileRowMapper if compact_rows else AlternateNameFileRowMapper
+
+    tasks = [
         {
+            "name": "countries",
             "description": "Importing Countries",
             "importer_cls": CountriesFileImporter(
                 file_downloader=FileDownloader(progress_bar_cls=TqdmProgressBar),
@@ -21,41 +162,77 @@ def build_geonames_import_tasks(logger):
                 logger=logger
             ),
             "repository_attr": "country_repo",
+            "depends_on": [],
         },
         {
-            "description": "Importing Admin Divisions",
-            "importer_cls": AdminDivisionFileImporter(
+            "name": "all_countries",
+            "description": "Importing GeoNames and Admin Divisions",
+            "importer_cls": GeonameFileImporter(
                 file_downloader=FileDownloader(progress_bar_cls=TqdmProgressBar),
-                mapper=GeonameFileRowMapper(),
+                mapper=geoname_mapper_cls(),
                 logger=logger
             ),
-            "repository_attr": "admin_division_repo",
+            "sinks": all_countries_sinks,
+            "depends_on": [],
         },
-        {
+    ]
+
+    if not cities_routed_from_all_countries:
+        tasks.append({
+            "name": "cities",
             "description": "Importing Cities",
             "importer_cls": CityFileImporter(
                 file_downloader=FileDownloader(progress_bar_cls=TqdmProgressBar),
-                mapper=GeonameFileRowMapper(),
+                mapper=geoname_mapper_cls(),
                 logger=logger
             ),
             "repository_attr": "city_repo",
-        },
-        {
-            "description": "Importing Alternate Names",
-            "importer_cls": AlternateNameFileImporter(
-                file_downloader=FileDownloader(progress_bar_cls=TqdmProgressBar),
-                mapper=AlternateNameFileRowMapper(),
-                logger=logger
-            ),
-            "repository_attr": "geoname_alternatename_repo",
-        },
-        {
-            "description": "Importing GeoNames",
-            "importer_cls": GeonameFileImporter(
-                file_downloader=FileDownloader(progress_bar_cls=TqdmProgressBar),
-                mapper=GeonameFileRowMapper(),
-                logger=logger
-            ),
-            "repository_attr": "geoname_repo",
-        },
-    ]
+            "depends_on": [],
+        })
+
+    # Filters run before mapping, so rejected names cost neither mapping nor inserts
+    alternate_name_filter = build_alternate_name_row_filter()
+
+    alternate_names_task = {
+        "name": "alternate_names",
+        "description": "Importing Alternate Names",
+        "importer_cls": AlternateNameFileImporter(
+            file_downloader=FileDownloader(progress_bar_cls=TqdmProgressBar),
+            mapper=alternate_name_mapper_cls(),
+            logger=logger,
+            row_filter=alternate_name_filter,
+        ),
+        "repository_attr": "geoname_alternatename_repo",
+        "depends_on": [],
+    }
+
+    if _known_geonames_only():
+        alternate_names_task["depends_on"] = ["all_countries"]
+        alternate_names_task["prepare"] = _restrict_to_loaded_geonames(alternate_name_filter, logger)
+
+    tasks.append(alternate_names_task)
+
+    return tasks
+
+
+def build_snapshot_import_tasks(directory: Path, logger):
+    """Import configuration that loads every table from the Parquet snapshot in directory."""
+
+    tasks = []
+
+    for table_name, repository_attr in SNAPSHOT_TABLES.items():
+        importer = ParquetSnapshotImporter(directory / f"{table_name}.parquet", logger=logger)
+
+        # Tables that were empty when exported (e.g. cities routed elsewhere) have nothing to load
+        if importer.path.exists() and importer.count_total_records() == 0:
+            continue
+
+        tasks.append({
+            "name": f"snapshot_{table_name}",
+            "description": f"Loading {table_name} from snapshot",
+            "importer_cls": importer,
+            "repository_attr": repository_attr,
+            "depends_on": [],
+        })
+
+    return tasks
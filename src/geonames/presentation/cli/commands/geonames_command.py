@@ -1,14 +1,29 @@
 import typer
+import json
 import os
 
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from dotenv import load_dotenv
-from typing import Any, Type
+from typing import Any, Optional, Type
 
 from geonames.infrastructure.persistence.database.init_schema import init_schema
 from geonames.infrastructure.persistence.unit_of_work.orm_geonames_unit_of_work import OrmGeonamesUnitOfWorkFactory
 from geonames.application.use_cases.import_geonames_use_case import ImportGeonamesUseCase
-from geonames.presentation.cli.commands.build_geonames_import_tasks import build_geonames_import_tasks
+from geonames.application.use_cases.import_geonames_fan_out_use_case import ImportGeonamesFanOutUseCase
+from geonames.application.use_cases.import_geonames_delta_use_case import ImportGeonamesDeltaUseCase
+from geonames.application.use_cases.import_sink import ImportSink
+from geonames.application.use_cases.export_snapshot_use_case import ExportSnapshotUseCase
+from geonames.application.services.adaptive_batch_sizer import AdaptiveBatchSizer
+from geonames.application.services.import_checkpointer import ImportCheckpointer
+from geonames.application.services.import_metrics import ImportMetrics, ImportRunReport
+from geonames.application.services.import_task_scheduler import ImportTaskScheduler
+from geonames.infrastructure.snapshot.parquet_snapshot_exporter import ParquetSnapshotExporter
+from geonames.presentation.cli.commands.build_geonames_import_tasks import SNAPSHOT_TABLES, build_delta_importer_factory, build_delta_sinks, build_geonames_import_tasks, build_snapshot_import_tasks
 from shared.infrastructure.adapters.application_logger import ApplicationLogger
+from shared.infrastructure.adapters.file_downloader import FileDownloader
+from shared.infrastructure.adapters.json_file_state_store import JsonFileStateStore
+from shared.infrastructure.adapters.local_file_downloader import LocalFileDownloader
 from shared.infrastructure.adapters.tqdm_progress_bar import TqdmProgressBar
 from shared.infrastructure.persistence.database.database_connection_factory import DatabaseConnectionFactory
 
@@ -19,49 +34,237 @@ geonames_import_cli = typer.Typer()
 
 
 @geonames_import_cli.command("import")
-def import_geonames():
+def import_geonames(
+    snapshot: Optional[str] = typer.Option(None, help="Load the tables from a Parquet snapshot directory instead of the GeoNames dumps."),
+    report: Optional[str] = typer.Option(None, help="JSON run report path. Defaults to IMPORT_REPORT_PATH or <TEMP_PATH>/import_report.json."),
+):
 
     logger = ApplicationLogger()
     logger.info("Import process started")
 
+    run_report = ImportRunReport("import")
+
     db_url = os.getenv("DATABASE_URL")
-    db_connector = DatabaseConnectionFactory(db_url)
+    # Sized from IMPORT_DB_POOL_* (falling back to DB_POOL_*): concurrent tasks and index rebuilds each hold a connection
+    db_connector = DatabaseConnectionFactory(db_url, role="import")
 
     init_schema(db_connector.engine)
 
     uow_factory = OrmGeonamesUnitOfWorkFactory(db_connector)
-    import_tasks = build_geonames_import_tasks(logger)
-    
+    if snapshot:
+        import_tasks = build_snapshot_import_tasks(Path(snapshot), logger)
+    else:
+        import_tasks = build_geonames_import_tasks(logger)
+
+    # Independent tasks run concurrently, each with its own session; IMPORT_TASK_CONCURRENCY caps the DB load
+    scheduler = ImportTaskScheduler(int(os.getenv("IMPORT_TASK_CONCURRENCY", "2")), logger)
+    positions = {task["name"]: index for index, task in enumerate(import_tasks)}
+
+    def run_task(task: dict) -> bool:
+        metrics = run_report.task(task["name"])
+        metrics.start()
+        succeeded = False
+
+        try:
+            with uow_factory() as uow:
+                if "prepare" in task:
+                    task["prepare"](uow)
+
+                succeeded = _run_import(
+                    _build_use_case(uow, task, logger, metrics),
+                    task["description"],
+                    logger,
+                    position=positions[task["name"]],
+                )
+        finally:
+            metrics.finish("succeeded" if succeeded else "failed")
+
+        return succeeded
+
+    results = scheduler.run(import_tasks, run_task)
+
+    # Tasks whose dependencies failed never started
+    for name in results:
+        metrics = run_report.task(name)
+        if metrics.status == "pending":
+            metrics.finish("skipped")
+
+    # API result caches are dropped when they see a new generation
+    if run_report.rows_inserted:
+        with uow_factory() as uow:
+            generation = uow.import_generation_repo.record("import")
+        logger.info(f"Recorded import generation {generation}")
+
+    report_path = Path(report or os.getenv("IMPORT_REPORT_PATH") or Path(os.getenv("TEMP_PATH", "./tmp")) / "import_report.json")
+    _write_report(run_report, report_path, db_pool=db_connector.pool_stats())
+    db_connector.dispose()
+
+    logger.info(f"Import process finished, report written to {report_path}")
+
+@geonames_import_cli.command("export-snapshot")
+def export_snapshot(
+    path: Optional[str] = typer.Option(None, help="Snapshot directory. Defaults to SNAPSHOT_PATH or <TEMP_PATH>/snapshot."),
+):
+
+    logger = ApplicationLogger()
+    logger.info("Snapshot export started")
+
+    db_url = os.getenv("DATABASE_URL")
+    # Batch-job pool (IMPORT_DB_POOL_*): the export streams one table at a time over a single connection
+    db_connector = DatabaseConnectionFactory(db_url, role="import")
+
+    init_schema(db_connector.engine)
+
+    directory = Path(path or os.getenv("SNAPSHOT_PATH") or Path(os.getenv("TEMP_PATH", "./tmp")) / "snapshot")
+
+    use_case = ExportSnapshotUseCase(
+        exporter=ParquetSnapshotExporter(db_connector.engine, directory),
+        table_names=list(SNAPSHOT_TABLES),
+        logger=logger,
+    )
+    use_case.execute()
+
+    logger.info(f"Snapshot written to {directory}")
+
+@geonames_import_cli.command("update")
+def update_geonames(
+    since: Optional[str] = typer.Option(None, help="First day to apply (YYYY-MM-DD). Defaults to the day after the last applied delta."),
+    until: Optional[str] = typer.Option(None, help="Last day to apply (YYYY-MM-DD). Defaults to yesterday (UTC)."),
+):
+
+    logger = ApplicationLogger()
+    logger.info("Delta import started")
+
+    db_url = os.getenv("DATABASE_URL")
+    # Batch-job pool (IMPORT_DB_POOL_*): deltas are applied in one unit of work, so one connection is enough
+    db_connector = DatabaseConnectionFactory(db_url, role="import")
+
+    init_schema(db_connector.engine)
+
+    # GEONAMES_DELTA_URL may point at a local directory (file://...) holding delta fixtures
+    delta_url = os.getenv("GEONAMES_DELTA_URL")
+    if delta_url and not delta_url.startswith(("http://", "https://")):
+        file_downloader = LocalFileDownloader()
+    else:
+        file_downloader = FileDownloader(progress_bar_cls=TqdmProgressBar)
+
+    uow_factory = OrmGeonamesUnitOfWorkFactory(db_connector)
+
     with uow_factory() as uow:
 
-        for task in import_tasks:
-            
-            _run_import(
-                getattr(uow, task["repository_attr"]),
-                task["importer_cls"],
-                task["description"],
-                logger,
-            )
+        use_case = ImportGeonamesDeltaUseCase(
+            # Modified rows are upserted into (or removed from) every table they are selected for; deletes reach them all
+            sinks=_build_sinks(uow, build_delta_sinks()),
+            alternate_name_repository=uow.geoname_alternatename_repo,
+            importer_factory=build_delta_importer_factory(file_downloader, uow, logger=logger, base_url=delta_url),
+            state_store=_build_state_store(),
+            logger=logger,
+        )
+
+        until_day = date.fromisoformat(until) if until else datetime.utcnow().date() - timedelta(days=1)
+        since_day = date.fromisoformat(since) if since else None
 
-    logger.info("Import process finished")
+        applied = use_case.execute(until=until_day, since=since_day)
+        if not applied:
+            logger.info("GeoNames deltas are already up to date")
+        else:
+            # API result caches are dropped when they see a new generation
+            generation = uow.import_generation_repo.record("update")
+            logger.info(f"Recorded import generation {generation}")
 
-def _run_import(repository: Any, importer: Any, description: str, logger: ApplicationLogger | None = None):
+    logger.info("Delta import finished")
 
-    use_case = ImportGeonamesUseCase(repository, importer, logger)
+def _build_state_store() -> JsonFileStateStore:
+    default_path = Path(os.getenv("TEMP_PATH", "./tmp")) / "import_state.json"
+    return JsonFileStateStore(os.getenv("IMPORT_STATE_PATH", str(default_path)))
+
+def _write_report(report: ImportRunReport, path: Path, **extra: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({**report.to_dict(), **extra}, indent=2), encoding="utf-8")
+
+def _build_sinks(uow: Any, sink_specs: list, logger: ApplicationLogger | None = None, metrics: ImportMetrics | None = None) -> list:
+    return [
+        ImportSink(
+            name=sink["name"],
+            repository=getattr(uow, sink["repository_attr"]),
+            predicate=sink["predicate"],
+            batch_sizer=_build_batch_sizer(sink["name"], logger),
+            metrics=metrics,
+        )
+        for sink in sink_specs
+    ]
+
+def _build_batch_sizer(name: str, logger: ApplicationLogger | None = None) -> AdaptiveBatchSizer | None:
+
+    # IMPORT_ADAPTIVE_BATCH_SIZE tunes each table's batch size between IMPORT_BATCH_SIZE_MIN and _MAX from insert timings
+    if os.getenv("IMPORT_ADAPTIVE_BATCH_SIZE", "false").lower() not in ("1", "true", "yes"):
+        return None
+
+    return AdaptiveBatchSizer(
+        initial_size=int(os.getenv("IMPORT_BATCH_SIZE", "5000")),
+        min_size=int(os.getenv("IMPORT_BATCH_SIZE_MIN", "500")),
+        max_size=int(os.getenv("IMPORT_BATCH_SIZE_MAX", "50000")),
+        target_seconds=float(os.getenv("IMPORT_BATCH_TARGET_SECONDS", "2")),
+        max_bytes=int(os.getenv("IMPORT_BATCH_MAX_MB", "64")) * 1024 * 1024,
+        name=name,
+        logger=logger,
+    )
+
+def _build_use_case(uow: Any, task: dict, logger: ApplicationLogger | None = None, metrics: ImportMetrics | None = None) -> Any:
+
+    # IMPORT_DEFER_INDEXES drops secondary indexes during the load and rebuilds them afterwards
+    defer_indexes = os.getenv("IMPORT_DEFER_INDEXES", "false").lower() in ("1", "true", "yes")
+    # IMPORT_SHADOW_TABLES loads into shadow tables and swaps them in atomically (PostgreSQL/MySQL)
+    shadow_load = os.getenv("IMPORT_SHADOW_TABLES", "false").lower() in ("1", "true", "yes")
+    # IMPORT_CHECKPOINTS records the offset of every committed batch so an interrupted import resumes there
+    checkpoints = os.getenv("IMPORT_CHECKPOINTS", "false").lower() in ("1", "true", "yes")
+    checkpointer = ImportCheckpointer(_build_state_store(), task["name"]) if checkpoints else None
+    # IMPORT_PIPELINE parses, maps and writes on concurrent stages linked by IMPORT_PIPELINE_QUEUE_SIZE-batch queues
+    pipelined = os.getenv("IMPORT_PIPELINE", "false").lower() in ("1", "true", "yes")
+    pipeline_queue_size = int(os.getenv("IMPORT_PIPELINE_QUEUE_SIZE", "4")) if pipelined else 0
+
+    if "sinks" in task:
+        return ImportGeonamesFanOutUseCase(
+            importer=task["importer_cls"],
+            sinks=_build_sinks(uow, task["sinks"], logger, metrics),
+            logger=logger,
+            defer_indexes=defer_indexes,
+            shadow_load=shadow_load,
+            checkpointer=checkpointer,
+            metrics=metrics,
+            pipeline_queue_size=pipeline_queue_size,
+        )
+
+    return ImportGeonamesUseCase(
+        repository=getattr(uow, task["repository_attr"]),
+        importer=task["importer_cls"],
+        logger=logger,
+        defer_indexes=defer_indexes,
+        shadow_load=shadow_load,
+        checkpointer=checkpointer,
+        pipeline_queue_size=pipeline_queue_size,
+        batch_sizer=_build_batch_sizer(task["name"], logger),
+        metrics=metrics,
+    )
+
+def _run_import(use_case: Any, description: str, logger: ApplicationLogger | None = None, position: int = 0) -> bool:
 
     try:
         total, insert_generator = use_case.execute()
         if not total:
             if logger:
                 logger.info(f"No need to import {description}")
-            return
+            return True
 
-        with TqdmProgressBar(total=total, desc=description, unit="records", colour="green") as progress:
+        # Concurrent tasks each draw their bar on their own line
+        with TqdmProgressBar(total=total, desc=description, unit="records", colour="green", position=position) as progress:
             progress.run(insert_generator)
     
     except Exception as e:
         if logger:
             logger.error(f"Error during {description}: {e}")
-        return
+        return False
+
+    return True
 
     
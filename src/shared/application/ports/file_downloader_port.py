@@ -5,4 +5,14 @@ class FileDownloaderPort(ABC):
 
     @abstractmethod
     def download(self, url: str, dest_path: str) -> None:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_modified(self, url: str) -> bool | None:
+        """Whether url changed since its last recorded download; None when that is unknown."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def cached_version(self, url: str) -> str | None:
+        """Identifier (ETag, Last-Modified or hash) of the last recorded download of url."""
+        raise NotImplementedError
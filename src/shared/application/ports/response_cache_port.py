@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ResponseCachePort(ABC):
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> bool:
+        pass
+
+    @abstractmethod
+    def get_generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def set_generation(self, generation: int) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
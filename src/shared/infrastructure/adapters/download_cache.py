@@ -0,0 +1,26 @@
+import os
+
+from pathlib import Path
+from typing import Any, Dict
+
+from shared.infrastructure.adapters.json_file_state_store import JsonFileStateStore
+
+
+class DownloadCache:
+    """Per-URL record (ETag, Last-Modified, size, sha256) of the last completed download, kept in TEMP_PATH."""
+
+    def __init__(self, path: str | Path | None = None):
+        default_path = Path(os.getenv("TEMP_PATH", "./tmp")) / "download_cache.json"
+        self.store = JsonFileStateStore(path or os.getenv("DOWNLOAD_CACHE_PATH", str(default_path)))
+
+    def get(self, url: str) -> Dict[str, Any] | None:
+        return self.store.get(url)
+
+    def set(self, url: str, etag: str | None, last_modified: str | None, size: int, sha256: str) -> None:
+        self.store.set(url, {"etag": etag, "last_modified": last_modified, "size": size, "sha256": sha256})
+
+    def version(self, url: str) -> str | None:
+        entry = self.get(url)
+        if not entry:
+            return None
+        return entry.get("etag") or entry.get("last_modified") or entry.get("sha256")
@@ -1,34 +1,262 @@
+import base64
+import hashlib
+import os
+import threading
+
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
+from typing import List, Tuple
+from requests.adapters import HTTPAdapter
+from shared.infrastructure.adapters.download_cache import DownloadCache
 from shared.infrastructure.adapters.exceptions.file_download_error import FileDownloadError
+from shared.infrastructure.adapters.json_file_state_store import JsonFileStateStore
 from shared.application.ports.progress_bar_port import ProgressBarPort
 from shared.application.ports.file_downloader_port import FileDownloaderPort
 
 
 class FileDownloader(FileDownloaderPort):
-    def __init__(self, progress_bar_cls: type[ProgressBarPort] | None = None):
+    """
+    Downloads a URL to a file. With more than one worker, servers that accept
+    byte ranges are downloaded in fixed-size parts over a pooled session; finished
+    parts are recorded in a <dest>.download.json sidecar so an interrupted
+    download resumes where it stopped. Other servers fall back to a single stream.
+
+    Completed downloads are recorded in a DownloadCache, which lets is_modified()
+    answer with a single conditional HEAD request.
+    """
+
+    STATE_SUFFIX = ".download.json"
+    PART_SUFFIX = ".part"
+
+    def __init__(self,
+                 progress_bar_cls: type[ProgressBarPort] | None = None,
+                 workers: int | None = None,
+                 part_size: int | None = None,
+                 cache: DownloadCache | None = None):
+
         self.progress_bar_cls = progress_bar_cls
 
+        use_cache = os.getenv("DOWNLOAD_CACHE", "true").lower() in ("1", "true", "yes")
+        self.cache = cache or (DownloadCache() if use_cache else None)
+
+        # Ranged mode: DOWNLOAD_WORKERS > 1 fetches DOWNLOAD_PART_SIZE_MB ranges concurrently
+        self.workers = workers or int(os.getenv("DOWNLOAD_WORKERS", "1"))
+        self.part_size = part_size or int(os.getenv("DOWNLOAD_PART_SIZE_MB", "8")) * 1024 * 1024
+        self.retries = int(os.getenv("DOWNLOAD_RETRIES", "3"))
+        self.timeout = float(os.getenv("DOWNLOAD_TIMEOUT", "60"))
+
     def download(self, url: str, dest_path: str) -> None:
         try:
-            response = requests.get(url, stream=True)
+            if self.workers > 1:
+                with self._build_session() as session:
+                    if self._download_ranged(session, url, dest_path):
+                        return
+
+            self._download_stream(url, dest_path)
+
+        except FileDownloadError:
+            raise
+        except Exception as e:
+            raise FileDownloadError(f"Failed to download {url}: {e}") from e
+
+    def is_modified(self, url: str) -> bool | None:
+
+        entry = self.cache.get(url) if self.cache else None
+        if not entry:
+            return None
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = requests.head(url, headers=headers, allow_redirects=True, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+
+        if response.status_code == 304:
+            return False
+        if not response.ok:
+            return None
+
+        # Servers that ignore conditional HEADs still report the current validators
+        if entry.get("etag") and response.headers.get("ETag"):
+            return response.headers["ETag"] != entry["etag"]
+        if entry.get("last_modified") and response.headers.get("Last-Modified"):
+            return response.headers["Last-Modified"] != entry["last_modified"] \
+                or int(response.headers.get("Content-Length", entry["size"])) != entry["size"]
+
+        return None
+
+    def cached_version(self, url: str) -> str | None:
+        return self.cache.version(url) if self.cache else None
+
+    def _record(self, url: str, headers, size: int, sha256: str) -> None:
+        if self.cache:
+            self.cache.set(url, headers.get("ETag"), headers.get("Last-Modified"), size, sha256)
+
+    def _download_stream(self, url: str, dest_path: str) -> None:
+
+        response = requests.get(url, stream=True)
+        response.raise_for_status()
+
+        total_size = int(response.headers.get("Content-Length", 0))
+        chunk_size = 8192
+        digest = hashlib.sha256()
+        size = 0
+
+        with open(dest_path, "wb") as f:
+            with self.progress_bar_cls(total=total_size, desc=f"Downloading {url}", unit="B") if self.progress_bar_cls else nullcontext() as bar:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                        if bar:
+                            bar.update(len(chunk))
+
+        self._record(url, response.headers, size, digest.hexdigest())
+
+    def _build_session(self) -> requests.Session:
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def _download_ranged(self, session: requests.Session, url: str, dest_path: str) -> bool:
+        """Download in concurrent byte ranges; False when the server does not support them."""
+
+        response = session.head(url, allow_redirects=True, timeout=self.timeout)
+        response.raise_for_status()
+
+        size = int(response.headers.get("Content-Length", 0))
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes" or size <= 0:
+            return False
+
+        # A part is only reused while the remote file keeps the same validator
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        content_md5 = response.headers.get("Content-MD5")
+
+        part_path = dest_path + self.PART_SUFFIX
+        state = JsonFileStateStore(dest_path + self.STATE_SUFFIX)
+        signature = {"url": url, "size": size, "validator": validator}
+
+        done = set()
+        if state.get("signature") == signature and os.path.exists(part_path) and os.path.getsize(part_path) == size:
+            done = set(state.get("done", []))
+        else:
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+            state.set("signature", signature)
+            state.set("done", [])
+
+        ranges = self._split(size)
+        pending = [byte_range for byte_range in ranges if byte_range[0] not in done]
+        lock = threading.Lock()
+
+        progress = self.progress_bar_cls(total=size, desc=f"Downloading {url}", unit="B") if self.progress_bar_cls else nullcontext()
+
+        with progress as bar:
+            if bar:
+                bar.update(sum(end - start + 1 for start, end in ranges if start in done))
+
+            def fetch(byte_range: Tuple[int, int]) -> None:
+                self._fetch_range_with_retries(session, url, part_path, byte_range, validator, bar, lock)
+                with lock:
+                    done.add(byte_range[0])
+                    state.set("done", sorted(done))
+
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for future in [pool.submit(fetch, byte_range) for byte_range in pending]:
+                    future.result()
+
+        try:
+            sha256 = self._verify(part_path, size, content_md5)
+        except FileDownloadError:
+            # A corrupt download cannot be resumed: start over on the next attempt
+            os.remove(part_path)
+            os.remove(state.path)
+            raise
+
+        os.replace(part_path, dest_path)
+        os.remove(state.path)
+
+        self._record(url, response.headers, size, sha256)
+
+        return True
+
+    def _split(self, size: int) -> List[Tuple[int, int]]:
+        return [(start, min(start + self.part_size, size) - 1) for start in range(0, size, self.part_size)]
+
+    def _fetch_range_with_retries(self, session, url, part_path, byte_range, validator, bar, lock) -> None:
+
+        for attempt in range(self.retries + 1):
+            written = 0
+            try:
+                for written in self._fetch_range(session, url, part_path, byte_range, validator, bar, lock):
+                    pass
+                return
+            except (requests.RequestException, OSError):
+                # Roll the progress back so the retried range is not counted twice
+                if bar and written:
+                    with lock:
+                        bar.update(-written)
+                if attempt == self.retries:
+                    raise
+
+    def _fetch_range(self, session, url, part_path, byte_range, validator, bar, lock):
+        """Write one byte range into the part file, yielding the bytes written so far."""
+
+        start, end = byte_range
+        headers = {"Range": f"bytes={start}-{end}"}
+        if validator:
+            headers["If-Range"] = validator
+
+        with session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
             response.raise_for_status()
 
-            total_size = int(response.headers.get("Content-Length", 0))
-            chunk_size = 8192
+            # 200 instead of 206 means the range was ignored, e.g. because the file changed (If-Range)
+            if response.status_code != 206:
+                raise FileDownloadError(f"Server did not honour range {start}-{end} of {url} (status {response.status_code})")
 
-            with open(dest_path, "wb") as f:
-                if self.progress_bar_cls:
-                    with self.progress_bar_cls(total=total_size, desc=f"Downloading {url}", unit="B") as bar:
-                        for chunk in response.iter_content(chunk_size=chunk_size):
-                            if chunk:
-                                f.write(chunk)
-                                bar.update(len(chunk))
-                else:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
+            written = 0
+            with open(part_path, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+                    written += len(chunk)
+                    if bar:
+                        with lock:
+                            bar.update(len(chunk))
+                    yield written
 
+        if written != end - start + 1:
+            raise requests.exceptions.ChunkedEncodingError(f"Range {start}-{end} of {url} ended after {written} bytes")
 
-        except Exception as e:
-            raise FileDownloadError(f"Failed to download {url}: {e}") from e
+    @staticmethod
+    def _verify(part_path: str, size: int, content_md5: str | None) -> str:
+        """Check the size (and Content-MD5 when sent) of a finished download; returns its sha256."""
+
+        actual_size = os.path.getsize(part_path)
+        if actual_size != size:
+            raise FileDownloadError(f"Downloaded {actual_size} bytes, expected {size}")
+
+        md5 = hashlib.md5()
+        sha256 = hashlib.sha256()
+        with open(part_path, "rb") as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b""):
+                md5.update(block)
+                sha256.update(block)
+
+        if content_md5 and base64.b64encode(md5.digest()).decode("ascii") != content_md5:
+            raise FileDownloadError(f"Checksum mismatch for {part_path}")
+
+        return sha256.hexdigest()
@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+
+from pathlib import Path
+from typing import Any, Dict
+
+from shared.application.ports.state_store_port import StateStorePort
+
+
+class JsonFileStateStore(StateStorePort):
+    """Small key/value store persisted as a JSON document; every write is atomic (write + rename)."""
+
+    # Stores opened on the same file share a lock, so concurrent import tasks do not lose each other's keys
+    _locks: Dict[Path, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(self.path.resolve(), threading.Lock())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._read().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = value
+            self._write(data)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+    def _read(self) -> Dict[str, Any]:
+
+        if not self.path.exists():
+            return {}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, Any]) -> None:
+
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True, default=str)
+
+        os.replace(tmp_path, self.path)
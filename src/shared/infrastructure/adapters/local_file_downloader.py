@@ -0,0 +1,28 @@
+import shutil
+
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from shared.infrastructure.adapters.exceptions.file_download_error import FileDownloadError
+from shared.application.ports.file_downloader_port import FileDownloaderPort
+
+
+class LocalFileDownloader(FileDownloaderPort):
+    """Resolves file:// URLs (or plain paths) by copying from the local filesystem, e.g. for fixture files."""
+
+    def download(self, url: str, dest_path: str) -> None:
+
+        parsed = urlparse(url)
+        source = Path(url2pathname(parsed.path)) if parsed.scheme == "file" else Path(url)
+
+        try:
+            shutil.copyfile(source, dest_path)
+        except Exception as e:
+            raise FileDownloadError(f"Failed to download {url}: {e}") from e
+
+    def is_modified(self, url: str) -> bool | None:
+        return None
+
+    def cached_version(self, url: str) -> str | None:
+        return None
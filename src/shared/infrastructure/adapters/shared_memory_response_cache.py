@@ -0,0 +1,312 @@
+import hashlib
+import mmap
+import os
+import struct
+import time
+import zlib
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from shared.application.ports.response_cache_port import ResponseCachePort
+
+try:
+    import fcntl
+except ImportError:  # Windows: no shared cache
+    fcntl = None
+
+
+# magic, layout version, generation, total size, ways, class count
+_HEADER = struct.Struct("<4sIQQII")
+_HEADER_SIZE = 4096
+_CLASS = struct.Struct("<II")
+# seq, key digest, generation, expires_at, payload length, payload crc32
+_SLOT = struct.Struct("<Q16sQdII")
+_SEQ = struct.Struct("<Q")
+_GENERATION_OFFSET = 8
+
+_MAGIC = b"GNRC"
+_VERSION = 1
+
+
+class _Region(NamedTuple):
+    offset: int
+    slot_size: int
+    sets: int
+
+
+class SharedMemoryResponseCache(ResponseCachePort):
+    """
+    Response cache shared by every process on a host through a memory-mapped
+    file (on /dev/shm it never touches disk).
+
+    The file is split into size classes of fixed-size slots; a payload goes to
+    the smallest class it fits. Each class is a set-associative table: a key
+    hashes to one set of `ways` slots, so a full set evicts its entry closest to
+    expiry and the file never grows.
+
+    Reads take no lock. Every slot starts with a sequence number a writer makes
+    odd while it rewrites the slot and even again when done; a reader that sees
+    an odd or changed sequence (or a bad CRC) treats the slot as a miss. Writers
+    lock only the byte range of the set they write, so workers writing other
+    sets never wait on each other.
+
+    Entries are valid for the generation they were stored under: set_generation()
+    invalidates everything at once for every process.
+
+    The file name carries the layout (version, size, ways and slot sizes), so
+    workers started with other settings map a file of their own instead of
+    resizing one that is mapped elsewhere; the first process to create a layout's
+    file removes those left by other layouts.
+    """
+
+    def __init__(self,
+                 path: Path,
+                 size_bytes: int = 64 * 1024 * 1024,
+                 slot_sizes: Tuple[int, ...] = (8 * 1024, 64 * 1024, 512 * 1024),
+                 ways: int = 8):
+
+        if fcntl is None:
+            raise RuntimeError("SharedMemoryResponseCache needs fcntl (POSIX)")
+
+        self.size_bytes = size_bytes
+        self.ways = ways
+        self.regions = self._layout(size_bytes, sorted(slot_sizes), ways)
+        self._base_path = Path(path)
+        self.path = self._layout_path(self._base_path)
+        self.max_payload = self.regions[-1].slot_size - _SLOT.size
+
+        # Per-process counters: every worker reports its own
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._initialize()
+        self._mm = mmap.mmap(self._fd, self.size_bytes, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+
+    def get(self, key: str) -> Optional[bytes]:
+
+        digest = self._digest(key)
+        generation = self.get_generation()
+        now = time.time()
+
+        for region in self.regions:
+            for offset in self._set_slots(region, digest):
+                seq, slot_key, slot_generation, expires_at, length, crc = _SLOT.unpack_from(self._mm, offset)
+
+                if slot_key != digest or seq & 1 or slot_generation != generation or expires_at <= now:
+                    continue
+
+                start = offset + _SLOT.size
+                payload = self._mm[start:start + length]
+
+                # A writer got in between: the copy may be torn
+                if _SEQ.unpack_from(self._mm, offset)[0] != seq or zlib.crc32(payload) != crc:
+                    continue
+
+                self.hits += 1
+                return payload
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> bool:
+
+        if len(payload) > self.max_payload:
+            return False
+
+        region = next(region for region in self.regions if len(payload) <= region.slot_size - _SLOT.size)
+        digest = self._digest(key)
+        slots = self._set_slots(region, digest)
+
+        # A previous payload of another size class would otherwise still be found there first
+        for other in self.regions:
+            if other is not region:
+                self._evict(other, digest)
+
+        with self._locked(slots[0], region.slot_size * self.ways):
+            offset = self._victim(slots, digest, self.get_generation(), time.time())
+            # Odd while written; a writer that died mid-write already left it odd
+            seq = _SEQ.unpack_from(self._mm, offset)[0] | 1
+
+            _SEQ.pack_into(self._mm, offset, seq)
+            start = offset + _SLOT.size
+            self._mm[start:start + len(payload)] = payload
+            _SLOT.pack_into(self._mm, offset, seq, digest, self.get_generation(), time.time() + ttl_seconds,
+                            len(payload), zlib.crc32(payload))
+            _SEQ.pack_into(self._mm, offset, seq + 1)
+
+        self.stores += 1
+        return True
+
+    def get_generation(self) -> int:
+        return _SEQ.unpack_from(self._mm, _GENERATION_OFFSET)[0]
+
+    def set_generation(self, generation: int) -> None:
+        with self._locked(0, _HEADER_SIZE):
+            if self.get_generation() != generation:
+                _SEQ.pack_into(self._mm, _GENERATION_OFFSET, generation)
+
+    def stats(self) -> Dict[str, Any]:
+
+        generation = self.get_generation()
+        now = time.time()
+        entries = 0
+        payload_bytes = 0
+
+        for region in self.regions:
+            for index in range(region.sets * self.ways):
+                seq, _, slot_generation, expires_at, length, _ = _SLOT.unpack_from(self._mm, region.offset + index * region.slot_size)
+                if seq and not seq & 1 and slot_generation == generation and expires_at > now:
+                    entries += 1
+                    payload_bytes += length
+
+        lookups = self.hits + self.misses
+
+        return {
+            "path": str(self.path),
+            "size_bytes": self.size_bytes,
+            "slot_sizes": [region.slot_size for region in self.regions],
+            "slots": sum(region.sets * self.ways for region in self.regions),
+            "generation": generation,
+            "entries": entries,
+            "payload_bytes": payload_bytes,
+            "worker_hits": self.hits,
+            "worker_misses": self.misses,
+            "worker_hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "worker_stores": self.stores,
+        }
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+    def _evict(self, region: _Region, digest: bytes) -> None:
+        """Empty the slot holding digest in region, if any."""
+
+        slots = self._set_slots(region, digest)
+        if all(_SLOT.unpack_from(self._mm, offset)[1] != digest for offset in slots):
+            return
+
+        with self._locked(slots[0], region.slot_size * self.ways):
+            for offset in slots:
+                seq, slot_key = _SLOT.unpack_from(self._mm, offset)[:2]
+                if slot_key == digest:
+                    # Readers holding the old sequence see it change and miss
+                    _SEQ.pack_into(self._mm, offset, seq | 1)
+                    _SLOT.pack_into(self._mm, offset, seq | 1, bytes(16), 0, 0.0, 0, 0)
+                    _SEQ.pack_into(self._mm, offset, (seq | 1) + 1)
+
+    def _victim(self, slots: List[int], digest: bytes, generation: int, now: float) -> int:
+        """The slot to overwrite: the key's own, else a free one, else the one closest to expiry."""
+
+        headers = [(offset, _SLOT.unpack_from(self._mm, offset)) for offset in slots]
+
+        for offset, (_, slot_key, _, _, _, _) in headers:
+            if slot_key == digest:
+                return offset
+
+        victim = None
+        victim_expires_at = None
+
+        for offset, (seq, _, slot_generation, expires_at, _, _) in headers:
+            if not seq or slot_generation != generation or expires_at <= now:
+                return offset
+            if victim is None or expires_at < victim_expires_at:
+                victim, victim_expires_at = offset, expires_at
+
+        return victim
+
+    def _set_slots(self, region: _Region, digest: bytes) -> List[int]:
+        first = region.offset + (int.from_bytes(digest[:8], "little") % region.sets) * self.ways * region.slot_size
+        return [first + way * region.slot_size for way in range(self.ways)]
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+    @contextmanager
+    def _locked(self, offset: int, length: int) -> Iterator[None]:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, length, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, length, offset)
+
+    def _initialize(self) -> None:
+        """Size the file and write its header; the first process does it, the others check the layout."""
+
+        with self._locked(0, _HEADER_SIZE):
+            created = os.fstat(self._fd).st_size == 0
+            # Only a new, empty file is resized: no other process can have it mapped yet
+            if created:
+                os.ftruncate(self._fd, self.size_bytes)
+
+            layout = self._read_layout()
+            if layout == self._expected_layout():
+                return
+
+            # Never written: new, or its creator died before writing the header (the slots are still zero)
+            if os.fstat(self._fd).st_size != self.size_bytes or layout[0] != b"\0" * len(_MAGIC):
+                raise RuntimeError(f"{self.path} does not hold a response cache laid out as configured")
+
+            os.pwrite(self._fd, self._header(0), 0)
+
+        if created:
+            self._remove_other_layouts()
+
+    def _layout_path(self, path: Path) -> Path:
+        slot_sizes = "-".join(str(region.slot_size) for region in self.regions)
+        return path.with_name(f"{path.name}-v{_VERSION}-{self.size_bytes}-{self.ways}-{slot_sizes}")
+
+    def _remove_other_layouts(self) -> None:
+        """Unlink the files of other layouts; processes still mapping one keep their mapping."""
+
+        for other in self.path.parent.glob(f"{self._base_path.name}-v*"):
+            if other != self.path:
+                try:
+                    other.unlink()
+                except OSError:
+                    pass
+
+    def _read_layout(self) -> Tuple:
+        header = os.pread(self._fd, _HEADER_SIZE, 0)
+        magic, version, _, size_bytes, ways, count = _HEADER.unpack_from(header)
+        classes = tuple(_CLASS.unpack_from(header, _HEADER.size + index * _CLASS.size) for index in range(min(count, 64)))
+        return magic, version, size_bytes, ways, classes
+
+    def _expected_layout(self) -> Tuple:
+        return _MAGIC, _VERSION, self.size_bytes, self.ways, tuple((region.slot_size, region.sets) for region in self.regions)
+
+    def _header(self, generation: int) -> bytes:
+        header = _HEADER.pack(_MAGIC, _VERSION, generation, self.size_bytes, self.ways, len(self.regions))
+        header += b"".join(_CLASS.pack(region.slot_size, region.sets) for region in self.regions)
+        return header.ljust(_HEADER_SIZE, b"\0")
+
+    @staticmethod
+    def _layout(size_bytes: int, slot_sizes: List[int], ways: int) -> List[_Region]:
+        """
+        Each size class gets an equal share of the file, in whole sets. The largest
+        classes are dropped while their share cannot hold one set, so a small file
+        caches only the smaller payloads.
+        """
+
+        slot_sizes = list(slot_sizes)
+        while slot_sizes and (size_bytes - _HEADER_SIZE) // len(slot_sizes) < slot_sizes[-1] * ways:
+            slot_sizes.pop()
+
+        if not slot_sizes:
+            raise ValueError(f"{size_bytes} bytes cannot hold a set of {ways} slots of any configured size")
+
+        share = (size_bytes - _HEADER_SIZE) // len(slot_sizes)
+        regions = []
+        offset = _HEADER_SIZE
+
+        for slot_size in slot_sizes:
+            sets = share // (slot_size * ways)
+            regions.append(_Region(offset, slot_size, sets))
+            offset += sets * ways * slot_size
+
+        return regions
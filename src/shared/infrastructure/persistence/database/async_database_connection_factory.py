@@ -0,0 +1,46 @@
+from typing import Any, Dict
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from shared.infrastructure.persistence.database.base_async_sql_connector import BaseAsyncSqlConnector
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
+
+from .async_mysql_connector import AsyncMySQLConnector
+from .async_postgresql_connector import AsyncPostgreSQLConnector
+
+
+class AsyncDatabaseConnectionFactory:
+    """
+    Creates an asyncio database connector (MySQL or PostgreSQL) from the same
+    DB URL as DatabaseConnectionFactory; the async driver is picked for it.
+    The pool is sized for role as in DatabaseConnectionFactory.
+    """
+
+    def __init__(self, db_url: str, echo: bool = False, role: str | None = None):
+        self._db_url = db_url
+        self._echo = echo
+        self._role = role
+        self._connector: BaseAsyncSqlConnector = self._create_connector()
+
+    def _create_connector(self) -> BaseAsyncSqlConnector:
+        url = self._db_url.lower()
+
+        if url.startswith("mysql"):
+            return AsyncMySQLConnector(self._db_url, echo=self._echo, pool_settings=PoolSettings.from_env(self._role, AsyncMySQLConnector.DEFAULT_POOL_SETTINGS))
+
+        if url.startswith("postgresql"):
+            return AsyncPostgreSQLConnector(self._db_url, echo=self._echo, pool_settings=PoolSettings.from_env(self._role, AsyncPostgreSQLConnector.DEFAULT_POOL_SETTINGS))
+
+        raise ValueError(f"Unsupported database URL: {self._db_url}")
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._connector.engine
+
+    def get_session(self) -> AsyncSession:
+        return self._connector.get_session()
+
+    async def dispose(self) -> None:
+        await self._connector.dispose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self._connector.pool_stats()
@@ -0,0 +1,8 @@
+from shared.infrastructure.persistence.database.base_async_sql_connector import BaseAsyncSqlConnector
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
+
+
+class AsyncMySQLConnector(BaseAsyncSqlConnector):
+
+    ASYNC_DRIVER = "aiomysql"
+    DEFAULT_POOL_SETTINGS = PoolSettings(pool_size=5, max_overflow=10, pool_recycle=3600)
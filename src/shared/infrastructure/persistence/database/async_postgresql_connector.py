@@ -0,0 +1,8 @@
+from shared.infrastructure.persistence.database.base_async_sql_connector import BaseAsyncSqlConnector
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
+
+
+class AsyncPostgreSQLConnector(BaseAsyncSqlConnector):
+
+    ASYNC_DRIVER = "asyncpg"
+    DEFAULT_POOL_SETTINGS = PoolSettings(pool_size=10, max_overflow=20, pool_recycle=1800)
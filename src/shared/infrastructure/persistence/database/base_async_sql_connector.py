@@ -0,0 +1,52 @@
+from abc import ABC
+from typing import Any, Dict
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from shared.infrastructure.persistence.database.instrumented_pool import InstrumentedAsyncAdaptedQueuePool, pool_stats
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
+
+
+class BaseAsyncSqlConnector(ABC):
+    """
+    Asyncio counterpart of BaseSqlConnector, used by the API read path.
+    Subclasses only name their async driver and default pool settings.
+    """
+
+    # Async driver used for the dialect of the configured URL
+    ASYNC_DRIVER: str = ""
+    DEFAULT_POOL_SETTINGS: PoolSettings = PoolSettings()
+
+    def __init__(self, db_url: str, echo: bool = False, pool_settings: PoolSettings | None = None):
+        self._engine: AsyncEngine = create_async_engine(
+            self.async_url(db_url),
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_pre_ping=True,
+            echo=echo,
+            **(pool_settings or self.DEFAULT_POOL_SETTINGS).engine_options(),
+        )
+        # Read-only sessions: rows stay usable after the session is gone
+        self._session_factory = async_sessionmaker(
+            bind=self._engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
+    def get_session(self) -> AsyncSession:
+        return self._session_factory()
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return pool_stats(self.engine.pool)
+
+    @classmethod
+    def async_url(cls, db_url: str) -> str:
+        """The same database URL with its driver swapped for the async one (postgresql+psycopg2 -> postgresql+asyncpg)."""
+        url = make_url(db_url)
+        return url.set(drivername=f"{url.get_backend_name()}+{cls.ASYNC_DRIVER}").render_as_string(hide_password=False)
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+from shared.infrastructure.persistence.database.instrumented_pool import pool_stats
+
 
 class BaseSqlConnector(ABC):
 
@@ -17,3 +21,10 @@ class BaseSqlConnector(ABC):
     @abstractmethod
     def dispose(self) -> None:
         ...
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return pool_stats(self.engine.pool)
+
+    def get_bulk_loader(self) -> BaseBulkLoader | None:
+        """Native bulk loader for this backend, or None to use the ORM insert path."""
+        return None
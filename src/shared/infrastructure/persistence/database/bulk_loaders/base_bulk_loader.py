@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+
+class BaseBulkLoader(ABC):
+    """
+    Native bulk load path for the command repositories.
+
+    Loaders read column values straight from the entities (entity attributes
+    are named after the table columns), so no ORM model is ever built.
+    """
+
+    TEXT_NULL = "\\N"
+    TEXT_TRUE = "1"
+    TEXT_FALSE = "0"
+
+    _TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    @abstractmethod
+    def load(self, session: Session, table: Table, entities: Iterable[Any]) -> None:
+        """Load entities into table within the session's current transaction."""
+        ...
+
+    @staticmethod
+    def to_rows(table: Table, entities: Iterable[Any]) -> Iterator[Tuple[Any, ...]]:
+        columns = tuple(column.name for column in table.columns)
+        getter = attrgetter(*columns)
+
+        # Named tuples laid out exactly like the table (import records) are rows already
+        passthrough: Dict[type, bool] = {}
+
+        for entity in entities:
+            entity_type = type(entity)
+            is_row = passthrough.get(entity_type)
+            if is_row is None:
+                is_row = passthrough[entity_type] = getattr(entity_type, "_fields", None) == columns
+
+            yield entity if is_row else getter(entity)
+
+    def encode_text_row(self, row: Tuple[Any, ...]) -> str:
+        """Encode a row as a tab-separated line with backslash escapes and \\N for NULL."""
+        return "\t".join([self._encode_text_value(value) for value in row]) + "\n"
+
+    def _encode_text_value(self, value: Any) -> str:
+
+        if value is None:
+            return self.TEXT_NULL
+
+        if isinstance(value, str):
+            return value.translate(self._TEXT_ESCAPES)
+
+        if isinstance(value, bool):
+            return self.TEXT_TRUE if value else self.TEXT_FALSE
+
+        if isinstance(value, datetime):
+            return value.isoformat(sep=" ")
+
+        if isinstance(value, date):
+            return value.isoformat()
+
+        if isinstance(value, float):
+            return repr(value)
+
+        return str(value)
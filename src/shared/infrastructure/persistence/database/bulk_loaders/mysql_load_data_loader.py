@@ -0,0 +1,58 @@
+import os
+import tempfile
+
+from typing import Any, Iterable
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+
+
+class MySQLLoadDataLoader(BaseBulkLoader):
+    """
+    Writes each batch to a temporary TSV chunk and loads it with LOAD DATA LOCAL INFILE.
+
+    Requires local_infile to be enabled on both the client connection and the server.
+    Unique and foreign-key checks are relaxed for the duration of each load.
+    """
+
+    BULK_SESSION_SETTINGS = "SET SESSION unique_checks = 0, foreign_key_checks = 0"
+    DEFAULT_SESSION_SETTINGS = "SET SESSION unique_checks = 1, foreign_key_checks = 1"
+
+    def __init__(self, temp_dir: str | None = None):
+        self.temp_dir = temp_dir
+
+        if self.temp_dir:
+            os.makedirs(self.temp_dir, exist_ok=True)
+
+    def load(self, session: Session, table: Table, entities: Iterable[Any]) -> None:
+
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="", suffix=".tsv",
+                                         prefix=f"{table.name}_", dir=self.temp_dir, delete=False) as chunk:
+            for row in self.to_rows(table, entities):
+                chunk.write(self.encode_text_row(row))
+            chunk_path = chunk.name
+
+        connection = session.connection()
+
+        try:
+            connection.exec_driver_sql(self.BULK_SESSION_SETTINGS)
+            connection.exec_driver_sql(self._build_load_statement(table, chunk_path))
+        finally:
+            connection.exec_driver_sql(self.DEFAULT_SESSION_SETTINGS)
+            os.remove(chunk_path)
+
+    @staticmethod
+    def _build_load_statement(table: Table, chunk_path: str) -> str:
+
+        path_literal = chunk_path.replace("\\", "\\\\").replace("'", "\\'")
+        columns = ", ".join(f"`{column.name}`" for column in table.columns)
+
+        return (
+            f"LOAD DATA LOCAL INFILE '{path_literal}' INTO TABLE `{table.name}` "
+            f"CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            f"LINES TERMINATED BY '\\n' "
+            f"({columns})"
+        )
@@ -0,0 +1,162 @@
+import io
+import struct
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List
+
+from sqlalchemy import Table, BigInteger, Boolean, Date, DateTime, Float, Integer, Numeric, String
+from sqlalchemy.orm import Session
+
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+
+PG_EPOCH_DATE = date(2000, 1, 1)
+PG_EPOCH_DATETIME = datetime(2000, 1, 1)
+
+BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+BINARY_TRAILER = struct.pack("!h", -1)
+BINARY_NULL = struct.pack("!i", -1)
+
+
+def _encode_numeric(value: Any) -> bytes:
+    """Encode a number in PostgreSQL's binary NUMERIC layout (base-10000 digits)."""
+
+    number = value if isinstance(value, Decimal) else Decimal(str(value))
+    sign, digits, exponent = number.as_tuple()
+
+    digit_str = "".join(map(str, digits))
+    if exponent > 0:
+        digit_str += "0" * exponent
+        exponent = 0
+
+    dscale = -exponent
+    digit_str = digit_str.zfill(dscale + 1)
+
+    int_part = digit_str[:len(digit_str) - dscale].lstrip("0")
+    frac_part = digit_str[len(digit_str) - dscale:]
+
+    int_part = int_part.zfill((len(int_part) + 3) // 4 * 4) if int_part else ""
+    frac_part = frac_part + "0" * (-len(frac_part) % 4)
+
+    groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+    groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+    weight = len(int_part) // 4 - 1
+
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+
+    header = struct.pack("!hhHh", len(groups), weight, 0x4000 if sign else 0x0000, dscale)
+    return header + struct.pack(f"!{len(groups)}h", *groups)
+
+
+def _encode_date(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    return struct.pack("!i", (value - PG_EPOCH_DATE).days)
+
+
+def _encode_timestamp(value: Any) -> bytes:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    delta = value.replace(tzinfo=None) - PG_EPOCH_DATETIME
+    return struct.pack("!q", (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+
+def _encode_text(value: Any) -> bytes:
+    return str(value).encode("utf-8")
+
+
+class PostgreSQLCopyLoader(BaseBulkLoader):
+    """Streams entity batches into COPY ... FROM STDIN (text or binary format)."""
+
+    TEXT_TRUE = "t"
+    TEXT_FALSE = "f"
+
+    FORMATS = ("text", "binary")
+
+    def __init__(self, copy_format: str = "text"):
+
+        copy_format = copy_format.lower()
+        if copy_format not in self.FORMATS:
+            raise ValueError(f"Unsupported COPY format: {copy_format}. Expected one of {self.FORMATS}")
+
+        self.copy_format = copy_format
+        self._binary_encoders: Dict[str, List[Callable[[Any], bytes]]] = {}
+
+    def load(self, session: Session, table: Table, entities: Iterable[Any]) -> None:
+
+        rows = self.to_rows(table, entities)
+
+        if self.copy_format == "binary":
+            buffer = self._build_binary_buffer(table, rows)
+        else:
+            buffer = io.StringIO("".join([self.encode_text_row(row) for row in rows]))
+
+        columns = ", ".join(f'"{column.name}"' for column in table.columns)
+        sql = f'COPY "{table.name}" ({columns}) FROM STDIN WITH (FORMAT {self.copy_format})'
+
+        # Run on the session's connection so the COPY is part of its transaction
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(sql, buffer)
+        finally:
+            cursor.close()
+
+    def _build_binary_buffer(self, table: Table, rows: Iterable[tuple]) -> io.BytesIO:
+
+        encoders = self._get_binary_encoders(table)
+        field_count = struct.pack("!h", len(encoders))
+
+        buffer = io.BytesIO()
+        buffer.write(BINARY_HEADER)
+
+        for row in rows:
+            buffer.write(field_count)
+            for encode, value in zip(encoders, row):
+                if value is None:
+                    buffer.write(BINARY_NULL)
+                    continue
+                data = encode(value)
+                buffer.write(struct.pack("!i", len(data)))
+                buffer.write(data)
+
+        buffer.write(BINARY_TRAILER)
+        buffer.seek(0)
+        return buffer
+
+    def _get_binary_encoders(self, table: Table) -> List[Callable[[Any], bytes]]:
+
+        if table.name not in self._binary_encoders:
+            self._binary_encoders[table.name] = [self._binary_encoder_for(column.type) for column in table.columns]
+
+        return self._binary_encoders[table.name]
+
+    @staticmethod
+    def _binary_encoder_for(column_type: Any) -> Callable[[Any], bytes]:
+
+        # Order matters: BigInteger subclasses Integer and Float subclasses Numeric
+        if isinstance(column_type, Boolean):
+            return lambda value: struct.pack("!?", bool(value))
+        if isinstance(column_type, BigInteger):
+            return lambda value: struct.pack("!q", int(value))
+        if isinstance(column_type, Integer):
+            return lambda value: struct.pack("!i", int(value))
+        if isinstance(column_type, Float):
+            return lambda value: struct.pack("!d", float(value))
+        if isinstance(column_type, Numeric):
+            return _encode_numeric
+        if isinstance(column_type, DateTime):
+            return _encode_timestamp
+        if isinstance(column_type, Date):
+            return _encode_date
+        if isinstance(column_type, String):
+            return _encode_text
+
+        raise ValueError(f"Unsupported column type for binary COPY: {column_type!r}")
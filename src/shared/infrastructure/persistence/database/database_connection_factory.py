@@ -1,4 +1,11 @@
+import os
+
+from typing import Any, Dict
+
 from shared.infrastructure.persistence.database.base_sql_connector import BaseSqlConnector
+from shared.infrastructure.persistence.database.bulk_loaders.base_bulk_loader import BaseBulkLoader
+
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
 
 from .mysql_connector import MySQLConnector
 from .postgresql_connector import PostgreSQLConnector
@@ -10,21 +17,25 @@ class DatabaseConnectionFactory:
     or environment configuration.
 
     The application layer should never know about connectors—only sessions.
+
+    role names the process using the connection (e.g. "api", "import"); its
+    pool is sized from <ROLE>_DB_POOL_* / DB_POOL_* (see PoolSettings).
     """
 
-    def __init__(self, db_url: str, echo: bool = False):
+    def __init__(self, db_url: str, echo: bool = False, role: str | None = None):
         self._db_url = db_url
         self._echo = echo
+        self._role = role
         self._connector: BaseSqlConnector = self._create_connector()
 
     def _create_connector(self):
         url = self._db_url.lower()
 
         if url.startswith("mysql"):
-            return MySQLConnector(self._db_url, echo=self._echo)
+            return MySQLConnector(self._db_url, echo=self._echo, pool_settings=PoolSettings.from_env(self._role, MySQLConnector.DEFAULT_POOL_SETTINGS))
 
         if url.startswith("postgresql"):
-            return PostgreSQLConnector(self._db_url, echo=self._echo)
+            return PostgreSQLConnector(self._db_url, echo=self._echo, pool_settings=PoolSettings.from_env(self._role, PostgreSQLConnector.DEFAULT_POOL_SETTINGS))
 
         raise ValueError(f"Unsupported database URL: {self._db_url}")
 
@@ -37,3 +48,12 @@ class DatabaseConnectionFactory:
 
     def dispose(self):
         self._connector.dispose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        return self._connector.pool_stats()
+
+    def get_bulk_loader(self) -> BaseBulkLoader | None:
+        # IMPORT_BULK_LOADER=orm forces the ORM insert path on every backend
+        if os.getenv("IMPORT_BULK_LOADER", "native").lower() == "orm":
+            return None
+        return self._connector.get_bulk_loader()
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class _CheckoutTimingMixin:
+    """
+    Times every connection checkout: the wait for a free connection, plus the
+    connect when the pool has to open a new one. Counters live on the pool, so
+    they restart when the engine is disposed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._checkout_stats_lock = threading.Lock()
+        self._checkout_stats = {"checkouts": 0, "timeouts": 0, "wait_seconds_total": 0.0, "wait_seconds_max": 0.0}
+
+    def _do_get(self) -> Any:
+
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self._record_checkout(time.perf_counter() - started, timed_out=True)
+            raise
+
+        self._record_checkout(time.perf_counter() - started)
+        return connection
+
+    def _record_checkout(self, seconds: float, timed_out: bool = False) -> None:
+
+        with self._checkout_stats_lock:
+            stats = self._checkout_stats
+            stats["checkouts"] += 1
+            stats["timeouts"] += timed_out
+            stats["wait_seconds_total"] += seconds
+            stats["wait_seconds_max"] = max(stats["wait_seconds_max"], seconds)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Occupancy and checkout wait statistics of pool, for sizing pools against the DB connection limit."""
+
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+
+    # Only queue pools have a size and an overflow
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        })
+
+    lock = getattr(pool, "_checkout_stats_lock", None)
+    if lock is not None:
+        with lock:
+            checkouts = dict(pool._checkout_stats)
+
+        stats.update({
+            "checkouts": checkouts["checkouts"],
+            "timeouts": checkouts["timeouts"],
+            "wait_ms_mean": round(checkouts["wait_seconds_total"] / checkouts["checkouts"] * 1000, 3) if checkouts["checkouts"] else 0.0,
+            "wait_ms_max": round(checkouts["wait_seconds_max"] * 1000, 3),
+        })
+
+    return stats
@@ -1,18 +1,32 @@
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
 
 from shared.infrastructure.persistence.database.base_sql_connector import BaseSqlConnector
+from shared.infrastructure.persistence.database.bulk_loaders.mysql_load_data_loader import MySQLLoadDataLoader
+from shared.infrastructure.persistence.database.instrumented_pool import InstrumentedQueuePool
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
 
 
 class MySQLConnector(BaseSqlConnector):
-    def __init__(self, db_url: str, echo: bool = False):
+
+    DEFAULT_POOL_SETTINGS = PoolSettings(pool_size=5, max_overflow=10, pool_recycle=3600)
+
+    def __init__(self, db_url: str, echo: bool = False, pool_settings: PoolSettings | None = None):
+
+        # MYSQL_LOAD_DATA enables the LOAD DATA LOCAL INFILE import path (server needs local_infile=ON)
+        self._load_data = os.getenv("MYSQL_LOAD_DATA", "false").lower() in ("1", "true", "yes")
+
         self._engine: Engine = create_engine(
             db_url,
+            poolclass=InstrumentedQueuePool,
             pool_pre_ping=True,
-            pool_recycle=3600,
             future=True,
             echo=echo,
+            connect_args={"local_infile": True} if self._load_data else {},
+            **(pool_settings or self.DEFAULT_POOL_SETTINGS).engine_options(),
         )
         self._session_factory = scoped_session(
             sessionmaker(
@@ -31,3 +45,8 @@ class MySQLConnector(BaseSqlConnector):
 
     def dispose(self) -> None:
         self._engine.dispose()
+
+    def get_bulk_loader(self) -> MySQLLoadDataLoader | None:
+        if not self._load_data:
+            return None
+        return MySQLLoadDataLoader(temp_dir=os.getenv("TEMP_PATH", "./tmp"))
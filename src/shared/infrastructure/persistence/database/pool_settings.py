@@ -0,0 +1,47 @@
+import os
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """
+    Connection pool sizing of one engine. API workers and the importer have very
+    different needs (many short reads vs. a few long bulk writes), so each
+    process role reads its own settings: <ROLE>_DB_POOL_SIZE overrides
+    DB_POOL_SIZE, which overrides the connector's default (and likewise for
+    MAX_OVERFLOW, POOL_TIMEOUT and POOL_RECYCLE).
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 3600
+
+    @classmethod
+    def from_env(cls, role: str | None = None, defaults: "PoolSettings | None" = None) -> "PoolSettings":
+
+        settings = defaults or cls()
+
+        def read(name: str, cast, default):
+            value = os.getenv(f"{role.upper()}_DB_{name}") if role else None
+            if value is None:
+                value = os.getenv(f"DB_{name}")
+            return cast(value) if value is not None else default
+
+        return replace(
+            settings,
+            pool_size=read("POOL_SIZE", int, settings.pool_size),
+            max_overflow=read("MAX_OVERFLOW", int, settings.max_overflow),
+            pool_timeout=read("POOL_TIMEOUT", float, settings.pool_timeout),
+            pool_recycle=read("POOL_RECYCLE", int, settings.pool_recycle),
+        )
+
+    def engine_options(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+        }
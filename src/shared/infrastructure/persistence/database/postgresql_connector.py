@@ -1,20 +1,27 @@
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
 
 from shared.infrastructure.persistence.database.base_sql_connector import BaseSqlConnector
+from shared.infrastructure.persistence.database.bulk_loaders.postgresql_copy_loader import PostgreSQLCopyLoader
+from shared.infrastructure.persistence.database.instrumented_pool import InstrumentedQueuePool
+from shared.infrastructure.persistence.database.pool_settings import PoolSettings
 
 
 class PostgreSQLConnector(BaseSqlConnector):
-    def __init__(self, db_url: str, echo: bool = False):
+
+    DEFAULT_POOL_SETTINGS = PoolSettings(pool_size=10, max_overflow=20, pool_recycle=1800)
+
+    def __init__(self, db_url: str, echo: bool = False, pool_settings: PoolSettings | None = None):
         self._engine: Engine = create_engine(
             db_url,
+            poolclass=InstrumentedQueuePool,
             pool_pre_ping=True,      # checks connection health
-            pool_size=10,            # optional: defaults recommended for Postgres
-            max_overflow=20,         # optional
-            pool_recycle=1800,       # avoid stale connections
             future=True,
             echo=echo,
+            **(pool_settings or self.DEFAULT_POOL_SETTINGS).engine_options(),
         )
         self._session_factory = scoped_session(
             sessionmaker(
@@ -33,3 +40,6 @@ class PostgreSQLConnector(BaseSqlConnector):
 
     def dispose(self) -> None:
         self._engine.dispose()
+
+    def get_bulk_loader(self) -> PostgreSQLCopyLoader:
+        return PostgreSQLCopyLoader(copy_format=os.getenv("POSTGRES_COPY_FORMAT", "text"))
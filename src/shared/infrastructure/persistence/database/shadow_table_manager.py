@@ -0,0 +1,122 @@
+from sqlalchemy import Index, MetaData, Table, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+
+class ShadowTableManager:
+    """
+    Blue/green reloads: a table's rows are loaded into a "<table>__shadow" copy
+    (created without secondary indexes), which is then renamed into place in a
+    single transaction, so readers see either the old or the new dataset.
+
+    Supported on PostgreSQL (transactional DDL) and MySQL/MariaDB (RENAME TABLE
+    swaps several tables atomically).
+    """
+
+    SHADOW_SUFFIX = "__shadow"
+    OLD_SUFFIX = "__old"
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.dialect = session.get_bind().dialect
+
+        if self.dialect.name not in ("postgresql", "mysql", "mariadb"):
+            raise ValueError(f"Shadow-table imports are not supported on {self.dialect.name}")
+
+    def shadow_of(self, table: Table) -> Table:
+        """Shadow copy of table; index names get the suffix where they must be unique per schema."""
+
+        shadow = table.to_metadata(MetaData(), name=table.name + self.SHADOW_SUFFIX)
+
+        # Rebuild the indexes from the originals so naming conventions are not re-applied to the shadow name
+        rename = self.dialect.name == "postgresql"
+        for index in list(shadow.indexes):
+            shadow.indexes.discard(index)
+
+        for index in table.indexes:
+            Index(
+                index.name + self.SHADOW_SUFFIX if rename else index.name,
+                *[shadow.c[column.name] for column in index.columns],
+                unique=index.unique,
+            )
+
+        return shadow
+
+    def create(self, table: Table) -> Table:
+        """(Re)create an empty shadow table, dropping any leftover from an interrupted run."""
+
+        shadow = self.shadow_of(table)
+        preparer = self.dialect.identifier_preparer
+
+        self.session.execute(text(f"DROP TABLE IF EXISTS {preparer.format_table(shadow)}"))
+        # CREATE TABLE only: secondary indexes are built once the shadow is loaded
+        self.session.execute(CreateTable(shadow))
+        self.session.commit()
+
+        return shadow
+
+    def swap(self, table: Table) -> None:
+        """Atomically replace table with its loaded shadow and drop the previous data."""
+
+        shadow = self.shadow_of(table)
+        exists = inspect(self.session.connection()).has_table(table.name)
+
+        if self.dialect.name == "postgresql":
+            self._swap_postgresql(table, shadow, exists)
+        else:
+            self._swap_mysql(table, shadow, exists)
+
+    def _swap_postgresql(self, table: Table, shadow: Table, exists: bool) -> None:
+
+        quote = self.dialect.identifier_preparer.quote
+        statements = []
+
+        if exists:
+            statements.append(f"DROP TABLE {quote(table.name)}")
+
+        statements.append(f"ALTER TABLE {quote(shadow.name)} RENAME TO {quote(table.name)}")
+
+        for index in shadow.indexes:
+            original_name = index.name[:-len(self.SHADOW_SUFFIX)]
+            statements.append(f"ALTER INDEX {quote(index.name)} RENAME TO {quote(original_name)}")
+
+        # Unnamed constraints got PostgreSQL's default "<table>_..." names (e.g. "<table>_pkey",
+        # "<table>_<column>_key") from the shadow name; they are unique per schema, so the next
+        # shadow load would collide with them unless they are renamed back
+        for name in self._postgresql_constraint_names(shadow):
+            if name.startswith(shadow.name + "_"):
+                statements.append(
+                    f"ALTER TABLE {quote(table.name)} RENAME CONSTRAINT "
+                    f"{quote(name)} TO {quote(table.name + name[len(shadow.name):])}"
+                )
+
+        # DDL is transactional: concurrent readers block briefly, then resolve the name to the new table
+        for statement in statements:
+            self.session.execute(text(statement))
+        self.session.commit()
+
+    def _postgresql_constraint_names(self, table: Table) -> list:
+        rows = self.session.execute(
+            text("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:table)"),
+            {"table": self.dialect.identifier_preparer.quote(table.name)},
+        )
+        return [row[0] for row in rows]
+
+    def _swap_mysql(self, table: Table, shadow: Table, exists: bool) -> None:
+
+        quote = self.dialect.identifier_preparer.quote
+
+        if not exists:
+            self.session.execute(text(f"RENAME TABLE {quote(shadow.name)} TO {quote(table.name)}"))
+            self.session.commit()
+            return
+
+        old_name = table.name + self.OLD_SUFFIX
+
+        self.session.execute(text(f"DROP TABLE IF EXISTS {quote(old_name)}"))
+        self.session.execute(text(
+            f"RENAME TABLE {quote(table.name)} TO {quote(old_name)}, "
+            f"{quote(shadow.name)} TO {quote(table.name)}"
+        ))
+        self.session.execute(text(f"DROP TABLE {quote(old_name)}"))
+        self.session.commit()
@@ -0,0 +1,35 @@
+from typing import Iterable
+
+from sqlalchemy import Table
+from sqlalchemy.sql.dml import Insert
+
+
+class SqlUpsertBuilder:
+    """Builds a dialect-native INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE statement for a table."""
+
+    @staticmethod
+    def build(dialect_name: str, table: Table, preserve_columns: Iterable[str] = ()) -> Insert | None:
+        """Return an upsert statement, or None when the dialect has no native upsert."""
+
+        keys = {column.name for column in table.primary_key.columns}
+        skip = keys | set(preserve_columns)
+        updated = [column.name for column in table.columns if column.name not in skip]
+
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+
+            statement = insert(table)
+            return statement.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={name: statement.excluded[name] for name in updated},
+            )
+
+        if dialect_name in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(table)
+            return statement.on_duplicate_key_update(
+                {name: statement.inserted[name] for name in updated}
+            )
+
+        return None